@@ -165,6 +165,7 @@ struct layer_data {
     VkLayerDispatchTable dispatch_table;
 
     DeviceExtensions extensions = {};
+    DispatchExtensionEnables device_extension_enables;
     unordered_set<VkQueue> queues;  // All queues under given device
     // Layer specific data
     unordered_map<VkSampler, unique_ptr<SAMPLER_STATE>> samplerMap;
@@ -1087,7 +1088,7 @@ static bool ValidatePipelineDrawtimeState(layer_data const *dev_data, LAST_BOUND
                 subpass_num_samples |= (unsigned)render_pass_info->pAttachments[attachment].samples;
             }
 
-            if (!dev_data->extensions.vk_amd_mixed_attachment_samples &&
+            if (!dev_data->extensions.vk_amd_mixed_attachment_samples() &&
                 ((subpass_num_samples & static_cast<unsigned>(pso_num_samples)) != subpass_num_samples)) {
                 skip |= log_msg(dev_data->report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT,
                                 HandleToUint64(pPipeline->pipeline), kVUID_Core_DrawState_NumSamplesMismatch,
@@ -1457,7 +1458,7 @@ static bool ValidatePipelineUnlocked(layer_data *dev_data, std::vector<std::uniq
             }
         }
     }
-    if (dev_data->extensions.vk_nv_mesh_shader) {
+    if (dev_data->extensions.vk_nv_mesh_shader()) {
         // VS or mesh is required
         if (!(pPipeline->active_shaders & (VK_SHADER_STAGE_VERTEX_BIT | VK_SHADER_STAGE_MESH_BIT_NV))) {
             skip |= log_msg(dev_data->report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT,
@@ -1641,7 +1642,7 @@ static bool ValidatePipelineUnlocked(layer_data *dev_data, std::vector<std::uniq
         }
     }
 
-    if (dev_data->extensions.vk_amd_mixed_attachment_samples) {
+    if (dev_data->extensions.vk_amd_mixed_attachment_samples()) {
         VkSampleCountFlagBits max_sample_count = static_cast<VkSampleCountFlagBits>(0);
         for (uint32_t i = 0; i < subpass_desc->colorAttachmentCount; ++i) {
             if (subpass_desc->pColorAttachments[i].attachment != VK_ATTACHMENT_UNUSED) {
@@ -2236,7 +2237,7 @@ static bool ValidatePhysicalDeviceQueueFamily(instance_layer_data *instance_data
                                               const char *queue_family_var_name) {
     bool skip = false;
 
-    const char *conditional_ext_cmd = instance_data->extensions.vk_khr_get_physical_device_properties_2
+    const char *conditional_ext_cmd = instance_data->extensions.vk_khr_get_physical_device_properties_2()
                                           ? "or vkGetPhysicalDeviceQueueFamilyProperties2[KHR]"
                                           : "";
 
@@ -2274,7 +2275,7 @@ static bool ValidateDeviceQueueCreateInfos(instance_layer_data *instance_data, c
             const auto requested_queue_count = infos[i].queueCount;
             const auto queue_family_props_count = pd_state->queue_family_properties.size();
             const bool queue_family_has_props = requested_queue_family < queue_family_props_count;
-            const char *conditional_ext_cmd = instance_data->extensions.vk_khr_get_physical_device_properties_2
+            const char *conditional_ext_cmd = instance_data->extensions.vk_khr_get_physical_device_properties_2()
                                                   ? "or vkGetPhysicalDeviceQueueFamilyProperties2[KHR]"
                                                   : "";
             std::string count_note =
@@ -2354,6 +2355,7 @@ static void PostCallRecordCreateDevice(instance_layer_data *instance_data, const
     uint32_t effective_api_version = std::min(device_data->phys_dev_properties.properties.apiVersion, instance_data->api_version);
     device_data->api_version =
         device_data->extensions.InitFromDeviceCreateInfo(&instance_data->extensions, effective_api_version, pCreateInfo);
+    device_data->device_extension_enables = GetDispatchExtensionEnables(pCreateInfo);
 
     uint32_t count;
     instance_data->dispatch_table.GetPhysicalDeviceQueueFamilyProperties(gpu, &count, nullptr);
@@ -2399,35 +2401,35 @@ static void PostCallRecordCreateDevice(instance_layer_data *instance_data, const
     instance_data->dispatch_table.GetPhysicalDeviceMemoryProperties(gpu, &device_data->phys_dev_mem_props);
     instance_data->dispatch_table.GetPhysicalDeviceProperties(gpu, &device_data->phys_dev_props);
 
-    if (device_data->extensions.vk_khr_push_descriptor) {
+    if (device_data->extensions.vk_khr_push_descriptor()) {
         // Get the needed push_descriptor limits
         auto push_descriptor_prop = lvl_init_struct<VkPhysicalDevicePushDescriptorPropertiesKHR>();
         auto prop2 = lvl_init_struct<VkPhysicalDeviceProperties2KHR>(&push_descriptor_prop);
         instance_data->dispatch_table.GetPhysicalDeviceProperties2KHR(gpu, &prop2);
         device_data->phys_dev_ext_props.max_push_descriptors = push_descriptor_prop.maxPushDescriptors;
     }
-    if (device_data->extensions.vk_ext_descriptor_indexing) {
+    if (device_data->extensions.vk_ext_descriptor_indexing()) {
         // Get the needed descriptor_indexing limits
         auto descriptor_indexing_props = lvl_init_struct<VkPhysicalDeviceDescriptorIndexingPropertiesEXT>();
         auto prop2 = lvl_init_struct<VkPhysicalDeviceProperties2KHR>(&descriptor_indexing_props);
         instance_data->dispatch_table.GetPhysicalDeviceProperties2KHR(gpu, &prop2);
         device_data->phys_dev_ext_props.descriptor_indexing_props = descriptor_indexing_props;
     }
-    if (device_data->extensions.vk_nv_shading_rate_image) {
+    if (device_data->extensions.vk_nv_shading_rate_image()) {
         // Get the needed shading rate image limits
         auto shading_rate_image_props = lvl_init_struct<VkPhysicalDeviceShadingRateImagePropertiesNV>();
         auto prop2 = lvl_init_struct<VkPhysicalDeviceProperties2KHR>(&shading_rate_image_props);
         instance_data->dispatch_table.GetPhysicalDeviceProperties2KHR(gpu, &prop2);
         device_data->phys_dev_ext_props.shading_rate_image_props = shading_rate_image_props;
     }
-    if (device_data->extensions.vk_nv_mesh_shader) {
+    if (device_data->extensions.vk_nv_mesh_shader()) {
         // Get the needed mesh shader limits
         auto mesh_shader_props = lvl_init_struct<VkPhysicalDeviceMeshShaderPropertiesNV>();
         auto prop2 = lvl_init_struct<VkPhysicalDeviceProperties2KHR>(&mesh_shader_props);
         instance_data->dispatch_table.GetPhysicalDeviceProperties2KHR(gpu, &prop2);
         device_data->phys_dev_ext_props.mesh_shader_props = mesh_shader_props;
     }
-    if (device_data->extensions.vk_ext_inline_uniform_block) {
+    if (device_data->extensions.vk_ext_inline_uniform_block()) {
         // Get the needed inline uniform block limits
         auto inline_uniform_block_props = lvl_init_struct<VkPhysicalDeviceInlineUniformBlockPropertiesEXT>();
         auto prop2 = lvl_init_struct<VkPhysicalDeviceProperties2KHR>(&inline_uniform_block_props);
@@ -5235,10 +5237,9 @@ VKAPI_ATTR VkResult VKAPI_CALL CreateSampler(VkDevice device, const VkSamplerCre
 static bool PreCallValidateCreateDescriptorSetLayout(layer_data *dev_data, const VkDescriptorSetLayoutCreateInfo *create_info) {
     if (dev_data->instance_data->disabled.create_descriptor_set_layout) return false;
     return cvdescriptorset::DescriptorSetLayout::ValidateCreateInfo(
-        dev_data->report_data, create_info, dev_data->extensions.vk_khr_push_descriptor,
-        dev_data->phys_dev_ext_props.max_push_descriptors, dev_data->extensions.vk_ext_descriptor_indexing,
-        &dev_data->enabled_features.descriptor_indexing,
-        &dev_data->enabled_features.inline_uniform_block,
+        dev_data->report_data, create_info, dev_data->extensions.vk_khr_push_descriptor(),
+        dev_data->phys_dev_ext_props.max_push_descriptors, dev_data->extensions.vk_ext_descriptor_indexing(),
+        &dev_data->enabled_features.descriptor_indexing, &dev_data->enabled_features.inline_uniform_block,
         &dev_data->phys_dev_ext_props.inline_uniform_block_props);
 }
 
@@ -5700,7 +5701,7 @@ static bool PreCallValiateCreatePipelineLayout(const layer_data *dev_data, const
                         dev_data->phys_dev_ext_props.inline_uniform_block_props.maxDescriptorSetInlineUniformBlocks);
     }
 
-    if (dev_data->extensions.vk_ext_descriptor_indexing) {
+    if (dev_data->extensions.vk_ext_descriptor_indexing()) {
         // XXX TODO: replace with correct VU messages
 
         // Max descriptors by type, within a single pipeline stage
@@ -8470,7 +8471,7 @@ class ValidatorState {
           object_type_(object_type),
           val_codes_(val_codes),
           limit_(static_cast<uint32_t>(device_data->phys_dev_properties.queue_family_properties.size())),
-          mem_ext_(device_data->extensions.vk_khr_external_memory) {}
+          mem_ext_(device_data->extensions.vk_khr_external_memory()) {}
 
     // Create a validator state from an image state... reducing the image specific to the generic version.
     ValidatorState(const layer_data *device_data, const char *func_name, const GLOBAL_CB_NODE *cb_state,
@@ -10039,7 +10040,7 @@ static bool ValidateRenderpassAttachmentUsage(const layer_data *dev_data, const
                                     i, attachment_ref.attachment);
                 }
 
-                if (dev_data->extensions.vk_amd_mixed_attachment_samples && subpass.pDepthStencilAttachment &&
+                if (dev_data->extensions.vk_amd_mixed_attachment_samples() && subpass.pDepthStencilAttachment &&
                     subpass.pDepthStencilAttachment->attachment != VK_ATTACHMENT_UNUSED) {
                     const auto depth_stencil_sample_count =
                         pCreateInfo->pAttachments[subpass.pDepthStencilAttachment->attachment].samples;
@@ -10088,7 +10089,7 @@ static bool ValidateRenderpassAttachmentUsage(const layer_data *dev_data, const
             }
         }
 
-        if (!dev_data->extensions.vk_amd_mixed_attachment_samples && sample_count && !IsPowerOfTwo(sample_count)) {
+        if (!dev_data->extensions.vk_amd_mixed_attachment_samples() && sample_count && !IsPowerOfTwo(sample_count)) {
             skip |=
                 log_msg(dev_data->report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT, 0,
                         "VUID-VkAttachmentDescription-samples-parameter",
@@ -11601,7 +11602,7 @@ static bool PreCallValidateCreateSwapchainKHR(layer_data *dev_data, const char *
     // All physical devices and queue families are required to be able
     // to present to any native window on Android; require the
     // application to have established support on any other platform.
-    if (!dev_data->instance_data->extensions.vk_khr_android_surface) {
+    if (!dev_data->instance_data->extensions.vk_khr_android_surface()) {
         auto support_predicate = [dev_data](decltype(surface_state->gpu_queue_support)::value_type qs) -> bool {
             // TODO: should restrict search only to queue families of VkDeviceQueueCreateInfos, not whole phys. device
             return (qs.first.gpu == dev_data->physical_device) && qs.second;
@@ -11821,7 +11822,7 @@ static bool PreCallValidateCreateSwapchainKHR(layer_data *dev_data, const char *
     // Validate state for shared presentable case
     if (VK_PRESENT_MODE_SHARED_DEMAND_REFRESH_KHR == pCreateInfo->presentMode ||
         VK_PRESENT_MODE_SHARED_CONTINUOUS_REFRESH_KHR == pCreateInfo->presentMode) {
-        if (!dev_data->extensions.vk_khr_shared_presentable_image) {
+        if (!dev_data->extensions.vk_khr_shared_presentable_image()) {
             if (log_msg(dev_data->report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_DEVICE_EXT,
                         HandleToUint64(dev_data->device), kVUID_Core_DrawState_ExtensionNotEnabled,
                         "%s called with presentMode %s which requires the VK_KHR_shared_presentable_image extension, which has not "
@@ -12054,8 +12055,9 @@ static bool PreCallValidateQueuePresentKHR(layer_data *dev_data, VkQueue queue,
                 vector<VkImageLayout> layouts;
                 if (FindLayouts(dev_data, image, layouts)) {
                     for (auto layout : layouts) {
-                        if ((layout != VK_IMAGE_LAYOUT_PRESENT_SRC_KHR) && (!dev_data->extensions.vk_khr_shared_presentable_image ||
-                                                                            (layout != VK_IMAGE_LAYOUT_SHARED_PRESENT_KHR))) {
+                        if ((layout != VK_IMAGE_LAYOUT_PRESENT_SRC_KHR) &&
+                            (!dev_data->extensions.vk_khr_shared_presentable_image() ||
+                             (layout != VK_IMAGE_LAYOUT_SHARED_PRESENT_KHR))) {
                             skip |=
                                 log_msg(dev_data->report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT,
                                         HandleToUint64(queue), "VUID-VkPresentInfoKHR-pImageIndices-01296",
@@ -12069,7 +12071,7 @@ static bool PreCallValidateQueuePresentKHR(layer_data *dev_data, VkQueue queue,
 
             // All physical devices and queue families are required to be able to present to any native window on Android; require
             // the application to have established support on any other platform.
-            if (!dev_data->instance_data->extensions.vk_khr_android_surface) {
+            if (!dev_data->instance_data->extensions.vk_khr_android_surface()) {
                 auto surface_state = GetSurfaceState(dev_data->instance_data, swapchain_data->createInfo.surface);
                 auto support_it = surface_state->gpu_queue_support.find({dev_data->physical_device, queue_state->queueFamilyIndex});
 
@@ -14473,7 +14475,7 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, cons
     assert(device);
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
 
-    if (!ApiParentExtensionEnabled(funcName, device_data->extensions.device_extension_set)) {
+    if (!ApiParentExtensionEnabled(funcName, device_data->device_extension_enables)) {
         return nullptr;
     }
     // Is API to be intercepted by this layer?
@@ -2325,7 +2325,7 @@ bool cvdescriptorset::ValidateAllocateDescriptorSets(const core_validation::laye
             }
         }
     }
-    if (!GetDeviceExtensions(dev_data)->vk_khr_maintenance1) {
+    if (!GetDeviceExtensions(dev_data)->vk_khr_maintenance1()) {
         // Track number of descriptorSets allowable in this pool
         if (pool_state->availableSets < p_alloc_info->descriptorSetCount) {
             skip |= log_msg(report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_POOL_EXT,
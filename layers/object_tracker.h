@@ -27,6 +27,8 @@
 #include <string.h>
 #include <unordered_map>
 #include <unordered_set>
+#include <utility>
+#include <vector>
 
 #include "vk_loader_platform.h"
 #include "vulkan/vulkan.h"
@@ -89,7 +91,135 @@ struct ObjTrackQueueInfo {
     VkQueue queue;
 };
 
-typedef std::unordered_map<uint64_t, ObjTrackState *> object_map_type;
+// Open-addressing hash map from object handle to inline ObjTrackState, used for the per-type object maps.
+// Lookups probe a single flat array with no per-node allocation.  Erased slots are marked deleted rather than
+// compacted, so erasing an element leaves all other iterators valid, as with std::unordered_map.
+// Unlike std::unordered_map, inserting an element (operator[] on a new handle) may rehash and move every slot,
+// invalidating ALL iterators, pointers and references into the map.  Finish with any ObjTrackState pointer taken
+// from a map before inserting into that same map again.
+class ObjTrackStateMap {
+   public:
+    typedef std::pair<uint64_t, ObjTrackState> value_type;
+
+    class iterator {
+       public:
+        iterator(ObjTrackStateMap *map, size_t index) : map_(map), index_(index) { SkipUnused(); }
+        value_type &operator*() const { return map_->slots_[index_]; }
+        value_type *operator->() const { return &map_->slots_[index_]; }
+        iterator &operator++() {
+            ++index_;
+            SkipUnused();
+            return *this;
+        }
+        iterator operator++(int) {
+            iterator previous = *this;
+            ++*this;
+            return previous;
+        }
+        bool operator==(const iterator &other) const { return index_ == other.index_; }
+        bool operator!=(const iterator &other) const { return index_ != other.index_; }
+
+       private:
+        friend class ObjTrackStateMap;
+        void SkipUnused() {
+            while (index_ < map_->states_.size() && map_->states_[index_] != kSlotFull) ++index_;
+        }
+        ObjTrackStateMap *map_;
+        size_t index_;
+    };
+
+    ObjTrackStateMap() : size_(0), used_(0) {}
+
+    iterator begin() { return iterator(this, 0); }
+    iterator end() { return iterator(this, states_.size()); }
+    bool empty() const { return size_ == 0; }
+    size_t size() const { return size_; }
+    size_t count(uint64_t handle) const { return FindSlot(handle) < states_.size() ? 1 : 0; }
+    iterator find(uint64_t handle) { return iterator(this, FindSlot(handle)); }
+
+    ObjTrackState &operator[](uint64_t handle) {
+        size_t slot = FindSlot(handle);
+        if (slot == states_.size()) slot = Insert(handle);
+        return slots_[slot].second;
+    }
+
+    iterator erase(iterator pos) {
+        states_[pos.index_] = kSlotDeleted;
+        --size_;
+        return ++pos;
+    }
+
+    void clear() {
+        slots_.clear();
+        states_.clear();
+        size_ = 0;
+        used_ = 0;
+    }
+
+   private:
+    enum SlotState : uint8_t { kSlotEmpty, kSlotFull, kSlotDeleted };
+
+    // Handles are often pointers or small counters, so mix all bits into the low bits used for the slot index
+    static size_t HashHandle(uint64_t handle) {
+        handle ^= handle >> 33;
+        handle *= 0xff51afd7ed558ccdULL;
+        handle ^= handle >> 33;
+        return static_cast<size_t>(handle);
+    }
+
+    // Returns the slot holding handle, or states_.size() if it is not present
+    size_t FindSlot(uint64_t handle) const {
+        const size_t capacity = states_.size();
+        if (capacity == 0) return capacity;
+        const size_t mask = capacity - 1;
+        for (size_t index = HashHandle(handle) & mask;; index = (index + 1) & mask) {
+            if (states_[index] == kSlotEmpty) return capacity;
+            if (states_[index] == kSlotFull && slots_[index].first == handle) return index;
+        }
+    }
+
+    // Adds a default-initialized entry for a handle known not to be present, returning its slot
+    size_t Insert(uint64_t handle) {
+        // Keep at least 1/8 of the slots empty so probe sequences stay short and always terminate
+        if ((used_ + 1) * 8 > states_.size() * 7) Rehash();
+        const size_t mask = states_.size() - 1;
+        size_t index = HashHandle(handle) & mask;
+        while (states_[index] == kSlotFull) index = (index + 1) & mask;
+        if (states_[index] == kSlotEmpty) used_++;
+        states_[index] = kSlotFull;
+        slots_[index] = value_type(handle, ObjTrackState());
+        size_++;
+        return index;
+    }
+
+    // Grows the table so the live entries fill at most half of it, discarding deleted slots
+    void Rehash() {
+        size_t capacity = 16;
+        while (capacity < (size_ + 1) * 2) capacity *= 2;
+        std::vector<value_type> old_slots;
+        std::vector<uint8_t> old_states;
+        old_slots.swap(slots_);
+        old_states.swap(states_);
+        slots_.resize(capacity);
+        states_.assign(capacity, kSlotEmpty);
+        const size_t mask = capacity - 1;
+        for (size_t i = 0; i < old_states.size(); ++i) {
+            if (old_states[i] != kSlotFull) continue;
+            size_t index = HashHandle(old_slots[i].first) & mask;
+            while (states_[index] == kSlotFull) index = (index + 1) & mask;
+            states_[index] = kSlotFull;
+            slots_[index] = old_slots[i];
+        }
+        used_ = size_;
+    }
+
+    std::vector<value_type> slots_;
+    std::vector<uint8_t> states_;
+    size_t size_;  // Number of live entries
+    size_t used_;  // Number of live or deleted slots, which both lengthen probe sequences
+};
+
+typedef ObjTrackStateMap object_map_type;
 
 struct layer_data {
     VkInstance instance;
@@ -97,7 +227,7 @@ struct layer_data {
 
     uint64_t num_objects[kVulkanObjectTypeMax + 1];
     uint64_t num_total_objects;
-    std::unordered_set<std::string> device_extension_set;
+    DispatchExtensionEnables device_extension_enables;
 
     debug_report_data *report_data;
     std::vector<VkDebugReportCallbackEXT> logging_callback;
@@ -113,10 +243,10 @@ struct layer_data {
 
     std::vector<VkQueueFamilyProperties> queue_family_properties;
 
-    // Vector of unordered_maps per object type to hold ObjTrackState info
+    // Vector of handle maps per object type to hold ObjTrackState info
     std::vector<object_map_type> object_map;
     // Special-case map for swapchain images
-    std::unordered_map<uint64_t, ObjTrackState *> swapchainImageMap;
+    object_map_type swapchainImageMap;
     // Map of queue information structures, one per queue
     std::unordered_map<VkQueue, ObjTrackQueueInfo *> queue_info_map;
 
@@ -222,12 +352,11 @@ void CreateObject(T1 dispatchable_object, T2 object, VulkanObjectType object_typ
                 kVUID_ObjectTracker_Info, "OBJ[0x%" PRIxLEAST64 "] : CREATE %s object 0x%" PRIxLEAST64, object_track_index++,
                 object_string[object_type], object_handle);
 
-        ObjTrackState *pNewObjNode = new ObjTrackState;
+        ObjTrackState *pNewObjNode = &instance_data->object_map[object_type][object_handle];
         pNewObjNode->object_type = object_type;
         pNewObjNode->status = custom_allocator ? OBJSTATUS_CUSTOM_ALLOCATOR : OBJSTATUS_NONE;
         pNewObjNode->handle = object_handle;
 
-        instance_data->object_map[object_type][object_handle] = pNewObjNode;
         instance_data->num_objects[object_type]++;
         instance_data->num_total_objects++;
     }
@@ -243,7 +372,7 @@ void DestroyObjectSilently(T1 dispatchable_object, T2 object, VulkanObjectType o
     auto item = device_data->object_map[object_type].find(object_handle);
     assert(item != device_data->object_map[object_type].end());
 
-    ObjTrackState *pNode = item->second;
+    ObjTrackState *pNode = &item->second;
     assert(device_data->num_total_objects > 0);
 
     device_data->num_total_objects--;
@@ -251,7 +380,6 @@ void DestroyObjectSilently(T1 dispatchable_object, T2 object, VulkanObjectType o
 
     device_data->num_objects[pNode->object_type]--;
 
-    delete pNode;
     device_data->object_map[object_type].erase(item);
 }
 
@@ -267,7 +395,7 @@ void DestroyObject(T1 dispatchable_object, T2 object, VulkanObjectType object_ty
     if (object_handle != VK_NULL_HANDLE) {
         auto item = device_data->object_map[object_type].find(object_handle);
         if (item != device_data->object_map[object_type].end()) {
-            ObjTrackState *pNode = item->second;
+            ObjTrackState *pNode = &item->second;
 
             log_msg(device_data->report_data, VK_DEBUG_REPORT_INFORMATION_BIT_EXT, debug_object_type, object_handle,
                     kVUID_ObjectTracker_Info,
@@ -67,16 +67,15 @@ void DestroyQueueDataStructures(VkDevice device) {
     // Destroy the items in the queue map
     auto queue = device_data->object_map[kVulkanObjectTypeQueue].begin();
     while (queue != device_data->object_map[kVulkanObjectTypeQueue].end()) {
-        uint32_t obj_index = queue->second->object_type;
+        uint32_t obj_index = queue->second.object_type;
         assert(device_data->num_total_objects > 0);
         device_data->num_total_objects--;
         assert(device_data->num_objects[obj_index] > 0);
         device_data->num_objects[obj_index]--;
         log_msg(device_data->report_data, VK_DEBUG_REPORT_INFORMATION_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT,
-                queue->second->handle, kVUID_ObjectTracker_Info,
+                queue->second.handle, kVUID_ObjectTracker_Info,
                 "OBJ_STAT Destroy Queue obj 0x%" PRIxLEAST64 " (%" PRIu64 " total objs remain & %" PRIu64 " Queue objs).",
-                queue->second->handle, device_data->num_total_objects, device_data->num_objects[obj_index]);
-        delete queue->second;
+                queue->second.handle, device_data->num_total_objects, device_data->num_objects[obj_index]);
         queue = device_data->object_map[kVulkanObjectTypeQueue].erase(queue);
     }
 }
@@ -108,7 +107,7 @@ bool ValidateDeviceObject(uint64_t device_handle, const std::string &invalid_han
         for (auto object : layer_data.second->object_map[kVulkanObjectTypeDevice]) {
             // Grab last instance to use for possible error message
             last_instance = layer_data.second->instance;
-            if (object.second->handle == device_handle) return false;
+            if (object.second.handle == device_handle) return false;
         }
     }
 
@@ -125,7 +124,7 @@ void AllocateCommandBuffer(VkDevice device, const VkCommandPool command_pool, co
             HandleToUint64(command_buffer), kVUID_ObjectTracker_Info, "OBJ[0x%" PRIxLEAST64 "] : CREATE %s object 0x%" PRIxLEAST64,
             object_track_index++, "VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT", HandleToUint64(command_buffer));
 
-    ObjTrackState *pNewObjNode = new ObjTrackState;
+    ObjTrackState *pNewObjNode = &device_data->object_map[kVulkanObjectTypeCommandBuffer][HandleToUint64(command_buffer)];
     pNewObjNode->object_type = kVulkanObjectTypeCommandBuffer;
     pNewObjNode->handle = HandleToUint64(command_buffer);
     pNewObjNode->parent_object = HandleToUint64(command_pool);
@@ -134,7 +133,6 @@ void AllocateCommandBuffer(VkDevice device, const VkCommandPool command_pool, co
     } else {
         pNewObjNode->status = OBJSTATUS_NONE;
     }
-    device_data->object_map[kVulkanObjectTypeCommandBuffer][HandleToUint64(command_buffer)] = pNewObjNode;
     device_data->num_objects[kVulkanObjectTypeCommandBuffer]++;
     device_data->num_total_objects++;
 }
@@ -143,9 +141,9 @@ bool ValidateCommandBuffer(VkDevice device, VkCommandPool command_pool, VkComman
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
     bool skip = false;
     uint64_t object_handle = HandleToUint64(command_buffer);
-    if (device_data->object_map[kVulkanObjectTypeCommandBuffer].find(object_handle) !=
-        device_data->object_map[kVulkanObjectTypeCommandBuffer].end()) {
-        ObjTrackState *pNode = device_data->object_map[kVulkanObjectTypeCommandBuffer][HandleToUint64(command_buffer)];
+    auto cbItem = device_data->object_map[kVulkanObjectTypeCommandBuffer].find(object_handle);
+    if (cbItem != device_data->object_map[kVulkanObjectTypeCommandBuffer].end()) {
+        ObjTrackState *pNode = &cbItem->second;
 
         if (pNode->parent_object != HandleToUint64(command_pool)) {
             skip |= log_msg(device_data->report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_COMMAND_BUFFER_EXT,
@@ -169,12 +167,11 @@ void AllocateDescriptorSet(VkDevice device, VkDescriptorPool descriptor_pool, Vk
             HandleToUint64(descriptor_set), kVUID_ObjectTracker_Info, "OBJ[0x%" PRIxLEAST64 "] : CREATE %s object 0x%" PRIxLEAST64,
             object_track_index++, "VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT", HandleToUint64(descriptor_set));
 
-    ObjTrackState *pNewObjNode = new ObjTrackState;
+    ObjTrackState *pNewObjNode = &device_data->object_map[kVulkanObjectTypeDescriptorSet][HandleToUint64(descriptor_set)];
     pNewObjNode->object_type = kVulkanObjectTypeDescriptorSet;
     pNewObjNode->status = OBJSTATUS_NONE;
     pNewObjNode->handle = HandleToUint64(descriptor_set);
     pNewObjNode->parent_object = HandleToUint64(descriptor_pool);
-    device_data->object_map[kVulkanObjectTypeDescriptorSet][HandleToUint64(descriptor_set)] = pNewObjNode;
     device_data->num_objects[kVulkanObjectTypeDescriptorSet]++;
     device_data->num_total_objects++;
 }
@@ -185,7 +182,7 @@ bool ValidateDescriptorSet(VkDevice device, VkDescriptorPool descriptor_pool, Vk
     uint64_t object_handle = HandleToUint64(descriptor_set);
     auto dsItem = device_data->object_map[kVulkanObjectTypeDescriptorSet].find(object_handle);
     if (dsItem != device_data->object_map[kVulkanObjectTypeDescriptorSet].end()) {
-        ObjTrackState *pNode = dsItem->second;
+        ObjTrackState *pNode = &dsItem->second;
 
         if (pNode->parent_object != HandleToUint64(descriptor_pool)) {
             skip |= log_msg(device_data->report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_DESCRIPTOR_SET_EXT,
@@ -273,16 +270,11 @@ void CreateQueue(VkDevice device, VkQueue vkObj) {
             HandleToUint64(vkObj), kVUID_ObjectTracker_Info, "OBJ[0x%" PRIxLEAST64 "] : CREATE %s object 0x%" PRIxLEAST64,
             object_track_index++, "VK_DEBUG_REPORT_OBJECT_TYPE_QUEUE_EXT", HandleToUint64(vkObj));
 
-    ObjTrackState *p_obj_node = NULL;
-    auto queue_item = device_data->object_map[kVulkanObjectTypeQueue].find(HandleToUint64(vkObj));
-    if (queue_item == device_data->object_map[kVulkanObjectTypeQueue].end()) {
-        p_obj_node = new ObjTrackState;
-        device_data->object_map[kVulkanObjectTypeQueue][HandleToUint64(vkObj)] = p_obj_node;
+    if (!device_data->object_map[kVulkanObjectTypeQueue].count(HandleToUint64(vkObj))) {
         device_data->num_objects[kVulkanObjectTypeQueue]++;
         device_data->num_total_objects++;
-    } else {
-        p_obj_node = queue_item->second;
     }
+    ObjTrackState *p_obj_node = &device_data->object_map[kVulkanObjectTypeQueue][HandleToUint64(vkObj)];
     p_obj_node->object_type = kVulkanObjectTypeQueue;
     p_obj_node->status = OBJSTATUS_NONE;
     p_obj_node->handle = HandleToUint64(vkObj);
@@ -294,18 +286,17 @@ void CreateSwapchainImageObject(VkDevice dispatchable_object, VkImage swapchain_
             HandleToUint64(swapchain_image), kVUID_ObjectTracker_Info, "OBJ[0x%" PRIxLEAST64 "] : CREATE %s object 0x%" PRIxLEAST64,
             object_track_index++, "SwapchainImage", HandleToUint64(swapchain_image));
 
-    ObjTrackState *pNewObjNode = new ObjTrackState;
+    ObjTrackState *pNewObjNode = &device_data->swapchainImageMap[HandleToUint64(swapchain_image)];
     pNewObjNode->object_type = kVulkanObjectTypeImage;
     pNewObjNode->status = OBJSTATUS_NONE;
     pNewObjNode->handle = HandleToUint64(swapchain_image);
     pNewObjNode->parent_object = HandleToUint64(swapchain);
-    device_data->swapchainImageMap[HandleToUint64(swapchain_image)] = pNewObjNode;
 }
 
 void DeviceReportUndestroyedObjects(VkDevice device, VulkanObjectType object_type, const std::string &error_code) {
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
     for (const auto &item : device_data->object_map[object_type]) {
-        const ObjTrackState *object_info = item.second;
+        const ObjTrackState *object_info = &item.second;
         log_msg(device_data->report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, get_debug_report_enum[object_type], object_info->handle,
                 error_code, "OBJ ERROR : For device 0x%" PRIxLEAST64 ", %s object 0x%" PRIxLEAST64 " has not been destroyed.",
                 HandleToUint64(device), object_string[object_type], object_info->handle);
@@ -314,11 +305,11 @@ void DeviceReportUndestroyedObjects(VkDevice device, VulkanObjectType object_typ
 
 void DeviceDestroyUndestroyedObjects(VkDevice device, VulkanObjectType object_type) {
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
-    while (!device_data->object_map[object_type].empty()) {
-        auto item = device_data->object_map[object_type].begin();
-
-        ObjTrackState *object_info = item->second;
-        DestroyObjectSilently(device, object_info->handle, object_type);
+    auto item = device_data->object_map[object_type].begin();
+    while (item != device_data->object_map[object_type].end()) {
+        uint64_t object_handle = item->second.handle;
+        ++item;
+        DestroyObjectSilently(device, object_handle, object_type);
     }
 }
 
@@ -345,7 +336,7 @@ VKAPI_ATTR void VKAPI_CALL DestroyInstance(VkInstance instance, const VkAllocati
     // Destroy physical devices
     for (auto iit = instance_data->object_map[kVulkanObjectTypePhysicalDevice].begin();
          iit != instance_data->object_map[kVulkanObjectTypePhysicalDevice].end();) {
-        ObjTrackState *pNode = iit->second;
+        ObjTrackState *pNode = &iit->second;
         VkPhysicalDevice physical_device = reinterpret_cast<VkPhysicalDevice>(pNode->handle);
 
         DestroyObject(instance, physical_device, kVulkanObjectTypePhysicalDevice, nullptr, kVUIDUndefined, kVUIDUndefined);
@@ -355,7 +346,7 @@ VKAPI_ATTR void VKAPI_CALL DestroyInstance(VkInstance instance, const VkAllocati
     // Destroy child devices
     for (auto iit = instance_data->object_map[kVulkanObjectTypeDevice].begin();
          iit != instance_data->object_map[kVulkanObjectTypeDevice].end();) {
-        ObjTrackState *pNode = iit->second;
+        ObjTrackState *pNode = &iit->second;
 
         VkDevice device = reinterpret_cast<VkDevice>(pNode->handle);
         VkDebugReportObjectTypeEXT debug_object_type = get_debug_report_enum[pNode->object_type];
@@ -561,7 +552,7 @@ VKAPI_ATTR VkResult VKAPI_CALL ResetDescriptorPool(VkDevice device, VkDescriptor
     // Remove this pool's descriptor sets from our descriptorSet map.
     auto itr = device_data->object_map[kVulkanObjectTypeDescriptorSet].begin();
     while (itr != device_data->object_map[kVulkanObjectTypeDescriptorSet].end()) {
-        ObjTrackState *pNode = (*itr).second;
+        ObjTrackState *pNode = &(*itr).second;
         auto del_itr = itr++;
         if (pNode->parent_object == HandleToUint64(descriptorPool)) {
             DestroyObject(device, (VkDescriptorSet)((*del_itr).first), kVulkanObjectTypeDescriptorSet, nullptr, kVUIDUndefined,
@@ -580,8 +571,10 @@ VKAPI_ATTR VkResult VKAPI_CALL BeginCommandBuffer(VkCommandBuffer command_buffer
         std::lock_guard<std::mutex> lock(global_lock);
         skip |= ValidateObject(command_buffer, command_buffer, kVulkanObjectTypeCommandBuffer, false,
                                "VUID-vkBeginCommandBuffer-commandBuffer-parameter", kVUIDUndefined);
-        if (begin_info) {
-            ObjTrackState *pNode = device_data->object_map[kVulkanObjectTypeCommandBuffer][HandleToUint64(command_buffer)];
+        // An unknown command buffer has already been reported by ValidateObject, and is not added to the map here
+        auto cb_item = device_data->object_map[kVulkanObjectTypeCommandBuffer].find(HandleToUint64(command_buffer));
+        if (begin_info && (cb_item != device_data->object_map[kVulkanObjectTypeCommandBuffer].end())) {
+            ObjTrackState *pNode = &cb_item->second;
             if ((begin_info->pInheritanceInfo) && (pNode->status & OBJSTATUS_COMMAND_BUFFER_SECONDARY) &&
                 (begin_info->flags & VK_COMMAND_BUFFER_USAGE_RENDER_PASS_CONTINUE_BIT)) {
                 skip |=
@@ -845,10 +838,8 @@ VKAPI_ATTR VkResult VKAPI_CALL CreateDevice(VkPhysicalDevice physicalDevice, con
     device_data->report_data = layer_debug_utils_create_device(phy_dev_data->report_data, *pDevice);
     layer_init_device_dispatch_table(*pDevice, &device_data->device_dispatch_table, fpGetDeviceProcAddr);
 
-    // Save pCreateInfo device extension list for GetDeviceProcAddr()
-    for (uint32_t extn = 0; extn < pCreateInfo->enabledExtensionCount; extn++) {
-        device_data->device_extension_set.insert(pCreateInfo->ppEnabledExtensionNames[extn]);
-    }
+    // Save the set of enabled device extensions for GetDeviceProcAddr()
+    device_data->device_extension_enables = GetDispatchExtensionEnables(pCreateInfo);
 
     // Add link back to physDev
     device_data->physical_device = physicalDevice;
@@ -1146,13 +1137,11 @@ VKAPI_ATTR void VKAPI_CALL DestroySwapchainKHR(VkDevice device, VkSwapchainKHR s
     std::unique_lock<std::mutex> lock(global_lock);
     // A swapchain's images are implicitly deleted when the swapchain is deleted.
     // Remove this swapchain's images from our map of such images.
-    std::unordered_map<uint64_t, ObjTrackState *>::iterator itr = device_data->swapchainImageMap.begin();
+    auto itr = device_data->swapchainImageMap.begin();
     while (itr != device_data->swapchainImageMap.end()) {
-        ObjTrackState *pNode = (*itr).second;
+        ObjTrackState *pNode = &(*itr).second;
         if (pNode->parent_object == HandleToUint64(swapchain)) {
-            delete pNode;
-            auto delete_item = itr++;
-            device_data->swapchainImageMap.erase(delete_item);
+            itr = device_data->swapchainImageMap.erase(itr);
         } else {
             ++itr;
         }
@@ -1208,9 +1197,9 @@ VKAPI_ATTR void VKAPI_CALL DestroyDescriptorPool(VkDevice device, VkDescriptorPo
     // A DescriptorPool's descriptor sets are implicitly deleted when the pool is deleted.
     // Remove this pool's descriptor sets from our descriptorSet map.
     lock.lock();
-    std::unordered_map<uint64_t, ObjTrackState *>::iterator itr = device_data->object_map[kVulkanObjectTypeDescriptorSet].begin();
+    auto itr = device_data->object_map[kVulkanObjectTypeDescriptorSet].begin();
     while (itr != device_data->object_map[kVulkanObjectTypeDescriptorSet].end()) {
-        ObjTrackState *pNode = (*itr).second;
+        ObjTrackState *pNode = &(*itr).second;
         auto del_itr = itr++;
         if (pNode->parent_object == HandleToUint64(descriptorPool)) {
             DestroyObject(device, (VkDescriptorSet)((*del_itr).first), kVulkanObjectTypeDescriptorSet, nullptr, kVUIDUndefined,
@@ -1241,7 +1230,7 @@ VKAPI_ATTR void VKAPI_CALL DestroyCommandPool(VkDevice device, VkCommandPool com
     auto itr = device_data->object_map[kVulkanObjectTypeCommandBuffer].begin();
     auto del_itr = itr;
     while (itr != device_data->object_map[kVulkanObjectTypeCommandBuffer].end()) {
-        ObjTrackState *pNode = (*itr).second;
+        ObjTrackState *pNode = &(*itr).second;
         del_itr = itr++;
         if (pNode->parent_object == HandleToUint64(commandPool)) {
             skip |= ValidateCommandBuffer(device, commandPool, reinterpret_cast<VkCommandBuffer>((*del_itr).first));
@@ -1398,7 +1387,7 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetPhysicalDeviceProcAddr(VkInstance in
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, const char *funcName) {
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
-    if (!ApiParentExtensionEnabled(funcName, device_data->device_extension_set)) {
+    if (!ApiParentExtensionEnabled(funcName, device_data->device_extension_enables)) {
         return nullptr;
     }
     const auto item = name_to_funcptr_map.find(funcName);
@@ -35,9 +35,11 @@
 #include "vk_layer_logging.h"
 #include "vk_validation_error_messages.h"
 #include "vk_extension_helper.h"
+#include "vk_dispatch_table_helper.h"
 #include "vk_layer_utils.h"
 
 #include "parameter_name.h"
+#include "parameter_validation_extension_commands.h"
 
 namespace parameter_validation {
 
@@ -75,6 +77,8 @@ struct instance_layer_data {
     VkDebugUtilsMessengerEXT *tmp_debug_messengers = nullptr;
 
     InstanceExtensions extensions = {};
+    // Enable state of each extension-dependent command, precomputed from the enabled extensions
+    std::bitset<kExtensionCommandCount> extension_command_enables;
     VkLayerInstanceDispatchTable dispatch_table = {};
     uint32_t api_version;
 };
@@ -88,6 +92,9 @@ struct layer_data {
     VkPhysicalDevice physical_device = VK_NULL_HANDLE;
     VkDevice device = VK_NULL_HANDLE;
     DeviceExtensions extensions;
+    DispatchExtensionEnables device_extension_enables;
+    // Enable state of each extension-dependent command, precomputed from the enabled extensions
+    std::bitset<kExtensionCommandCount> extension_command_enables;
     uint32_t api_version;
 
     // Device extension properties -- storing properties gathered from VkPhysicalDeviceProperties2KHR::pNext chain
@@ -107,6 +114,9 @@ struct layer_data {
     VkLayerDispatchTable dispatch_table = {};
 };
 
+void InitInstanceExtensionCommandEnables(instance_layer_data *instance_data);
+void InitDeviceExtensionCommandEnables(layer_data *device_data);
+
 // Suppress unused warning on Linux
 #if defined(__GNUC__)
 #define DECORATE_UNUSED __attribute__((unused))
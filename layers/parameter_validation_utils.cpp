@@ -217,16 +217,16 @@ static bool validate_extension_reqs(const instance_layer_data *instance_data, co
     if (!extension_name) {
         return skip;  // Robust to invalid char *
     }
-    auto info = ExtensionState::get_info(extension_name);
+    const auto &info = ExtensionState::get_info(extension_name);
 
-    if (!info.state) {
+    if (!info.id) {
         return skip;  // Unknown extensions cannot be checked so report OK
     }
 
     // Check against the required list in the info
     std::vector<const char *> missing;
     for (const auto &req : info.requires) {
-        if (!(extensions.*(req.enabled))) {
+        if (!extensions.enabled[req.id]) {
             missing.push_back(req.name);
         }
     }
@@ -325,6 +325,7 @@ VKAPI_ATTR VkResult VKAPI_CALL vkCreateInstance(const VkInstanceCreateInfo *pCre
                                    : VK_API_VERSION_1_0;
 
         my_instance_data->api_version = my_instance_data->extensions.InitFromInstanceCreateInfo(api_version, pCreateInfo);
+        InitInstanceExtensionCommandEnables(my_instance_data);
 
         // Ordinarily we'd check these before calling down the chain, but none of the layer support is in place until now, if we
         // survive we can report the issue now.
@@ -481,8 +482,8 @@ VKAPI_ATTR void VKAPI_CALL vkDestroyDebugUtilsMessengerEXT(VkInstance instance,
 template <typename ExtensionState>
 static bool extension_state_by_name(const ExtensionState &extensions, const char *extension_name) {
     if (!extension_name) return false;  // null strings specify nothing
-    auto info = ExtensionState::get_info(extension_name);
-    bool state = info.state ? extensions.*(info.state) : false;  // unknown extensions can't be enabled in extension struct
+    const auto &info = ExtensionState::get_info(extension_name);
+    bool state = info.id ? extensions.enabled[info.id] : false;  // unknown extensions can't be enabled in extension struct
     return state;
 }
 
@@ -629,6 +630,8 @@ VKAPI_ATTR VkResult VKAPI_CALL vkCreateDevice(VkPhysicalDevice physicalDevice, c
 
             my_device_data->api_version = api_version;
             my_device_data->extensions = extensions;
+            InitDeviceExtensionCommandEnables(my_device_data);
+            my_device_data->device_extension_enables = GetDispatchExtensionEnables(pCreateInfo);
 
             // Store createdevice data
             if ((pCreateInfo != nullptr) && (pCreateInfo->pQueueCreateInfos != nullptr)) {
@@ -642,7 +645,7 @@ VKAPI_ATTR VkResult VKAPI_CALL vkCreateDevice(VkPhysicalDevice physicalDevice, c
             my_device_data->physical_device = physicalDevice;
             my_device_data->device = *pDevice;
 
-            if (my_device_data->extensions.vk_nv_shading_rate_image) {
+            if (my_device_data->extensions.vk_nv_shading_rate_image()) {
                 // Get the needed shading rate image limits
                 auto shading_rate_image_props = lvl_init_struct<VkPhysicalDeviceShadingRateImagePropertiesNV>();
                 auto prop2 = lvl_init_struct<VkPhysicalDeviceProperties2KHR>(&shading_rate_image_props);
@@ -650,7 +653,7 @@ VKAPI_ATTR VkResult VKAPI_CALL vkCreateDevice(VkPhysicalDevice physicalDevice, c
                 my_device_data->phys_dev_ext_props.shading_rate_image_props = shading_rate_image_props;
             }
 
-            if (my_device_data->extensions.vk_nv_mesh_shader) {
+            if (my_device_data->extensions.vk_nv_mesh_shader()) {
                 // Get the needed mesh shader limits
                 auto mesh_shader_props = lvl_init_struct<VkPhysicalDeviceMeshShaderPropertiesNV>();
                 auto prop2 = lvl_init_struct<VkPhysicalDeviceProperties2KHR>(&mesh_shader_props);
@@ -661,7 +664,7 @@ VKAPI_ATTR VkResult VKAPI_CALL vkCreateDevice(VkPhysicalDevice physicalDevice, c
             // Save app-enabled features in this device's layer_data structure
             // The enabled features can come from either pEnabledFeatures, or from the pNext chain
             const VkPhysicalDeviceFeatures *enabled_features_found = pCreateInfo->pEnabledFeatures;
-            if ((nullptr == enabled_features_found) && my_device_data->extensions.vk_khr_get_physical_device_properties_2) {
+            if ((nullptr == enabled_features_found) && my_device_data->extensions.vk_khr_get_physical_device_properties_2()) {
                 const auto *features2 = lvl_find_in_chain<VkPhysicalDeviceFeatures2KHR>(pCreateInfo->pNext);
                 if (features2) {
                     enabled_features_found = &(features2->features);
@@ -1282,8 +1285,8 @@ bool pv_VkViewport(const layer_data *device_data, const VkViewport &viewport, co
     // height
     bool height_healthy = true;
     const bool negative_height_enabled = device_data->api_version >= VK_API_VERSION_1_1 ||
-                                         device_data->extensions.vk_khr_maintenance1 ||
-                                         device_data->extensions.vk_amd_negative_viewport_height;
+                                         device_data->extensions.vk_khr_maintenance1() ||
+                                         device_data->extensions.vk_amd_negative_viewport_height();
     const auto max_h = device_data->device_limits.maxViewportDimensions[1];
 
     if (!negative_height_enabled && !(viewport.height > 0.0f)) {
@@ -1359,7 +1362,7 @@ bool pv_VkViewport(const layer_data *device_data, const VkViewport &viewport, co
         }
     }
 
-    if (!device_data->extensions.vk_ext_depth_range_unrestricted) {
+    if (!device_data->extensions.vk_ext_depth_range_unrestricted()) {
         // minDepth
         if (!(viewport.minDepth >= 0.0) || !(viewport.minDepth <= 1.0)) {
             skip |= log_msg(report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, object_type, object, "VUID-VkViewport-minDepth-01234",
@@ -1913,7 +1916,7 @@ bool pv_vkCreateGraphicsPipelines(VkDevice device, VkPipelineCache pipelineCache
                         }
                     }
 
-                    if (has_dynamic_viewport_w_scaling_nv && !device_data->extensions.vk_nv_clip_space_w_scaling) {
+                    if (has_dynamic_viewport_w_scaling_nv && !device_data->extensions.vk_nv_clip_space_w_scaling()) {
                         skip |= log_msg(report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT,
                                         VK_NULL_HANDLE, kVUID_PVError_ExtensionNotEnabled,
                                         "vkCreateGraphicsPipelines: pCreateInfos[%" PRIu32
@@ -1922,7 +1925,7 @@ bool pv_vkCreateGraphicsPipelines(VkDevice device, VkPipelineCache pipelineCache
                                         i);
                     }
 
-                    if (has_dynamic_discard_rectangle_ext && !device_data->extensions.vk_ext_discard_rectangles) {
+                    if (has_dynamic_discard_rectangle_ext && !device_data->extensions.vk_ext_discard_rectangles()) {
                         skip |= log_msg(report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT,
                                         VK_NULL_HANDLE, kVUID_PVError_ExtensionNotEnabled,
                                         "vkCreateGraphicsPipelines: pCreateInfos[%" PRIu32
@@ -1931,7 +1934,7 @@ bool pv_vkCreateGraphicsPipelines(VkDevice device, VkPipelineCache pipelineCache
                                         i);
                     }
 
-                    if (has_dynamic_sample_locations_ext && !device_data->extensions.vk_ext_sample_locations) {
+                    if (has_dynamic_sample_locations_ext && !device_data->extensions.vk_ext_sample_locations()) {
                         skip |= log_msg(report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT,
                                         VK_NULL_HANDLE, kVUID_PVError_ExtensionNotEnabled,
                                         "vkCreateGraphicsPipelines: pCreateInfos[%" PRIu32
@@ -1940,7 +1943,7 @@ bool pv_vkCreateGraphicsPipelines(VkDevice device, VkPipelineCache pipelineCache
                                         i);
                     }
 
-                    if (has_dynamic_exclusive_scissor_nv && !device_data->extensions.vk_nv_scissor_exclusive) {
+                    if (has_dynamic_exclusive_scissor_nv && !device_data->extensions.vk_nv_scissor_exclusive()) {
                         skip |= log_msg(report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_PIPELINE_EXT,
                                         VK_NULL_HANDLE, kVUID_PVError_ExtensionNotEnabled,
                                         "vkCreateGraphicsPipelines: pCreateInfos[%" PRIu32
@@ -2423,7 +2426,7 @@ bool pv_vkCreateSampler(VkDevice device, const VkSamplerCreateInfo *pCreateInfo,
 
         // If any of addressModeU, addressModeV or addressModeW are VK_SAMPLER_ADDRESS_MODE_MIRROR_CLAMP_TO_EDGE, the
         // VK_KHR_sampler_mirror_clamp_to_edge extension must be enabled
-        if (!device_data->extensions.vk_khr_sampler_mirror_clamp_to_edge &&
+        if (!device_data->extensions.vk_khr_sampler_mirror_clamp_to_edge() &&
             ((pCreateInfo->addressModeU == VK_SAMPLER_ADDRESS_MODE_MIRROR_CLAMP_TO_EDGE) ||
              (pCreateInfo->addressModeV == VK_SAMPLER_ADDRESS_MODE_MIRROR_CLAMP_TO_EDGE) ||
              (pCreateInfo->addressModeW == VK_SAMPLER_ADDRESS_MODE_MIRROR_CLAMP_TO_EDGE))) {
@@ -2435,7 +2438,7 @@ bool pv_vkCreateSampler(VkDevice device, const VkSamplerCreateInfo *pCreateInfo,
         }
 
         // Checks for the IMG cubic filtering extension
-        if (device_data->extensions.vk_img_filter_cubic) {
+        if (device_data->extensions.vk_img_filter_cubic()) {
             if ((pCreateInfo->anisotropyEnable == VK_TRUE) &&
                 ((pCreateInfo->minFilter == VK_FILTER_CUBIC_IMG) || (pCreateInfo->magFilter == VK_FILTER_CUBIC_IMG))) {
                 skip |= log_msg(report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT, 0,
@@ -2920,7 +2923,7 @@ bool pv_vkCmdCopyImage(VkCommandBuffer commandBuffer, VkImage srcImage, VkImageL
 
     VkImageAspectFlags legal_aspect_flags =
         VK_IMAGE_ASPECT_COLOR_BIT | VK_IMAGE_ASPECT_DEPTH_BIT | VK_IMAGE_ASPECT_STENCIL_BIT | VK_IMAGE_ASPECT_METADATA_BIT;
-    if (device_data->extensions.vk_khr_sampler_ycbcr_conversion) {
+    if (device_data->extensions.vk_khr_sampler_ycbcr_conversion()) {
         legal_aspect_flags |= (VK_IMAGE_ASPECT_PLANE_0_BIT_KHR | VK_IMAGE_ASPECT_PLANE_1_BIT_KHR | VK_IMAGE_ASPECT_PLANE_2_BIT_KHR);
     }
 
@@ -2948,7 +2951,7 @@ bool pv_vkCmdBlitImage(VkCommandBuffer commandBuffer, VkImage srcImage, VkImageL
 
     VkImageAspectFlags legal_aspect_flags =
         VK_IMAGE_ASPECT_COLOR_BIT | VK_IMAGE_ASPECT_DEPTH_BIT | VK_IMAGE_ASPECT_STENCIL_BIT | VK_IMAGE_ASPECT_METADATA_BIT;
-    if (device_data->extensions.vk_khr_sampler_ycbcr_conversion) {
+    if (device_data->extensions.vk_khr_sampler_ycbcr_conversion()) {
         legal_aspect_flags |= (VK_IMAGE_ASPECT_PLANE_0_BIT_KHR | VK_IMAGE_ASPECT_PLANE_1_BIT_KHR | VK_IMAGE_ASPECT_PLANE_2_BIT_KHR);
     }
 
@@ -2976,7 +2979,7 @@ bool pv_vkCmdCopyBufferToImage(VkCommandBuffer commandBuffer, VkBuffer srcBuffer
 
     VkImageAspectFlags legal_aspect_flags =
         VK_IMAGE_ASPECT_COLOR_BIT | VK_IMAGE_ASPECT_DEPTH_BIT | VK_IMAGE_ASPECT_STENCIL_BIT | VK_IMAGE_ASPECT_METADATA_BIT;
-    if (device_data->extensions.vk_khr_sampler_ycbcr_conversion) {
+    if (device_data->extensions.vk_khr_sampler_ycbcr_conversion()) {
         legal_aspect_flags |= (VK_IMAGE_ASPECT_PLANE_0_BIT_KHR | VK_IMAGE_ASPECT_PLANE_1_BIT_KHR | VK_IMAGE_ASPECT_PLANE_2_BIT_KHR);
     }
 
@@ -2998,7 +3001,7 @@ bool pv_vkCmdCopyImageToBuffer(VkCommandBuffer commandBuffer, VkImage srcImage,
 
     VkImageAspectFlags legal_aspect_flags =
         VK_IMAGE_ASPECT_COLOR_BIT | VK_IMAGE_ASPECT_DEPTH_BIT | VK_IMAGE_ASPECT_STENCIL_BIT | VK_IMAGE_ASPECT_METADATA_BIT;
-    if (device_data->extensions.vk_khr_sampler_ycbcr_conversion) {
+    if (device_data->extensions.vk_khr_sampler_ycbcr_conversion()) {
         legal_aspect_flags |= (VK_IMAGE_ASPECT_PLANE_0_BIT_KHR | VK_IMAGE_ASPECT_PLANE_1_BIT_KHR | VK_IMAGE_ASPECT_PLANE_2_BIT_KHR);
     }
 
@@ -3187,7 +3190,7 @@ bool pv_vkQueuePresentKHR(VkQueue queue, const VkPresentInfoKHR *pPresentInfo) {
         const auto *present_regions = lvl_find_in_chain<VkPresentRegionsKHR>(pPresentInfo->pNext);
         if (present_regions) {
             // TODO: This and all other pNext extension dependencies should be added to code-generation
-            skip |= require_device_extension(device_data, device_data->extensions.vk_khr_incremental_present, "vkQueuePresentKHR",
+            skip |= require_device_extension(device_data, device_data->extensions.vk_khr_incremental_present(), "vkQueuePresentKHR",
                                              VK_KHR_INCREMENTAL_PRESENT_EXTENSION_NAME);
             if (present_regions->swapchainCount != pPresentInfo->swapchainCount) {
                 skip |= log_msg(device_data->report_data, VK_DEBUG_REPORT_ERROR_BIT_EXT, VK_DEBUG_REPORT_OBJECT_TYPE_UNKNOWN_EXT, 0,
@@ -3612,7 +3615,7 @@ bool pv_vkCmdDrawMeshTasksIndirectCountNV(
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL vkGetDeviceProcAddr(VkDevice device, const char *funcName) {
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
-    if (!ApiParentExtensionEnabled(funcName, device_data->extensions.device_extension_set)) {
+    if (!ApiParentExtensionEnabled(funcName, device_data->device_extension_enables)) {
         return nullptr;
     }
     const auto item = name_to_funcptr_map.find(funcName);
@@ -170,10 +170,8 @@ VKAPI_ATTR VkResult VKAPI_CALL CreateDevice(VkPhysicalDevice gpu, const VkDevice
     // Setup device dispatch table
     my_device_data->device_dispatch_table = new VkLayerDispatchTable;
     layer_init_device_dispatch_table(*pDevice, my_device_data->device_dispatch_table, fpGetDeviceProcAddr);
-    // Save pCreateInfo device extension list for GetDeviceProcAddr()
-    for (uint32_t extn = 0; extn < pCreateInfo->enabledExtensionCount; extn++) {
-        my_device_data->device_extension_set.insert(pCreateInfo->ppEnabledExtensionNames[extn]);
-    }
+    // Save the set of enabled device extensions for GetDeviceProcAddr()
+    my_device_data->device_extension_enables = GetDispatchExtensionEnables(pCreateInfo);
 
     my_device_data->report_data = layer_debug_utils_create_device(my_instance_data->report_data, *pDevice);
     return result;
@@ -263,7 +261,7 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetPhysicalDeviceProcAddr(VkInstance in
 
 VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, const char *funcName) {
     layer_data *device_data = GetLayerDataPtr(get_dispatch_key(device), layer_data_map);
-    if (!ApiParentExtensionEnabled(funcName, device_data->device_extension_set)) {
+    if (!ApiParentExtensionEnabled(funcName, device_data->device_extension_enables)) {
         return nullptr;
     }
     const auto item = name_to_funcptr_map.find(funcName);
@@ -27,6 +27,7 @@
 #include <string>
 #include "vk_layer_config.h"
 #include "vk_layer_logging.h"
+#include "vk_dispatch_table_helper.h"
 
 VK_DEFINE_NON_DISPATCHABLE_HANDLE(DISTINCT_NONDISPATCHABLE_PHONY_HANDLE)
 // The following line must match the vulkan_core.h condition guarding VK_DEFINE_NON_DISPATCHABLE_HANDLE
@@ -250,7 +251,7 @@ struct layer_data {
     std::vector<VkDebugUtilsMessengerEXT> logging_messenger;
     VkLayerDispatchTable *device_dispatch_table;
     VkLayerInstanceDispatchTable *instance_dispatch_table;
-    std::unordered_set<std::string> device_extension_set;
+    DispatchExtensionEnables device_extension_enables;
 
     // The following are for keeping track of the temporary callbacks that can
     // be used in vkCreateInstance and vkDestroyInstance:
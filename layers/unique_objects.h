@@ -28,6 +28,7 @@
 #include "vk_layer_data.h"
 #include "vk_safe_struct.h"
 #include "vk_layer_utils.h"
+#include "vk_dispatch_table_helper.h"
 #include "mutex"
 
 #pragma once
@@ -72,7 +73,7 @@ struct layer_data {
     VkLayerDispatchTable dispatch_table = {};
 
     std::unordered_map<uint64_t, std::unique_ptr<TEMPLATE_STATE>> desc_template_map;
-    std::unordered_set<std::string> device_extension_set;
+    DispatchExtensionEnables device_extension_enables;
 
     bool wsi_enabled;
     VkPhysicalDevice gpu;
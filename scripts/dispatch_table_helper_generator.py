@@ -112,6 +112,8 @@ class DispatchTableHelperOutputGenerator(OutputGenerator):
         preamble = ''
         preamble += '#include <vulkan/vulkan.h>\n'
         preamble += '#include <vulkan/vk_layer.h>\n'
+        preamble += '#include <algorithm>\n'
+        preamble += '#include <bitset>\n'
         preamble += '#include <cstring>\n'
         preamble += '#include <string>\n'
         preamble += '#include <unordered_set>\n'
@@ -206,27 +208,72 @@ class DispatchTableHelperOutputGenerator(OutputGenerator):
                 name = noneStr(elem.text)
         return (type, name)
     #
-    # Output a function that'll determine if an extension is in the enabled list
+    # Output the numbered device extension and extension command tables, and the functions that determine if an extension
+    # command's parent extension is in the enabled set
     def OutputExtEnabledFunction(self):
-        ##extension_functions = dict(self.device_dispatch_list)
-        ext_fcn  = ''
-        # First, write out our static data structure -- map of all APIs that are part of extensions to their extension.
-        ext_fcn += 'const std::unordered_map<std::string, std::string> api_extension_map {\n'
+        # Number the device extensions that add commands, in order of appearance, and the extension commands by name so that
+        # the command name table can be binary searched
+        extension_names = []
         for extn in self.device_extension_list:
-            ext_fcn += '    {"%s", "%s"},\n' % (extn[0], extn[1])
+            if extn[1] not in extension_names:
+                extension_names.append(extn[1])
+        extension_commands = sorted(self.device_extension_list)
+        ext_fcn  = ''
+        ext_fcn += '// Device extensions which add commands to the device dispatch table\n'
+        ext_fcn += 'enum DispatchDeviceExtension {\n'
+        for extension_name in extension_names:
+            ext_fcn += '    kDispatchDeviceExtension_%s,\n' % extension_name
+        ext_fcn += '    kDispatchDeviceExtensionCount\n'
+        ext_fcn += '};\n\n'
+        ext_fcn += 'static const char * const dispatch_device_extension_names[kDispatchDeviceExtensionCount] = {\n'
+        for extension_name in extension_names:
+            ext_fcn += '    "%s",\n' % extension_name
+        ext_fcn += '};\n\n'
+        ext_fcn += '// Set of enabled device extensions, indexed by DispatchDeviceExtension\n'
+        ext_fcn += 'typedef std::bitset<kDispatchDeviceExtensionCount> DispatchExtensionEnables;\n\n'
+        ext_fcn += '// Commands added by device extensions, sorted by name\n'
+        ext_fcn += 'enum DispatchDeviceCommand {\n'
+        for extn in extension_commands:
+            ext_fcn += '    kDispatchDeviceCommand_%s,\n' % extn[0]
+        ext_fcn += '    kDispatchDeviceCommandCount\n'
+        ext_fcn += '};\n\n'
+        ext_fcn += 'static const char * const dispatch_device_command_names[kDispatchDeviceCommandCount] = {\n'
+        for extn in extension_commands:
+            ext_fcn += '    "%s",\n' % extn[0]
         ext_fcn += '};\n\n'
-        ext_fcn += '// Using the above code-generated map of APINames-to-parent extension names, this function will:\n'
+        ext_fcn += '// Map of extension command to the device extension that adds it\n'
+        ext_fcn += 'static constexpr DispatchDeviceExtension dispatch_device_command_extensions[kDispatchDeviceCommandCount] = {\n'
+        for extn in extension_commands:
+            ext_fcn += '    kDispatchDeviceExtension_%s,  // %s\n' % (extn[1], extn[0])
+        ext_fcn += '};\n\n'
+        ext_fcn += '// Build the set of enabled device extensions from the extension names passed to vkCreateDevice\n'
+        ext_fcn += 'static inline DispatchExtensionEnables GetDispatchExtensionEnables(const VkDeviceCreateInfo *pCreateInfo) {\n'
+        ext_fcn += '    DispatchExtensionEnables enables;\n'
+        ext_fcn += '    if (pCreateInfo->ppEnabledExtensionNames) {\n'
+        ext_fcn += '        for (uint32_t i = 0; i < pCreateInfo->enabledExtensionCount; i++) {\n'
+        ext_fcn += '            if (!pCreateInfo->ppEnabledExtensionNames[i]) continue;\n'
+        ext_fcn += '            for (uint32_t ext = 0; ext < kDispatchDeviceExtensionCount; ext++) {\n'
+        ext_fcn += '                if (strcmp(pCreateInfo->ppEnabledExtensionNames[i], dispatch_device_extension_names[ext]) == 0) {\n'
+        ext_fcn += '                    enables.set(ext);\n'
+        ext_fcn += '                    break;\n'
+        ext_fcn += '                }\n'
+        ext_fcn += '            }\n'
+        ext_fcn += '        }\n'
+        ext_fcn += '    }\n'
+        ext_fcn += '    return enables;\n'
+        ext_fcn += '}\n\n'
+        ext_fcn += '// Using the above code-generated tables of APINames-to-parent extensions, this function will:\n'
         ext_fcn += '//   o  Determine if the API has an associated extension\n'
-        ext_fcn += '//   o  If it does, determine if that extension name is present in the passed-in set of enabled_ext_names \n'
-        ext_fcn += '//   If the APIname has no parent extension, OR its parent extension name is IN the set, return TRUE, else FALSE\n'
-        ext_fcn += 'static inline bool ApiParentExtensionEnabled(const std::string api_name, const std::unordered_set<std::string> &enabled_ext_names) {\n'
-        ext_fcn += '    auto has_ext = api_extension_map.find(api_name);\n'
+        ext_fcn += '//   o  If it does, determine if that extension is present in the passed-in set of enabled extensions\n'
+        ext_fcn += '//   If the APIname has no parent extension, OR its parent extension is IN the set, return TRUE, else FALSE\n'
+        ext_fcn += 'static inline bool ApiParentExtensionEnabled(const char *api_name, const DispatchExtensionEnables &enabled_exts) {\n'
+        ext_fcn += '    const char * const *begin = dispatch_device_command_names;\n'
+        ext_fcn += '    const char * const *end = begin + kDispatchDeviceCommandCount;\n'
+        ext_fcn += '    auto has_ext = std::lower_bound(begin, end, api_name, [](const char *a, const char *b) { return strcmp(a, b) < 0; });\n'
         ext_fcn += '    // Is this API part of an extension?\n'
-        ext_fcn += '    if (has_ext != api_extension_map.end()) {\n'
+        ext_fcn += '    if ((has_ext != end) && (strcmp(*has_ext, api_name) == 0)) {\n'
         ext_fcn += '        // Was the extension for this API enabled in the CreateDevice call?\n'
-        ext_fcn += '        if (enabled_ext_names.find(has_ext->second) == enabled_ext_names.end()) {\n'
-        ext_fcn += '            return false;\n'
-        ext_fcn += '        }\n'
+        ext_fcn += '        return enabled_exts[dispatch_device_command_extensions[has_ext - begin]];\n'
         ext_fcn += '    }\n'
         ext_fcn += '    return true;\n'
         ext_fcn += '}\n'
@@ -77,6 +77,7 @@ class HelperFileOutputGenerator(OutputGenerator):
         OutputGenerator.__init__(self, errFile, warnFile, diagFile)
         # Internal state - accumulators for different inner block text
         self.enum_output = ''                             # string built up of enum string routines
+        self.min_dense_enum_run = 4                       # Shortest run of contiguous enum values emitted as a dense table
         # Internal state - accumulators for different inner block text
         self.structNames = []                             # List of Vulkan struct typenames
         self.structTypes = dict()                         # Map of Vulkan struct typename to required VkStructureType
@@ -193,8 +194,11 @@ class HelperFileOutputGenerator(OutputGenerator):
             value_set = set()
             for elem in groupElem.findall('enum'):
                 if elem.get('supported') != 'disabled' and elem.get('alias') == None:
-                    value_set.add(elem.get('name'))
+                    (numval, strval) = self.enumToValue(elem, True)
+                    value_set.add((numval, elem.get('name')))
             self.enum_output += self.GenerateEnumStringConversion(groupName, value_set)
+            if groupElem.get('type') == 'bitmask' and alias is None:
+                self.enum_output += self.GenerateFlagsStringConversion(groupName)
         elif self.helper_file_type == 'object_types_header':
             if groupName == 'VkDebugReportObjectTypeEXT':
                 for elem in groupElem.findall('enum'):
@@ -359,14 +363,57 @@ class HelperFileOutputGenerator(OutputGenerator):
     #
     # Enum_string_header: Create a routine to convert an enumerated value into a string
     def GenerateEnumStringConversion(self, groupName, value_list):
+        # Emit these in a repeatable, value-ordered form so file is generated with the same contents each time.
+        # This helps compiler caching systems like ccache.
+        if any(value is None for value, name in value_list):
+            return self.GenerateEnumStringSwitch(groupName, [name for value, name in value_list])
+        entries = sorted(value_list)
+        # Runs of contiguous values (typically the core enumerants) become dense tables indexed by value,
+        # whatever is left (typically sparse extension enumerants) is binary searched.
+        dense_runs = []
+        sparse_entries = []
+        run = []
+        for entry in entries + [None]:
+            if entry is not None and run and entry[0] == run[-1][0] + 1:
+                run.append(entry)
+                continue
+            if len(run) >= self.min_dense_enum_run:
+                dense_runs.append(run)
+            else:
+                sparse_entries += run
+            run = [entry]
+        outstring = '\n'
+        outstring += 'static inline const char* string_%s(%s input_value)\n' % (groupName, groupName)
+        outstring += '{\n'
+        for index, run in enumerate(dense_runs):
+            outstring += '    static const char * const dense_names_%d[] = {\n' % index
+            for value, name in run:
+                outstring += '        "%s",\n' % name
+            outstring += '    };\n'
+        if sparse_entries:
+            outstring += '    static const EnumStringEntry sparse_names[] = {\n'
+            for value, name in sparse_entries:
+                outstring += '        {%d, "%s"},\n' % (value, name)
+            outstring += '    };\n'
+        if dense_runs or sparse_entries:
+            outstring += '    const int64_t value = (int64_t)input_value;\n'
+        for index, run in enumerate(dense_runs):
+            outstring += '    if (value >= %d && value <= %d) return dense_names_%d[value - %d];\n' % (run[0][0], run[-1][0], index, run[0][0])
+        if sparse_entries:
+            outstring += '    const char *name = LookupEnumString(sparse_names, sizeof(sparse_names) / sizeof(sparse_names[0]), value);\n'
+            outstring += '    if (name) return name;\n'
+        outstring += '    return "Unhandled %s";\n' % groupName
+        outstring += '}\n'
+        return outstring
+    #
+    # Fallback switch-based enum to string conversion, used when enumerant values cannot be resolved
+    def GenerateEnumStringSwitch(self, groupName, name_list):
         outstring = '\n'
         outstring += 'static inline const char* string_%s(%s input_value)\n' % (groupName, groupName)
         outstring += '{\n'
         outstring += '    switch ((%s)input_value)\n' % groupName
         outstring += '    {\n'
-        # Emit these in a repeatable order so file is generated with the same contents each time.
-        # This helps compiler caching systems like ccache.
-        for item in sorted(value_list):
+        for item in sorted(name_list):
             outstring += '        case %s:\n' % item
             outstring += '            return "%s";\n' % item
         outstring += '        default:\n'
@@ -375,6 +422,24 @@ class HelperFileOutputGenerator(OutputGenerator):
         outstring += '}\n'
         return outstring
     #
+    # Generate a string_VkFooFlags routine which formats a combined bitmask into a caller-supplied buffer. With no buffer
+    # space there is nowhere to terminate the string, so a static empty string is returned instead of the buffer.
+    def GenerateFlagsStringConversion(self, groupName):
+        flagsName = groupName.replace('FlagBits', 'Flags')
+        outstring = '\n'
+        outstring += 'static inline const char* string_%s(%s input_value, char *buffer, size_t buffer_size)\n' % (flagsName, flagsName)
+        outstring += '{\n'
+        outstring += '    if (buffer_size == 0) return "";\n'
+        outstring += '    size_t length = AppendEnumFlagString(buffer, buffer_size, 0, "");\n'
+        outstring += '    for (uint32_t index = 0; index < 32; ++index) {\n'
+        outstring += '        const VkFlags bit = input_value & (1U << index);\n'
+        outstring += '        if (bit) length = AppendEnumFlagString(buffer, buffer_size, length, string_%s((%s)bit));\n' % (groupName, groupName)
+        outstring += '    }\n'
+        outstring += '    if (length == 0) AppendEnumFlagString(buffer, buffer_size, 0, "0");\n'
+        outstring += '    return buffer;\n'
+        outstring += '}\n'
+        return outstring
+    #
     # Tack on a helper which, given an index into a VkPhysicalDeviceFeatures structure, will print the corresponding feature name
     def DeIndexPhysDevFeatures(self):
         pdev_members = None
@@ -392,6 +457,45 @@ class HelperFileOutputGenerator(OutputGenerator):
         deindex += '}\n'
         return deindex
     #
+    # Shared lookup and formatting helpers used by the generated string_* routines
+    def GenerateEnumStringSupport(self):
+        support = '\n'
+        support += 'typedef struct EnumStringEntry {\n'
+        support += '    int64_t value;\n'
+        support += '    const char *name;\n'
+        support += '} EnumStringEntry;\n'
+        support += '\n'
+        support += '// Binary search a value-sorted EnumStringEntry table, returning NULL if value is not present\n'
+        support += 'static inline const char *LookupEnumString(const EnumStringEntry *entries, size_t count, int64_t value)\n'
+        support += '{\n'
+        support += '    size_t low = 0;\n'
+        support += '    size_t high = count;\n'
+        support += '    while (low < high) {\n'
+        support += '        const size_t mid = low + (high - low) / 2;\n'
+        support += '        if (entries[mid].value < value) {\n'
+        support += '            low = mid + 1;\n'
+        support += '        } else {\n'
+        support += '            high = mid;\n'
+        support += '        }\n'
+        support += '    }\n'
+        support += '    return (low < count && entries[low].value == value) ? entries[low].name : NULL;\n'
+        support += '}\n'
+        support += '\n'
+        support += '// Append name to a NUL-terminated flags string of the given length, separating names with \'|\'.\n'
+        support += '// Output is truncated to fit buffer_size; the new length is returned.\n'
+        support += 'static inline size_t AppendEnumFlagString(char *buffer, size_t buffer_size, size_t length, const char *name)\n'
+        support += '{\n'
+        support += '    if (buffer_size == 0) return 0;\n'
+        support += '    if (length > 0 && *name) {\n'
+        support += '        if (length + 2 >= buffer_size) return length;\n'
+        support += '        buffer[length++] = \'|\';\n'
+        support += '    }\n'
+        support += '    while (*name && length + 1 < buffer_size) buffer[length++] = *name++;\n'
+        support += '    buffer[length] = \'\\0\';\n'
+        support += '    return length;\n'
+        support += '}\n'
+        return support
+    #
     # Combine enum string helper header file preamble with body text and return
     def GenerateEnumStringHelperHeader(self):
             enum_string_helper_header = '\n'
@@ -400,8 +504,11 @@ class HelperFileOutputGenerator(OutputGenerator):
             enum_string_helper_header += '#pragma warning( disable : 4065 )\n'
             enum_string_helper_header += '#endif\n'
             enum_string_helper_header += '\n'
+            enum_string_helper_header += '#include <stddef.h>\n'
+            enum_string_helper_header += '#include <stdint.h>\n'
             enum_string_helper_header += '#include <vulkan/vulkan.h>\n'
             enum_string_helper_header += '\n'
+            enum_string_helper_header += self.GenerateEnumStringSupport()
             enum_string_helper_header += self.enum_output
             enum_string_helper_header += self.DeIndexPhysDevFeatures()
             return enum_string_helper_header
@@ -458,6 +565,120 @@ class HelperFileOutputGenerator(OutputGenerator):
                     safe_struct_header += '#endif // %s\n' % item.ifdef_protect
         return safe_struct_header
     #
+    # FNV-1a hash of an extension name, with seed multiplied into the offset basis and a final avalanche so that every
+    # seed bit reaches the masked low bits -- must match ExtensionNameHash in the generated header
+    def ExtensionNameHash(self, seed, name):
+        hash = (2166136261 ^ (seed * 2654435761)) & 0xffffffff
+        for char in bytearray(name.encode('ascii')):
+            hash = ((hash ^ char) * 16777619) & 0xffffffff
+        hash ^= hash >> 16
+        hash = (hash * 0x85ebca6b) & 0xffffffff
+        hash ^= hash >> 13
+        hash = (hash * 0xc2b2ae35) & 0xffffffff
+        hash ^= hash >> 16
+        return hash
+    #
+    # Build a hash-and-displace perfect hash for a list of extension names. Returns the per-bucket seeds and the slot table
+    # mapping each hash slot to an index in names (or -1 for an empty slot). Bucket and slot counts are a power of two so
+    # the generated lookup can mask instead of divide. If some bucket finds no seed within max_seed, the table is doubled
+    # and the search retried, up to max_growth times; None is returned if that fails too.
+    def BuildExtensionPerfectHash(self, names, max_seed=1 << 16, max_growth=3):
+        size = 1
+        while size < len(names):
+            size *= 2
+        for growth in range(max_growth + 1):
+            table = self.TryExtensionPerfectHash(names, size << growth, max_seed)
+            if table is not None:
+                return table
+        return None
+    #
+    # One attempt at BuildExtensionPerfectHash with a fixed table size, returning None if the seed search hits max_seed
+    def TryExtensionPerfectHash(self, names, size, max_seed):
+        mask = size - 1
+        buckets = [[] for i in range(size)]
+        for index, name in enumerate(names):
+            buckets[self.ExtensionNameHash(0, name) & mask].append(index)
+        seeds = [0] * size
+        slots = [-1] * size
+        # Place the most crowded buckets first, searching for a seed that puts all of their names into distinct free slots
+        for bucket in sorted(range(size), key=lambda b: len(buckets[b]), reverse=True):
+            if not buckets[bucket]:
+                break
+            for seed in range(1, max_seed):
+                placed = [self.ExtensionNameHash(seed, names[index]) & mask for index in buckets[bucket]]
+                if len(set(placed)) == len(placed) and all(slots[slot] == -1 for slot in placed):
+                    break
+            else:
+                return None
+            seeds[bucket] = seed
+            for slot, index in zip(placed, buckets[bucket]):
+                slots[slot] = index
+        return seeds, slots
+    #
+    # Generate the seeded FNV-1a name hash used by the get_info perfect hash lookups -- must match ExtensionNameHash above
+    def GenerateExtensionNameHash(self):
+        return [
+            '// Seeded FNV-1a hash of an extension name, used by the generated perfect hash lookups in get_info',
+            'static inline uint32_t ExtensionNameHash(uint32_t seed, const char *name) {',
+            '    uint32_t hash = 2166136261u ^ (seed * 2654435761u);',
+            '    for (; *name; ++name) {',
+            '        hash = (hash ^ static_cast<uint8_t>(*name)) * 16777619u;',
+            '    }',
+            '    hash ^= hash >> 16;',
+            '    hash *= 0x85ebca6bu;',
+            '    hash ^= hash >> 13;',
+            '    hash *= 0xc2b2ae35u;',
+            '    hash ^= hash >> 16;',
+            '    return hash;',
+            '}',
+            '']
+    #
+    # Generate the end of get_info, after its info_names and info_table arrays: the lookup of name through the perfect
+    # hash from BuildExtensionPerfectHash, or a binary search of the sorted info_names if perfect_hash is None
+    def GenerateExtensionLookup(self, info_type, req_vec_type, name_count, perfect_hash):
+        lookup = []
+        if perfect_hash is not None:
+            seeds, slots = perfect_hash
+            mask = len(slots) - 1
+            lookup.extend([ '        static const uint32_t bucket_seeds[%d] = {' % len(seeds)])
+            lookup.extend([ '            %s,' % ', '.join([str(seed) for seed in seeds[i:i + 16]]) for i in range(0, len(seeds), 16)])
+            lookup.extend([
+                '        };',
+                '        static const int16_t slots[%d] = {' % len(slots)])
+            lookup.extend([ '            %s,' % ', '.join([str(slot) for slot in slots[i:i + 16]]) for i in range(0, len(slots), 16)])
+            lookup.extend([
+                '        };',
+                '',
+                '        static const %s empty_info {kExtensionNone, %s()};' % (info_type, req_vec_type),
+                '        const uint32_t bucket = ExtensionNameHash(0, name) & %du;' % mask,
+                '        const int16_t slot = slots[ExtensionNameHash(bucket_seeds[bucket], name) & %du];' % mask,
+                '        if ((slot >= 0) && (strcmp(name, info_names[slot]) == 0)) {',
+                '            return info_table[slot];',
+                '        }',
+                '        return empty_info;',
+                '    }',
+                ''])
+        else:
+            lookup.extend([
+                '',
+                '        static const %s empty_info {kExtensionNone, %s()};' % (info_type, req_vec_type),
+                '        size_t low = 0;',
+                '        size_t high = %d;' % name_count,
+                '        while (low < high) {',
+                '            const size_t mid = low + (high - low) / 2;',
+                '            const int order = strcmp(info_names[mid], name);',
+                '            if (order == 0) return info_table[mid];',
+                '            if (order < 0) {',
+                '                low = mid + 1;',
+                '            } else {',
+                '                high = mid;',
+                '            }',
+                '        }',
+                '        return empty_info;',
+                '    }',
+                ''])
+        return lookup
+    #
     # Generate extension helper header file
     def GenerateExtensionHelperHeader(self):
 
@@ -499,6 +720,8 @@ class HelperFileOutputGenerator(OutputGenerator):
             '#include <unordered_map>',
             '#include <utility>',
             '#include <set>',
+            '#include <bitset>',
+            '#include <cstring>',
             '',
             '#include <vulkan/vulkan.h>',
             '']
@@ -509,6 +732,25 @@ class HelperFileOutputGenerator(OutputGenerator):
             else:
                 return value
 
+        def enum_name(field):
+            return 'k' + ''.join([part[:1].upper() + part[1:] for part in field.split('_')])
+
+        # Number all instance and device extensions in a single space, so that DeviceExtensions can share the
+        # InstanceExtensions enable bits. Zero is reserved for unknown or unsupported extensions.
+        all_extension_info = self.instance_extension_info.copy()
+        all_extension_info.update(self.device_extension_info)
+        all_field_name = { ext_name: re.sub('_extension_name', '', info['define'].lower()) for ext_name, info in all_extension_info.items() }
+        output.extend([
+            '// Identifiers of all instance and device extensions, indexing the InstanceExtensions/DeviceExtensions enable bits',
+            'enum ExtensionId {',
+            '    kExtensionNone = 0,'])
+        output.extend([ '    %s,' % enum_name(all_field_name[ext_name]) for ext_name in sorted(all_extension_info)])
+        output.extend([
+            '    kExtensionIdCount',
+            '};',
+            ''])
+        output.extend(self.GenerateExtensionNameHash())
+
         for type in ['Instance', 'Device']:
             struct_type = '%sExtensions' % type
             if type == 'Instance':
@@ -533,59 +775,58 @@ class HelperFileOutputGenerator(OutputGenerator):
                 extension_dict = extension_dict.copy()  # Don't modify the self.<dict> we're pointing to
                 extension_dict.update(instance_extension_dict)
 
-            # Output the data member list
+            # Output the enable state, shared with the derived DeviceExtensions, and the per-extension accessors
             struct  = [struct_decl]
-            struct.extend([ '    bool %s{false};' % field_name[ext_name] for ext_name, info in extension_items])
-
-            # Create struct entries for saving extension count and extension list from DeviceCreateInfo
-            struct.extend([
-                '',
-                '    std::unordered_set<std::string> device_extension_set;'])
+            if type == 'Instance':
+                struct.extend([ '    std::bitset<kExtensionIdCount> enabled;', ''])
+            struct.extend([ '    bool %s() const { return enabled[%s]; }' % (field_name[ext_name], enum_name(field_name[ext_name])) for ext_name, info in extension_items])
 
-            # Construct the extension information map -- mapping name to data member (field), and required extensions
-            # The map is contained within a static function member for portability reasons.
+            # Construct the extension information table -- mapping name to extension id, and required extensions
+            # The table is contained within a static function member for portability reasons.
             info_type = '%sInfo' % type
-            info_map_type = '%sMap' % info_type
             req_type = '%sReq' % type
             req_vec_type = '%sVec' % req_type
             struct.extend([
                 '',
                 '    struct %s {' % req_type,
-                '        const bool %s::* enabled;' % struct_type,
+                '        const ExtensionId id;',
                 '        const char *name;',
                 '    };',
                 '    typedef std::vector<%s> %s;' % (req_type, req_vec_type),
                 '    struct %s {' % info_type,
-                '       %s(bool %s::* state_, const %s requires_): state(state_), requires(requires_) {}' % ( info_type, struct_type, req_vec_type),
-                '       bool %s::* state;' % struct_type,
+                '       %s(ExtensionId id_, const %s requires_): id(id_), requires(requires_) {}' % ( info_type, req_vec_type),
+                '       ExtensionId id;',
                 '       %s requires;' % req_vec_type,
                 '    };',
-                '',
-                '    typedef std::unordered_map<std::string,%s> %s;' % (info_type, info_map_type),
-                '    static const %s &get_info(const char *name) {' %info_type,
-                '        static const %s info_map = {' % info_map_type ])
+                ''])
 
-            field_format = '&' + struct_type + '::%s'
-            req_format = '{' + field_format+ ', %s}'
+            # Extension names are looked up through a perfect hash generated from the complete name list: bucket_seeds
+            # selects the seed for the second hash of a name, which indexes slots, holding the info_table index for that name.
+            # If no perfect hash is found, the sorted info_names are binary searched instead.
+            table_names = [ext_name for ext_name, info in extension_items]
+            perfect_hash = self.BuildExtensionPerfectHash(table_names)
+            req_format = '{%s, %s}'
             req_indent = '\n                           '
             req_join = ',' + req_indent
-            info_format = ('            std::make_pair(%s, ' + info_type + '(' + field_format + ', {%s})),')
+            info_format = '            ' + info_type + '(%s, {%s}),'
             def format_info(ext_name, info):
-                reqs = req_join.join([req_format % (field_name[req], extension_dict[req]['define']) for req in info['reqs']])
-                return info_format % (info['define'], field_name[ext_name], '{%s}' % (req_indent + reqs) if reqs else '')
+                reqs = req_join.join([req_format % (enum_name(field_name[req]), extension_dict[req]['define']) for req in info['reqs']])
+                supported = info_format % (enum_name(field_name[ext_name]), '{%s}' % (req_indent + reqs) if reqs else '')
+                if info['ifdef'] is None:
+                    return supported
+                # Extensions not supported on this platform keep their slot, as unknown extensions
+                return '\n'.join([ '#ifdef %s' % info['ifdef'], supported, '#else', info_format % ('kExtensionNone', ''), '#endif' ])
 
-            struct.extend([guarded(info['ifdef'], format_info(ext_name, info)) for ext_name, info in extension_items])
+            struct.extend([
+                '    static const %s &get_info(const char *name) {' % info_type,
+                '        static const char * const info_names[] = {'])
+            struct.extend([ '            "%s",' % ext_name for ext_name in table_names])
             struct.extend([
                 '        };',
-                '',
-                '        static const %s empty_info {nullptr, %s()};' % (info_type, req_vec_type),
-                '        %s::const_iterator info = info_map.find(name);' % info_map_type,
-                '        if ( info != info_map.cend()) {',
-                '            return info->second;',
-                '        }',
-                '        return empty_info;',
-                '    }',
-                ''])
+                '        static const %s info_table[] = {' % info_type])
+            struct.extend([format_info(ext_name, info) for ext_name, info in extension_items])
+            struct.extend([ '        };'])
+            struct.extend(self.GenerateExtensionLookup(info_type, req_vec_type, len(table_names), perfect_hash))
 
             if type == 'Instance':
                 struct.extend([
@@ -604,17 +845,12 @@ class HelperFileOutputGenerator(OutputGenerator):
                     '                                      const VkDeviceCreateInfo *pCreateInfo) {',
                     '        // Initialize: this to defaults,  base class fields to input.',
                     '        assert(instance_extensions);',
-                    '        *this = %s(*instance_extensions);' % struct_type,
-                    '',
-                    '        // Save pCreateInfo device extension list',
-                    '        for (uint32_t extn = 0; extn < pCreateInfo->enabledExtensionCount; extn++) {',
-                    '           device_extension_set.insert(pCreateInfo->ppEnabledExtensionNames[extn]);',
-                    '        }']),
+                    '        *this = %s(*instance_extensions);' % struct_type]),
 
             struct.extend([
                 '',
-                '        static const std::vector<const char *> V_1_0_promoted_%s_extensions = {' % type.lower() ])
-            struct.extend(['            %s_EXTENSION_NAME,' % ext_name.upper() for ext_name in promoted_ext_list])
+                '        static const ExtensionId V_1_0_promoted_%s_extensions[] = {' % type.lower() ])
+            struct.extend(['            %s,' % enum_name(ext_name) for ext_name in promoted_ext_list])
             struct.extend([
                 '        };',
                 '',
@@ -622,16 +858,14 @@ class HelperFileOutputGenerator(OutputGenerator):
                 '        if (pCreateInfo->ppEnabledExtensionNames) {',
                 '            for (uint32_t i = 0; i < pCreateInfo->enabledExtensionCount; i++) {',
                 '                if (!pCreateInfo->ppEnabledExtensionNames[i]) continue;',
-                '                auto info = get_info(pCreateInfo->ppEnabledExtensionNames[i]);',
-                '                if(info.state) this->*(info.state) = true;',
+                '                const auto &info = get_info(pCreateInfo->ppEnabledExtensionNames[i]);',
+                '                if (info.id) enabled.set(info.id);',
                 '            }',
                 '        }',
                 '        uint32_t api_version = NormalizeApiVersion(requested_api_version);',
                 '        if (api_version >= VK_API_VERSION_1_1) {',
                 '            for (auto promoted_ext : V_1_0_promoted_%s_extensions) {' % type.lower(),
-                '                auto info = get_info(promoted_ext);',
-                '                assert(info.state);',
-                '                if (info.state) this->*(info.state) = true;',
+                '                enabled.set(promoted_ext);',
                 '            }',
                 '        }',
                 '        return api_version;',
@@ -157,6 +157,30 @@ def makeGenOpts(args):
             valid_usage_path  = args.scripts)
           ]
 
+    # Options for parameter validation layer extension-dependent command index
+    genOpts['parameter_validation_extension_commands.h'] = [
+          ParameterValidationOutputGenerator,
+          ParameterValidationGeneratorOptions(
+            filename          = 'parameter_validation_extension_commands.h',
+            directory         = directory,
+            apiname           = 'vulkan',
+            profile           = None,
+            versions          = featuresPat,
+            emitversions      = featuresPat,
+            defaultExtensions = 'vulkan',
+            addExtensions     = addExtensionsPat,
+            removeExtensions  = removeExtensionsPat,
+            emitExtensions    = emitExtensionsPat,
+            prefixText        = prefixStrings + vkPrefixStrings,
+            apicall           = 'VKAPI_ATTR ',
+            apientry          = 'VKAPI_CALL ',
+            apientryp         = 'VKAPI_PTR *',
+            alignFuncParam    = 48,
+            expandEnumerants  = False,
+            valid_usage_path  = args.scripts,
+            header_file       = True)
+          ]
+
     # Options for unique objects layer
     genOpts['unique_objects_wrappers.h'] = [
           UniqueObjectsOutputGenerator,
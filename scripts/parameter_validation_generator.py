@@ -83,7 +83,8 @@ class ParameterValidationGeneratorOptions(GeneratorOptions):
                  indentFuncPointer = False,
                  alignFuncParam = 0,
                  expandEnumerants = True,
-                 valid_usage_path = ''):
+                 valid_usage_path = '',
+                 header_file = False):
         GeneratorOptions.__init__(self, filename, directory, apiname, profile,
                                   versions, emitversions, defaultExtensions,
                                   addExtensions, removeExtensions, emitExtensions, sortProcedure)
@@ -96,6 +97,7 @@ class ParameterValidationGeneratorOptions(GeneratorOptions):
         self.alignFuncParam  = alignFuncParam
         self.expandEnumerants = expandEnumerants
         self.valid_usage_path = valid_usage_path
+        self.header_file     = header_file
 
 # ParameterValidationOutputGenerator - subclass of OutputGenerator.
 # Generates param checker layer code.
@@ -174,6 +176,7 @@ class ParameterValidationOutputGenerator(OutputGenerator):
         self.required_extensions = dict()                 # Dictionary of required extensions for each item in the current extension
         self.extension_type = ''                          # Type of active feature (extension), device or instance
         self.extension_names = dict()                     # Dictionary of extension names to extension name defines
+        self.extension_commands = []                      # List of (command, is_instance, enable names) for extension-dependent commands
         self.structextends_list = []                      # List of extensions which extend another struct
         self.struct_feature_protect = dict()              # Dictionary of structnames and FeatureExtraProtect strings
         self.valid_vuids = set()                          # Set of all valid VUIDs
@@ -248,6 +251,7 @@ class ParameterValidationOutputGenerator(OutputGenerator):
         OutputGenerator.beginFile(self, genOpts)
 
         self.valid_usage_path = genOpts.valid_usage_path
+        self.header_file = genOpts.header_file
         vu_json_filename = os.path.join(self.valid_usage_path + os.sep, 'validusage.json')
         if os.path.isfile(vu_json_filename):
             json_file = open(vu_json_filename, 'r')
@@ -263,10 +267,22 @@ class ParameterValidationOutputGenerator(OutputGenerator):
         for json_vuid_string in self.ExtractVUIDs(self.vuid_dict):
             self.valid_vuids.add(json_vuid_string)
         #
+        # Build the extension name to name define index once, rather than searching the registry for every dependency
+        for extension in self.registry.extensions:
+            self.extension_names[extension.get('name')] = extension[0][1].get('name')
+        #
         # User-supplied prefix text, if any (list of strings)
         s = self.GenerateCopyright()
         write(s, file=self.outFile)
         #
+        # The header only declares the extension-dependent command index, sizing the bitsets in parameter_validation.h
+        if self.header_file:
+            write('#pragma once', file=self.outFile)
+            self.newline()
+            write('namespace parameter_validation {', file = self.outFile)
+            self.newline()
+            return
+        #
         # Headers
         write('#include <string>', file=self.outFile)
         self.newline()
@@ -295,6 +311,11 @@ class ParameterValidationOutputGenerator(OutputGenerator):
     #
     # Called at end-time for final content output
     def endFile(self):
+        if self.header_file:
+            write(self.GenerateExtensionCommandEnum(), file=self.outFile)
+            write('} // namespace parameter_validation', file = self.outFile)
+            OutputGenerator.endFile(self)
+            return
         # C-specific
         self.newline()
         write(self.enumValueLists, file=self.outFile)
@@ -350,6 +371,8 @@ class ParameterValidationOutputGenerator(OutputGenerator):
         ext_template += '}\n'
         write(ext_template, file=self.outFile)
         self.newline()
+        write(self.GenerateExtensionCommandEnables(), file=self.outFile)
+        self.newline()
         commands_text = '\n'.join(self.validation)
         write(commands_text, file=self.outFile)
         self.newline()
@@ -382,10 +405,6 @@ class ParameterValidationOutputGenerator(OutputGenerator):
         # Get base list of extension dependencies for all items in this extension
         base_required_extensions = []
         if "VK_VERSION_1" not in self.featureName:
-            # Save Name Define to get correct enable name later
-            nameElem = interface[0][1]
-            name = nameElem.get('name')
-            self.extension_names[self.featureName] = name
             # This extension is the first dependency for this command
             base_required_extensions.append(self.featureName)
         # Add any defined extension dependencies to the base dependency list for this extension
@@ -1229,6 +1248,34 @@ class ParameterValidationOutputGenerator(OutputGenerator):
             lines.append('// No xml-driven validation\n')
         return lines, unused
     #
+    # Generate the index of extension-dependent commands, written to the header so it can size the enabled-command bitsets
+    def GenerateExtensionCommandEnum(self):
+        enum  = '// Extension-dependent commands, indexing layer_data and instance_layer_data extension_command_enables\n'
+        enum += 'enum ExtensionCommand {\n'
+        for command in self.extension_commands:
+            enum += '    kExtensionCommand_%s,\n' % command[0]
+        enum += '    kExtensionCommandCount\n'
+        enum += '};\n'
+        return enum
+    #
+    # Generate the routines that fill in the per-instance and per-device enabled-command bitsets from the enabled
+    # extensions at create time
+    def GenerateExtensionCommandEnables(self):
+        enables = ''
+        for level, data_type, data_name in [(True, 'instance_layer_data', 'instance_data'), (False, 'layer_data', 'device_data')]:
+            commands = [command for command in self.extension_commands if command[1] == level]
+            func_name = 'InitInstanceExtensionCommandEnables' if level else 'InitDeviceExtensionCommandEnables'
+            enables += 'void %s(%s *%s) {\n' % (func_name, data_type, data_name)
+            enables += '    auto &enables = %s->extension_command_enables;\n' % data_name
+            enables += '    enables.reset();\n'
+            if commands:
+                enables += '    const auto &extensions = %s->extensions;\n' % data_name
+            for name, _, enable_names in commands:
+                enable_expr = ' && '.join(['extensions.%s()' % enable_name for enable_name in enable_names])
+                enables += '    enables[kExtensionCommand_%s] = %s;\n' % (name, enable_expr)
+            enables += '}\n\n'
+        return enables
+    #
     # Generate the struct member check code from the captured data
     def processStructMemberData(self):
         indent = self.incIndent(None)
@@ -1251,18 +1298,17 @@ class ParameterValidationOutputGenerator(OutputGenerator):
             lines, unused = self.genFuncBody(command.name, command.params[startIndex:], '', '', None)
             # Cannot validate extension dependencies for device extension APIs having a physical device as their dispatchable object
             if (command.name in self.required_extensions) and (self.extension_type != 'device' or command.params[0].type != 'VkPhysicalDevice'):
-                ext_test = ''
+                is_instance = command.params[0].type in ["VkInstance", "VkPhysicalDevice"]
+                enable_names = []
+                ext_test = ['if (!local_data->extension_command_enables[kExtensionCommand_%s]) {\n' % command.name]
                 for ext in self.required_extensions[command.name]:
-                    ext_name_define = ''
-                    ext_enable_name = ''
-                    for extension in self.registry.extensions:
-                        if extension.attrib['name'] == ext:
-                            ext_name_define = extension[0][1].get('name')
-                            ext_enable_name = ext_name_define.lower()
-                            ext_enable_name = re.sub('_extension_name', '', ext_enable_name)
-                            break
-                    ext_test = 'if (!local_data->extensions.%s) skip |= OutputExtensionError(local_data, "%s", %s);\n' % (ext_enable_name, command.name, ext_name_define)
-                    lines.insert(0, ext_test)
+                    ext_name_define = self.extension_names.get(ext, '')
+                    ext_enable_name = re.sub('_extension_name', '', ext_name_define.lower())
+                    enable_names.append(ext_enable_name)
+                    ext_test.append('    if (!local_data->extensions.%s()) skip |= OutputExtensionError(local_data, "%s", %s);\n' % (ext_enable_name, command.name, ext_name_define))
+                ext_test.append('}\n')
+                lines.insert(0, ext_test)
+                self.extension_commands.append((command.name, is_instance, enable_names))
             if lines:
                 cmdDef = self.getCmdDef(command) + '\n'
                 # For a validation-only routine, change the function declaration
@@ -34,60 +34,251 @@
 #       --fail_on_unexpected causes the script to exit with a non-zero exit code if
 #       a test printed unexpected errors
 #
+#   or, to run the tests on every device profile concurrently and parse their output:
+#       python3 parse_test_results.py --run ./build/tests/vk_layer_validation_tests
+#       --layer_path DEVSIM_AND_VALIDATION_PATHS --icd MOCK_ICD_PATH [--jobs N]
+#       [--profiles PROFILE ...] [--fail_on_skip] [--fail_on_unexpected]
+#
+#       --jobs limits the number of test processes run at once, defaulting to the
+#       number of CPUs. --profiles defaults to tests/device_profiles/*.json
+#
+#       If a test crashes, the test process is restarted to run the tests after it.
+#
+#       --shards N splits each profile's run across N test processes. Given a
+#       --durations file saved from an earlier run with --save_durations, the tests
+#       are assigned to shards so that each takes about the same time. Otherwise
+#       gtest's own GTEST_TOTAL_SHARDS/GTEST_SHARD_INDEX sharding is used.
+#
+#   Test durations reported by gtest are recorded in either mode:
+#       --slowest N reports the N slowest tests, with the profile they ran on
+#
+#       --history FILE appends the durations from this run to a json history file,
+#       keeping the most recent --history_runs runs, and reports tests which took
+#       more than --regression_threshold percent longer than their median duration
+#       in earlier runs. With --run, the history is also used to balance shards.
+#
+#   Structured results can be written in either mode:
+#       --junit FILE writes a JUnit XML report, with a test suite per profile
+#
+#       --json FILE writes a json report of each test's status, unexpected errors
+#       and duration on each profile, followed by the summary counts
+#
 
 import argparse
+import glob
+import heapq
+import json
+import os
 import re
+import shlex
+import statistics
+import subprocess
 import sys
-from collections import defaultdict
+import time
+from collections import deque
+from xml.sax.saxutils import escape, quoteattr
+from concurrent.futures import ThreadPoolExecutor
+
+# Durations shorter than this are too noisy to report as regressions
+min_regression_ms = 10
 
 class OutputStats(object):
+    # A single regex matches every kind of line the parser acts on. The name of the alternative that
+    # matched selects the handler, so each line is searched only once. Alternatives are grouped by their
+    # first character, which is kept outside the named groups so the regex engine can skip quickly to
+    # the characters that may start a match.
+    line_regex = re.compile(r'\[(?:(?P<test_suite_end>-*\])'
+                            r'|(?P<start_test> RUN\s*\] (?P<test>.*))'
+                            r'|(?P<pass_test>\s*OK \](?:.*\((?P<pass_ms>\d+) ms\))?)'
+                            r'|(?P<fail_test>\s*FAILED\s*\](?:.*\((?P<fail_ms>\d+) ms\))?))'
+                            r'|T(?:(?P<new_profile>esting with profile .*/(?P<profile>.*))'
+                            r'|(?P<skip_test>EST SKIPPED))'
+                            r'|U(?P<unexpected_error>nexpected: )')
+    # Handlers for lines which are seen before the line is added to the current test's output
+    pre_output_handlers = ('new_profile', 'test_suite_end', 'start_test')
+    # Number of lines of output kept for the current test, to be printed if it crashes
+    max_test_output_lines = 1000
+
+    # Each test's results are packed into one integer, with result_bits bits per profile holding a result
+    # code in the low bits and the unexpected errors flag above it
+    NO_RESULT, PASS, FAIL, SKIP, CRASH = range(5)
+    RESULT_MASK = 0x7
+    UNEXPECTED = 0x8
+    result_bits = 4
+
     def __init__(self):
+        self.test_names = []
+        self.test_ids = {}
+        self.test_results = []  # Packed results of each test, indexed by test id
+        self.profile_names = []
+        self.profile_ids = {}
+        self.test_durations = []    # Maps test id to duration in ms of each test run, indexed by profile id
+        self.description = ""       # Names the test run being parsed, when reporting a crash
+        self.crashed_runs = []      # Descriptions of test processes which crashed outside of any test
+        self.summary = {}           # Counts of tests by overall result, set by print_summary
         self.current_profile = ""
+        self.current_profile_id = self.intern_profile("")
         self.current_test = ""
-        self.current_test_output = ""
-        self.test_results = defaultdict(defaultdict)
-        self.unexpected_errors = defaultdict(defaultdict)
+        self.current_test_id = self.intern_test("")
+        self.current_test_output = deque(maxlen=self.max_test_output_lines)
+        self.handlers = {
+            'new_profile': self.new_profile_match,
+            'test_suite_end': self.test_suite_end_match,
+            'start_test': self.start_test_match,
+            'skip_test': self.skip_test_match,
+            'pass_test': self.pass_test_match,
+            'fail_test': self.fail_test_match,
+            'unexpected_error': self.unexpected_error_match,
+        }
 
     def match(self, line):
-        self.new_profile_match(line)
-        self.test_suite_end_match(line)
-        self.start_test_match(line)
+        found = self.line_regex.search(line)
+        # Unexpected errors are only reported at the start of a line
+        while found is not None and found.lastgroup == 'unexpected_error' and found.start() != 0:
+            found = self.line_regex.search(line, found.end())
+        if found is not None and found.lastgroup in self.pre_output_handlers:
+            self.handlers[found.lastgroup](found)
+            found = None
         if self.current_test != "":
-            self.current_test_output += line
-        self.skip_test_match(line)
-        self.pass_test_match(line)
-        self.fail_test_match(line)
-        self.unexpected_error_match(line)
+            self.current_test_output.append(line)
+        if found is not None:
+            self.handlers[found.lastgroup](found)
 
-    def print_summary(self, skip_is_failure, unexpected_is_failure):
+    # Return the id of a test name, adding it if not yet seen. Test names are stored once, and results
+    # are indexed by test id.
+    def intern_test(self, test_name):
+        test_id = self.test_ids.get(test_name)
+        if test_id is None:
+            test_id = len(self.test_names)
+            self.test_ids[test_name] = test_id
+            self.test_names.append(test_name)
+            self.test_results.append(0)
+        return test_id
+
+    # Return the id of a profile name, adding it if not yet seen
+    def intern_profile(self, profile):
+        profile_id = self.profile_ids.get(profile)
+        if profile_id is None:
+            profile_id = len(self.profile_names)
+            self.profile_ids[profile] = profile_id
+            self.profile_names.append(profile)
+            self.test_durations.append({})
+        return profile_id
+
+    # Return the result code and unexpected errors flag bits of a test on a profile
+    def result(self, test_id, profile_id):
+        return (self.test_results[test_id] >> (profile_id * self.result_bits)) & ((1 << self.result_bits) - 1)
+
+    # Replace the result code of the current test on the current profile, keeping its unexpected errors flag
+    def set_result(self, code):
+        shift = self.current_profile_id * self.result_bits
+        packed = self.test_results[self.current_test_id] & ~(self.RESULT_MASK << shift)
+        self.test_results[self.current_test_id] = packed | (code << shift)
+
+    # Add the results of another OutputStats, such as one parsing the output from other profiles.
+    # Results the other has for a test and profile replace any already recorded here.
+    def merge(self, other):
+        all_bits = (1 << self.result_bits) - 1
+        self.crashed_runs.extend(other.crashed_runs)
+        profile_map = [self.intern_profile(profile) for profile in other.profile_names]
+        for other_test_id, test_name in enumerate(other.test_names):
+            if other.test_results[other_test_id] == 0:
+                continue
+            test_id = self.intern_test(test_name)
+            for other_profile_id, profile_id in enumerate(profile_map):
+                result = other.result(other_test_id, other_profile_id)
+                if result != 0:
+                    shift = profile_id * self.result_bits
+                    packed = self.test_results[test_id] & ~(all_bits << shift)
+                    self.test_results[test_id] = packed | (result << shift)
+            for other_profile_id, profile_id in enumerate(profile_map):
+                if other_test_id in other.test_durations[other_profile_id]:
+                    self.test_durations[profile_id][test_id] = other.test_durations[other_profile_id][other_test_id]
+
+    # Called at the end of the output, to check for a test which never finished. Given the exit code of the test
+    # process, also checks that the process did not crash outside of a test.
+    def finish(self, returncode=None):
         if self.current_test != "":
             self.test_died()
+        # gtest exits with 1 if any test failed, so only other codes indicate a crash
+        elif returncode is not None and returncode not in (0, 1):
+            self.test_died(returncode)
+
+    # Return the names of the tests with a result on the current profile
+    def completed_tests(self):
+        shift = self.current_profile_id * self.result_bits
+        return [test_name for test_id, test_name in enumerate(self.test_names)
+                if (self.test_results[test_id] >> shift) & self.RESULT_MASK != self.NO_RESULT]
+
+    # Return a dict mapping each test name to a dict of its durations in ms on each profile
+    def durations(self):
+        durations = {}
+        for profile_id, profile in enumerate(self.profile_names):
+            for test_id, duration in self.test_durations[profile_id].items():
+                durations.setdefault(self.test_names[test_id], {})[profile] = duration
+        return durations
+
+    # Write the test durations, to be used to balance the shards of later runs
+    def save_durations(self, filename):
+        with open(filename, 'w') as durations_file:
+            json.dump({'durations': self.durations()}, durations_file, indent=1, sort_keys=True)
+
+    # Print the count slowest test runs, with the profile each ran on
+    def print_slowest(self, count):
+        runs = []
+        for profile_id, profile in enumerate(self.profile_names):
+            for test_id, duration in self.test_durations[profile_id].items():
+                runs.append((duration, self.test_names[test_id], profile))
+        print("SLOWEST TESTS:")
+        for duration, test_name, profile in heapq.nlargest(count, runs):
+            print("%8d ms" % duration, test_name, "(%s)" % profile if profile != "" else "")
+
+    def print_summary(self, skip_is_failure, unexpected_is_failure):
+        self.finish()
 
         passed_tests = 0
         skipped_tests = 0
         failed_tests = 0
+        crashed_tests = 0
         unexpected_error_tests = 0
         did_fail = False
 
-        for test_name, results in self.test_results.items():
+        num_tests = 0
+        for test_id, test_name in enumerate(self.test_names):
+            if self.test_results[test_id] == 0:
+                continue
+            result_profiles = 0
             skipped_profiles = 0
             passed_profiles = 0
             failed_profiles = 0
-            aborted_profiles = 0
+            crashed_profiles = 0
             unexpected_error_profiles = 0
-            for profile, result in results.items():
-                if result == "pass":
+            for profile_id in range(len(self.profile_names)):
+                result = self.result(test_id, profile_id)
+                code = result & self.RESULT_MASK
+                if code == self.NO_RESULT:
+                    continue
+                result_profiles += 1
+                if code == self.PASS:
                     passed_profiles += 1
-                if result == "fail":
+                if code == self.FAIL:
                     failed_profiles += 1
-                if result == "skip":
+                if code == self.SKIP:
                     skipped_profiles += 1
-                if self.unexpected_errors.get(test_name, {}).get(profile, "") == "true":
+                if code == self.CRASH:
+                    crashed_profiles += 1
+                if result & self.UNEXPECTED:
                     unexpected_error_profiles += 1
-            if failed_profiles != 0:
+            if result_profiles == 0:
+                continue
+            num_tests += 1
+            if crashed_profiles != 0:
+                print("TEST CRASHED:", test_name)
+                crashed_tests += 1
+            elif failed_profiles != 0:
                 print("TEST FAILED:", test_name)
                 failed_tests += 1
-            elif skipped_profiles == len(results):
+            elif skipped_profiles == result_profiles:
                 print("TEST SKIPPED ALL DEVICES:", test_name)
                 skipped_tests += 1
             else:
@@ -95,7 +286,11 @@ class OutputStats(object):
             if unexpected_error_profiles != 0:
                 print("UNEXPECTED ERRORS:", test_name)
                 unexpected_error_tests += 1
-        num_tests = len(self.test_results)
+        for description in self.crashed_runs:
+            print("TESTS CRASHED%s" % description)
+        self.summary = {'tests': num_tests, 'passed': passed_tests, 'never_ran': skipped_tests, 'failed': failed_tests,
+                        'crashed': crashed_tests, 'crashed_outside_tests': len(self.crashed_runs),
+                        'unexpected_errors': unexpected_error_tests}
         print("PASSED: ", passed_tests, "/", num_tests, " tests")
         if skipped_tests != 0:
             did_fail |= skip_is_failure
@@ -103,55 +298,290 @@ class OutputStats(object):
         if failed_tests != 0:
             did_fail = True
             print("FAILED: ", failed_tests, "/", num_tests, "tests")
+        if crashed_tests != 0 or len(self.crashed_runs) != 0:
+            did_fail = True
+            print("CRASHED: ", crashed_tests, "/", num_tests, "tests,", len(self.crashed_runs), "outside of tests")
         if unexpected_error_tests != 0:
             did_fail |= unexpected_is_failure
             print("UNEXPECTED OUPUT: ", unexpected_error_tests, "/", num_tests, "tests")
         return did_fail
 
-    def new_profile_match(self, line):
-        if re.search(r'Testing with profile .*/(.*)', line) != None:
-            self.current_profile = re.search(r'Testing with profile .*/(.*)', line).group(1)
-
-    def test_suite_end_match(self, line):
-        if re.search(r'\[-*\]', line) != None:
-            if self.current_test != "":
-                # Here we see a message that starts [----------] before another test
-                # finished running. This should mean that that other test died.
-                self.test_died()
-
-    def start_test_match(self, line):
-        if re.search(r'\[ RUN\s*\]', line) != None:
-            # This parser doesn't handle the case where one test's start comes between another
-            # test's start and result.
-            assert self.current_test == ""
-            self.current_test = re.search(r'] (.*)', line).group(1)
-            self.current_test_output = ""
-
-    def skip_test_match(self, line):
-        if re.search(r'TEST SKIPPED', line) != None:
-            self.test_results[self.current_test][self.current_profile] = "skip"
-
-    def pass_test_match(self, line):
-        if re.search(r'\[\s*OK \]', line) != None:
-            # If gtest says the test passed, check if it was skipped before marking it passed
-            if self.test_results.get(self.current_test, {}).get(self.current_profile, "") != "skip":
-                    self.test_results[self.current_test][self.current_profile] = "pass"
-            self.current_test = ""
-
-    def fail_test_match(self, line):
-        if re.search(r'\[\s*FAILED\s*\]', line) != None and self.current_test != "":
-            self.test_results[self.current_test][self.current_profile] = "fail"
-            self.current_test = ""
-
-    def unexpected_error_match(self, line):
-        if re.search(r'^Unexpected: ', line) != None:
-            self.unexpected_errors[self.current_test][self.current_profile] = "true"
-
-    def test_died(self):
-        print("A test likely crashed. Testing is being aborted.")
+    # Write a JUnit XML report with a test suite for each profile. The report is written test by test, after a
+    # pass over the packed results to count each suite's tests for its attributes.
+    def write_junit(self, filename):
+        status_tags = {self.FAIL: '<failure message="failed"/>', self.SKIP: '<skipped/>',
+                       self.CRASH: '<error message="crashed"/>'}
+        with open(filename, 'w', encoding='utf-8') as junit_file:
+            junit_file.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites name="vk_layer_validation_tests">\n')
+            for profile_id, profile in enumerate(self.profile_names):
+                counts = [0] * (self.CRASH + 1)
+                for test_id in range(len(self.test_names)):
+                    counts[self.result(test_id, profile_id) & self.RESULT_MASK] += 1
+                tests = sum(counts) - counts[self.NO_RESULT]
+                if tests == 0:
+                    continue
+                junit_file.write('<testsuite name=%s tests="%d" failures="%d" errors="%d" skipped="%d">\n' %
+                                 (quoteattr(profile), tests, counts[self.FAIL], counts[self.CRASH], counts[self.SKIP]))
+                for test_id, test_name in enumerate(self.test_names):
+                    result = self.result(test_id, profile_id)
+                    code = result & self.RESULT_MASK
+                    if code == self.NO_RESULT:
+                        continue
+                    fixture, _, name = test_name.rpartition('.')
+                    duration = self.test_durations[profile_id].get(test_id, 0) / 1000.0
+                    junit_file.write('  <testcase classname=%s name=%s time="%.3f">' %
+                                     (quoteattr(fixture), quoteattr(name), duration))
+                    junit_file.write(status_tags.get(code, ''))
+                    if result & self.UNEXPECTED:
+                        junit_file.write('<system-out>%s</system-out>' % escape("Unexpected errors were reported"))
+                    junit_file.write('</testcase>\n')
+                junit_file.write('</testsuite>\n')
+            junit_file.write('</testsuites>\n')
+
+    # Write a json report of each test's results on each profile, followed by the summary. Each test is
+    # written as it is visited, so the whole report is never held in memory.
+    def write_json(self, filename):
+        status_names = {self.PASS: 'pass', self.FAIL: 'fail', self.SKIP: 'skip', self.CRASH: 'crash'}
+        with open(filename, 'w', encoding='utf-8') as json_file:
+            json_file.write('{"tests": [')
+            separator = '\n'
+            for test_id, test_name in enumerate(self.test_names):
+                profiles = {}
+                for profile_id, profile in enumerate(self.profile_names):
+                    result = self.result(test_id, profile_id)
+                    if result & self.RESULT_MASK == self.NO_RESULT:
+                        continue
+                    profiles[profile] = {'status': status_names[result & self.RESULT_MASK],
+                                         'unexpected_errors': bool(result & self.UNEXPECTED),
+                                         'duration_ms': self.test_durations[profile_id].get(test_id)}
+                if len(profiles) == 0:
+                    continue
+                json_file.write(separator)
+                json.dump({'name': test_name, 'profiles': profiles}, json_file)
+                separator = ',\n'
+            json_file.write('\n],\n"crashed_runs": %s,\n"summary": %s}\n' %
+                            (json.dumps(self.crashed_runs), json.dumps(self.summary)))
+
+    def new_profile_match(self, found):
+        self.start_profile(found.group('profile'))
+
+    def start_profile(self, profile):
+        self.current_profile = profile
+        self.current_profile_id = self.intern_profile(profile)
+
+    def test_suite_end_match(self, found):
+        if self.current_test != "":
+            # Here we see a message that starts [----------] before another test
+            # finished running. This should mean that that other test died.
+            self.test_died()
+
+    def start_test_match(self, found):
+        # One test's start between another test's start and result means that other test died
+        if self.current_test != "":
+            self.test_died()
+        self.current_test = found.group('test')
+        self.current_test_id = self.intern_test(self.current_test)
+        self.current_test_output.clear()
+
+    def skip_test_match(self, found):
+        self.set_result(self.SKIP)
+
+    def pass_test_match(self, found):
+        # If gtest says the test passed, check if it was skipped before marking it passed
+        if self.result(self.current_test_id, self.current_profile_id) & self.RESULT_MASK != self.SKIP:
+            self.set_result(self.PASS)
+        self.record_duration(found.group('pass_ms'))
+        self.end_test()
+
+    def fail_test_match(self, found):
+        if self.current_test != "":
+            self.set_result(self.FAIL)
+            self.record_duration(found.group('fail_ms'))
+            self.end_test()
+
+    def unexpected_error_match(self, found):
+        shift = self.current_profile_id * self.result_bits
+        self.test_results[self.current_test_id] |= self.UNEXPECTED << shift
+
+    def record_duration(self, duration):
+        if duration is not None:
+            self.test_durations[self.current_profile_id][self.current_test_id] = int(duration)
+
+    def end_test(self):
+        self.current_test = ""
+        self.current_test_id = self.test_ids[""]
+
+    # Record a crash, either of the current test or, if no test is running, of the test process, and
+    # continue with the rest of the output
+    def test_died(self, returncode=None):
+        if self.current_test == "":
+            print("The test process%s crashed with exit code %d." % (self.description, returncode))
+            self.crashed_runs.append("%s with exit code %d" % (self.description, returncode))
+            return
+        print("A test likely crashed%s: %s" % (self.description, self.current_test))
         print("Final test output: ")
-        print(self.current_test_output)
-        sys.exit(1)
+        print("".join(self.current_test_output))
+        self.set_result(self.CRASH)
+        self.end_test()
+
+# Return the environment for running the tests on a device profile
+def test_environment(profile, layer_path, icd_filenames):
+    env = dict(os.environ)
+    env['VK_DEVSIM_FILE'] = profile
+    if layer_path is not None:
+        env['VK_LAYER_PATH'] = layer_path
+    if icd_filenames is not None:
+        env['VK_ICD_FILENAMES'] = icd_filenames
+    return env
+
+# Run the tests on a profile in one test process, parsing its output as it is produced. tests lists the tests
+# to run, or is None to run all tests, or those of the gtest shard given in env. If a test crashes, the process
+# is restarted to run the tests which have not completed.
+def run_tests(profile, test_command, env, description, tests=None):
+    stats = OutputStats()
+    stats.description = description
+    stats.start_profile(os.path.basename(profile))
+    command = test_command
+    if tests is not None:
+        command = test_command + ['--gtest_filter=' + ':'.join(tests)]
+    while True:
+        with subprocess.Popen(command, env=env, stdout=subprocess.PIPE, universal_newlines=True,
+                              errors='replace') as process:
+            for line in process.stdout:
+                stats.match(line)
+        test_crashed = stats.current_test != ""
+        stats.finish(process.returncode)
+        if not test_crashed:
+            break
+        completed_tests = stats.completed_tests()
+        if tests is None and 'GTEST_TOTAL_SHARDS' in env:
+            # Excluding tests would change gtest's assignment of tests to shards, so list this shard's tests
+            tests = gtest_shard_tests(test_command, env)
+            env = dict(env)
+            del env['GTEST_TOTAL_SHARDS']
+            del env['GTEST_SHARD_INDEX']
+        if tests is None:
+            command = test_command + ['--gtest_filter=-' + ':'.join(completed_tests)]
+        else:
+            completed_tests = set(completed_tests)
+            remaining = [test for test in tests if test not in completed_tests]
+            if len(remaining) == 0:
+                break
+            command = test_command + ['--gtest_filter=' + ':'.join(remaining)]
+        print("Restarting the tests%s after the crash, with %d tests completed" % (description, len(completed_tests)))
+    return stats
+
+# Return the names of all tests, as listed by the test binary
+def list_tests(test_command, env):
+    output = subprocess.check_output(test_command + ['--gtest_list_tests'], env=env, universal_newlines=True)
+    tests = []
+    fixture = ""
+    for line in output.splitlines():
+        if line.strip() == "":
+            continue
+        if line.startswith(' '):
+            tests.append(fixture + line.split()[0])
+        else:
+            fixture = line.split()[0]
+    return tests
+
+# Return the tests gtest runs in the shard given by GTEST_TOTAL_SHARDS and GTEST_SHARD_INDEX in env. gtest
+# numbers the enabled tests in order and runs those whose number modulo the shard count is the shard index.
+def gtest_shard_tests(test_command, env):
+    unsharded_env = dict(env)
+    total_shards = int(unsharded_env.pop('GTEST_TOTAL_SHARDS'))
+    shard_index = int(unsharded_env.pop('GTEST_SHARD_INDEX'))
+    tests = [test for test in list_tests(test_command, unsharded_env) if 'DISABLED_' not in test]
+    return tests[shard_index::total_shards]
+
+# Load test durations saved by an earlier run, as a dict mapping test name to a dict of durations by profile.
+# The file may be a durations file or a history file, in which case the most recent run is used.
+def load_durations(filename):
+    with open(filename) as durations_file:
+        saved = json.load(durations_file)
+    if 'runs' in saved:
+        return saved['runs'][-1]['durations'] if len(saved['runs']) > 0 else {}
+    return saved['durations']
+
+# Append the durations of this run to a history file, keeping the most recent max_runs runs, and return the
+# earlier runs' durations. The file is written with sorted keys, so consecutive versions diff cleanly.
+def update_history(filename, durations, max_runs):
+    runs = []
+    if os.path.isfile(filename):
+        with open(filename) as history_file:
+            runs = json.load(history_file)['runs']
+    earlier_runs = [run['durations'] for run in runs]
+    runs.append({'date': time.strftime('%Y-%m-%dT%H:%M:%S'), 'durations': durations})
+    with open(filename + '.tmp', 'w') as history_file:
+        json.dump({'runs': runs[-max_runs:]}, history_file, indent=1, sort_keys=True)
+    os.replace(filename + '.tmp', filename)
+    return earlier_runs
+
+# Print the tests which took more than threshold percent longer on a profile than their median duration in
+# earlier runs, as these point to performance regressions in the layers
+def print_regressions(earlier_runs, durations, threshold):
+    regressions = []
+    for test_name, profiles in durations.items():
+        for profile, duration in profiles.items():
+            earlier = [run[test_name][profile] for run in earlier_runs
+                       if profile in run.get(test_name, {})]
+            if len(earlier) == 0:
+                continue
+            baseline = statistics.median(earlier)
+            if duration >= min_regression_ms and duration > baseline * (1 + threshold / 100.0):
+                regressions.append((test_name, profile, baseline, duration))
+    for test_name, profile, baseline, duration in sorted(regressions):
+        print("TEST SLOWER:", test_name, "(%s)" % profile if profile != "" else "",
+              "%d ms -> %d ms" % (baseline, duration))
+    if len(regressions) != 0:
+        print("SLOWER: ", len(regressions), "test runs more than", threshold, "percent slower than in earlier runs")
+
+# Split tests into shard_count shards of about the same total duration on a profile, returning a list of the
+# tests in each shard. Each test, longest first, goes to the shard with the least total duration so far.
+# Tests with no duration on this profile use their average duration on other profiles, or failing that, the
+# average of all known durations.
+def balance_shards(tests, durations, profile, shard_count):
+    estimates = {}
+    for test in tests:
+        if test in durations and len(durations[test]) > 0:
+            test_durations = durations[test]
+            estimates[test] = test_durations.get(profile, sum(test_durations.values()) / len(test_durations))
+    default_estimate = sum(estimates.values()) / len(estimates) if len(estimates) > 0 else 1
+    shard_tests = [[] for shard in range(shard_count)]
+    shard_loads = [(0, shard) for shard in range(shard_count)]
+    for test in sorted(tests, key=lambda test: (-estimates.get(test, default_estimate), test)):
+        load, shard = heapq.heappop(shard_loads)
+        shard_tests[shard].append(test)
+        heapq.heappush(shard_loads, (load + estimates.get(test, default_estimate), shard))
+    return shard_tests
+
+# Run the tests on each device profile, split into shard_count processes per profile, with up to jobs test
+# processes at once, and merge their results in profile order. If durations from an earlier run are given, each
+# process runs a list of tests balanced by duration; otherwise gtest's own sharding is used.
+def run_profiles(profiles, test_command, layer_path, icd_filenames, jobs, shard_count=1, durations=None):
+    runs = []
+    if shard_count > 1 and durations is not None and len(profiles) > 0:
+        tests = list_tests(test_command, test_environment(profiles[0], layer_path, icd_filenames))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for profile in profiles:
+            env = test_environment(profile, layer_path, icd_filenames)
+            if shard_count == 1:
+                runs.append(pool.submit(run_tests, profile, test_command, env, " on profile %s" % profile))
+                continue
+            if durations is not None:
+                shard_tests = balance_shards(tests, durations, os.path.basename(profile), shard_count)
+            for shard in range(shard_count):
+                description = " on profile %s, shard %d of %d" % (profile, shard + 1, shard_count)
+                if durations is not None:
+                    if len(shard_tests[shard]) != 0:
+                        runs.append(pool.submit(run_tests, profile, test_command, env, description, shard_tests[shard]))
+                else:
+                    shard_env = dict(env, GTEST_TOTAL_SHARDS=str(shard_count), GTEST_SHARD_INDEX=str(shard))
+                    runs.append(pool.submit(run_tests, profile, test_command, shard_env, description))
+        stats = OutputStats()
+        for run in runs:
+            stats.merge(run.result())
+    return stats
 
 def main():
     parser = argparse.ArgumentParser(description='Parse the output from validation layer tests.')
@@ -159,12 +589,60 @@ def main():
                         "non-zero exit code if a test didn't run on any device profile.")
     parser.add_argument('--fail_on_unexpected', action='store_true', help="Makes the script exit "
                         "with a non-zero exit code if a test causes unexpected errors.")
+    parser.add_argument('--run', metavar='TEST_BINARY', help="Run TEST_BINARY on each device profile "
+                        "and parse its output, instead of parsing standard input.")
+    parser.add_argument('--test_args', default='--devsim', help="Arguments passed to TEST_BINARY.")
+    parser.add_argument('--profiles', nargs='+', metavar='PROFILE', help="Device profiles to run the tests on, "
+                        "defaulting to tests/device_profiles/*.json.")
+    parser.add_argument('--layer_path', help="VK_LAYER_PATH for the test runs, containing the device "
+                        "simulation and validation layers.")
+    parser.add_argument('--icd', help="VK_ICD_FILENAMES for the test runs, usually the mock ICD.")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count(), help="Maximum number of test "
+                        "processes to run at once.")
+    parser.add_argument('--shards', type=int, default=1, help="Number of test processes to split the tests "
+                        "into for each device profile.")
+    parser.add_argument('--durations', help="Test durations saved by an earlier run with --save_durations, "
+                        "used to balance the shards.")
+    parser.add_argument('--save_durations', help="Save the test durations from this run to a file.")
+    parser.add_argument('--slowest', type=int, default=0, metavar='N', help="Report the N slowest tests.")
+    parser.add_argument('--history', help="Append the test durations from this run to a json history "
+                        "file, and report tests which got slower.")
+    parser.add_argument('--history_runs', type=int, default=10, help="Number of runs kept in the history file.")
+    parser.add_argument('--junit', help="Write the results to a JUnit XML file.")
+    parser.add_argument('--json', help="Write the results to a json file.")
+    parser.add_argument('--regression_threshold', type=float, default=50, help="Percentage by which a "
+                        "test must be slower than its median duration in the history to be reported.")
     args = parser.parse_args()
 
-    stats = OutputStats()
-    for line in sys.stdin:
-        stats.match(line)
+    if args.run is not None:
+        profiles = args.profiles
+        if profiles is None:
+            profile_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'device_profiles')
+            profiles = sorted(glob.glob(os.path.join(profile_dir, '*.json')))
+        test_command = [args.run] + shlex.split(args.test_args)
+        durations = None
+        durations_file = args.durations if args.durations is not None else args.history
+        if durations_file is not None and os.path.isfile(durations_file):
+            durations = load_durations(durations_file)
+        stats = run_profiles(profiles, test_command, args.layer_path, args.icd, max(1, args.jobs),
+                             max(1, args.shards), durations)
+    else:
+        stats = OutputStats()
+        for line in sys.stdin:
+            stats.match(line)
     failed = stats.print_summary(args.fail_on_skip, args.fail_on_unexpected)
+    if args.junit is not None:
+        stats.write_junit(args.junit)
+    if args.json is not None:
+        stats.write_json(args.json)
+    if args.slowest > 0:
+        stats.print_slowest(args.slowest)
+    if args.save_durations is not None:
+        stats.save_durations(args.save_durations)
+    if args.history is not None:
+        durations = stats.durations()
+        earlier_runs = update_history(args.history, durations, max(1, args.history_runs))
+        print_regressions(earlier_runs, durations, args.regression_threshold)
     if failed == True:
         print("\nFAILED CI")
         sys.exit(1)
@@ -0,0 +1,236 @@
+#!/usr/bin/python3 -i
+#
+# Copyright (c) 2015-2018 The Khronos Group Inc.
+# Copyright (c) 2015-2018 Valve Corporation
+# Copyright (c) 2015-2018 LunarG, Inc.
+# Copyright (c) 2015-2018 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Tests for the extension name perfect hash and the enum string conversions generated by helper_file_generator.py.
+#
+# The generator imports generator.py from the Vulkan registry. If it cannot be found, a minimal stand-in is used, as
+# these tests only exercise the generator's own helpers. Set VULKAN_REGISTRY to the directory holding generator.py and
+# vk.xml (the VulkanRegistry_DIR used by the build) to also test the extension lists from vk.xml. Tests of generated
+# code compile and run it, and are skipped if no C/C++ compiler is found.
+
+import itertools
+import os
+import shutil
+import subprocess
+import sys
+import types
+import xml.etree.ElementTree as etree
+
+import pytest
+
+registry_dir = os.environ.get('VULKAN_REGISTRY', os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, registry_dir)
+try:
+    import generator
+except ImportError:
+    generator = types.ModuleType('generator')
+    class OutputGenerator(object):
+        def __init__(self, errFile = sys.stderr, warnFile = sys.stderr, diagFile = sys.stdout):
+            pass
+    class GeneratorOptions(object):
+        def __init__(self, **kwargs):
+            pass
+    def regSortFeatures(featureList):
+        pass
+    generator.OutputGenerator = OutputGenerator
+    generator.GeneratorOptions = GeneratorOptions
+    generator.regSortFeatures = regSortFeatures
+    sys.modules['generator'] = generator
+from helper_file_generator import HelperFileOutputGenerator
+
+# A few real extension names, used to build the small name sets
+sample_names = [
+    'VK_AMD_draw_indirect_count',
+    'VK_EXT_debug_marker',
+    'VK_EXT_debug_report',
+    'VK_EXT_debug_utils',
+    'VK_KHR_16bit_storage',
+    'VK_KHR_bind_memory2',
+    'VK_KHR_get_physical_device_properties2',
+    'VK_KHR_maintenance1',
+    'VK_KHR_surface',
+    'VK_KHR_swapchain',
+    'VK_NV_glsl_shader',
+]
+
+# Compile source with the first compiler found for the language, run it with args and return its output lines
+def compile_and_run(tmp_path, source, language, args=[]):
+    compilers = {'c': ['cc', 'gcc', 'clang'], 'c++': ['c++', 'g++', 'clang++']}[language]
+    compiler = next((shutil.which(name) for name in compilers if shutil.which(name)), None)
+    if compiler is None:
+        pytest.skip('No %s compiler found' % language)
+    source_file = str(tmp_path / ('test.c' if language == 'c' else 'test.cpp'))
+    program = str(tmp_path / 'test')
+    with open(source_file, 'w') as f:
+        f.write(source)
+    subprocess.check_call([compiler, '-o', program, source_file])
+    return subprocess.check_output([program] + args, universal_newlines=True).splitlines()
+
+# Check that every name is found in its own slot through the bucket seeds, as the generated get_info looks it up
+def check_perfect_hash(generator, names, table):
+    assert table is not None
+    seeds, slots = table
+    mask = len(slots) - 1
+    assert len(seeds) == len(slots) and (len(slots) & mask) == 0
+    for index, name in enumerate(names):
+        bucket = generator.ExtensionNameHash(0, name) & mask
+        assert slots[generator.ExtensionNameHash(seeds[bucket], name) & mask] == index
+    assert sorted(slot for slot in slots if slot >= 0) == list(range(len(names)))
+
+# The instance and device extension name lists from vk.xml, as the generator sees them
+def registry_extension_lists():
+    registry_file = os.path.join(registry_dir, 'vk.xml')
+    if not os.path.exists(registry_file):
+        pytest.skip('vk.xml not found in %s' % registry_dir)
+    extension_lists = {'instance': [], 'device': []}
+    for extension in etree.parse(registry_file).getroot().iter('extension'):
+        if extension.get('supported') != 'disabled' and extension.get('type') in extension_lists:
+            extension_lists[extension.get('type')].append(extension.get('name'))
+    return [sorted(names) for names in extension_lists.values()]
+
+# Generate a program printing the ExtensionId that get_info finds for each name given as an argument
+def extension_lookup_program(generator, names, perfect_hash):
+    program = [
+        '#include <stdint.h>',
+        '#include <stdio.h>',
+        '#include <string.h>',
+        '#include <vector>',
+        '',
+        'enum ExtensionId { kExtensionNone = 0 };',
+        'typedef std::vector<int> TestReqVec;',
+        'struct TestInfo {',
+        '    TestInfo(ExtensionId id_, const TestReqVec requires_) : id(id_), requires(requires_) {}',
+        '    ExtensionId id;',
+        '    TestReqVec requires;',
+        '};',
+        '']
+    program.extend(generator.GenerateExtensionNameHash())
+    program.extend([
+        'static const TestInfo &get_info(const char *name) {',
+        '    static const char * const info_names[] = {'])
+    program.extend([ '        "%s",' % name for name in names])
+    program.extend([
+        '    };',
+        '    static const TestInfo info_table[] = {'])
+    program.extend([ '        TestInfo(ExtensionId(%d), {}),' % (index + 1) for index in range(len(names))])
+    program.extend([ '    };'])
+    program.extend(generator.GenerateExtensionLookup('TestInfo', 'TestReqVec', len(names), perfect_hash))
+    program.extend([
+        'int main(int argc, char **argv) {',
+        '    for (int arg = 1; arg < argc; ++arg) printf("%d\\n", (int)get_info(argv[arg]).id);',
+        '    return 0;',
+        '}'])
+    return '\n'.join(program)
+
+def test_small_name_sets():
+    generator = HelperFileOutputGenerator()
+    for count in range(1, 6):
+        for names in itertools.combinations(sample_names, count):
+            check_perfect_hash(generator, list(names), generator.BuildExtensionPerfectHash(list(names)))
+
+def test_registry_extension_lists():
+    generator = HelperFileOutputGenerator()
+    for names in registry_extension_lists():
+        check_perfect_hash(generator, names, generator.BuildExtensionPerfectHash(names))
+        # Growing the list by any one extension must still build a table
+        for extra in sample_names:
+            if extra not in names:
+                grown = sorted(names + [extra])
+                check_perfect_hash(generator, grown, generator.BuildExtensionPerfectHash(grown))
+
+def test_seed_search_is_bounded():
+    generator = HelperFileOutputGenerator()
+    # With no seeds to search and no room to grow, a bucket holding more than one name cannot be placed
+    assert generator.BuildExtensionPerfectHash(sample_names[:8], max_seed=1, max_growth=0) is None
+    # With a single seed, these names only fit once the table has grown, and all of them do not fit at all
+    names = sample_names[:8]
+    assert generator.TryExtensionPerfectHash(names, 8, 2) is None
+    table = generator.BuildExtensionPerfectHash(names, max_seed=2, max_growth=3)
+    check_perfect_hash(generator, names, table)
+    assert len(table[1]) > 8
+    assert generator.BuildExtensionPerfectHash(sample_names, max_seed=2, max_growth=3) is None
+
+@pytest.mark.parametrize('use_perfect_hash', [True, False])
+def test_generated_extension_lookup(tmp_path, use_perfect_hash):
+    generator = HelperFileOutputGenerator()
+    names = sorted(sample_names)
+    perfect_hash = generator.BuildExtensionPerfectHash(names) if use_perfect_hash else None
+    unknown = ['', 'VK_KHR', 'VK_KHR_surfac', 'VK_KHR_surface2', 'VK_ZZZ_unknown', 'A']
+    output = compile_and_run(tmp_path, extension_lookup_program(generator, names, perfect_hash), 'c++', names + unknown)
+    assert output == [str(index + 1) for index in range(len(names))] + ['0'] * len(unknown)
+
+def test_enum_string_tables():
+    generator = HelperFileOutputGenerator()
+    # A run shorter than min_dense_enum_run is binary searched along with the scattered values
+    values = [(value, 'DENSE_%d' % value) for value in range(generator.min_dense_enum_run)]
+    values += [(100, 'SHORT_100'), (101, 'SHORT_101'), (1000000000, 'EXT_A'), (-5, 'NEGATIVE')]
+    output = generator.GenerateEnumStringConversion('VkTestEnum', set(values))
+    assert 'dense_names_0' in output and 'dense_names_1' not in output
+    assert '{100, "SHORT_100"}' in output and '{-5, "NEGATIVE"}' in output and '"DENSE_0",' in output
+    # Unresolved values fall back to a switch
+    output = generator.GenerateEnumStringConversion('VkTestEnum', set([(None, 'ALIAS_A'), (1, 'B')]))
+    assert 'switch' in output and 'case ALIAS_A:' in output
+
+def test_generated_enum_strings(tmp_path):
+    generator = HelperFileOutputGenerator()
+    program = [
+        '#include <stddef.h>',
+        '#include <stdint.h>',
+        '#include <stdio.h>',
+        '#include <string.h>',
+        'typedef uint32_t VkFlags;',
+        'typedef enum VkTestEnum { TEST_NEGATIVE = -5, TEST_0 = 0, TEST_1, TEST_2, TEST_3, TEST_4,',
+        '                          TEST_100 = 100, TEST_101, TEST_EXT = 1000000000 } VkTestEnum;',
+        'typedef enum VkTestFlagBits { A_BIT = 0x1, B_BIT = 0x2, LONG_NAMED_BIT = 0x10 } VkTestFlagBits;',
+        'typedef VkFlags VkTestFlags;',
+        'typedef enum VkSwitchEnum { SWITCH_X = 3, SWITCH_Y = 9 } VkSwitchEnum;']
+    enum_values = [(-5, 'TEST_NEGATIVE'), (100, 'TEST_100'), (101, 'TEST_101'), (1000000000, 'TEST_EXT')]
+    enum_values += [(value, 'TEST_%d' % value) for value in range(5)]
+    source = '\n'.join(program)
+    source += generator.GenerateEnumStringSupport()
+    source += generator.GenerateEnumStringConversion('VkTestEnum', set(enum_values))
+    source += generator.GenerateEnumStringConversion('VkTestFlagBits', set([(1, 'A_BIT'), (2, 'B_BIT'), (16, 'LONG_NAMED_BIT')]))
+    source += generator.GenerateFlagsStringConversion('VkTestFlagBits')
+    source += generator.GenerateEnumStringConversion('VkSwitchEnum', set([(None, 'SWITCH_X'), (None, 'SWITCH_Y')]))
+    source += '\n'.join([
+        '',
+        'int main(void) {',
+        '    static const int64_t enum_values[] = {-5, 0, 2, 4, 5, 99, 100, 101, 102, 1000000000, -6};',
+        '    for (size_t i = 0; i < sizeof(enum_values) / sizeof(enum_values[0]); ++i)',
+        '        printf("%s\\n", string_VkTestEnum((VkTestEnum)enum_values[i]));',
+        '    printf("%s\\n%s\\n", string_VkSwitchEnum(SWITCH_Y), string_VkSwitchEnum((VkSwitchEnum)4));',
+        '    static const struct { VkFlags value; size_t buffer_size; } flags[] = {',
+        '        {0x3, 64}, {0x13, 64}, {0x0, 64}, {0x8, 64}, {0x3, 8}, {0x3, 6}, {0x3, 1}, {0x0, 1}, {0x3, 0},',
+        '    };',
+        '    for (size_t i = 0; i < sizeof(flags) / sizeof(flags[0]); ++i) {',
+        '        char buffer[64];',
+        '        memset(buffer, \'#\', sizeof(buffer));',
+        '        printf("[%s]\\n", string_VkTestFlags(flags[i].value, flags[i].buffer_size ? buffer : NULL, flags[i].buffer_size));',
+        '    }',
+        '    return 0;',
+        '}',
+        ''])
+    output = compile_and_run(tmp_path, source, 'c')
+    assert output == [
+        'TEST_NEGATIVE', 'TEST_0', 'TEST_2', 'TEST_4', 'Unhandled VkTestEnum', 'Unhandled VkTestEnum',
+        'TEST_100', 'TEST_101', 'Unhandled VkTestEnum', 'TEST_EXT', 'Unhandled VkTestEnum',
+        'SWITCH_Y', 'Unhandled VkSwitchEnum',
+        '[A_BIT|B_BIT]', '[A_BIT|B_BIT|LONG_NAMED_BIT]', '[0]', '[Unhandled VkTestFlagBits]',
+        '[A_BIT|B]', '[A_BIT]', '[]', '[]', '[]',
+    ]
@@ -248,8 +248,10 @@ import subprocess
 import sys
 import platform
 import multiprocessing
+import multiprocessing.pool
 import shlex
 import shutil
+import threading
 
 KNOWN_GOOD_FILE_NAME = 'known_good.json'
 
@@ -264,6 +266,9 @@ VERBOSE = False
 
 DEVNULL = open(os.devnull, 'wb')
 
+# Serializes output from repos being checked out or built concurrently
+PRINT_LOCK = threading.Lock()
+
 
 def command_output(cmd, directory, fail_ok=False):
     """Runs a command in a directory and returns its standard output stream.
@@ -341,7 +346,8 @@ class GoodRepo(object):
         command_output(['git', 'fetch', 'origin'], self.repo_dir)
 
     def Checkout(self):
-        print('Checking out {n} in {d}'.format(n=self.name, d=self.repo_dir))
+        with PRINT_LOCK:
+            print('Checking out {n} in {d}'.format(n=self.name, d=self.repo_dir))
         if self._args.do_clean_repo:
             shutil.rmtree(self.repo_dir)
         if not os.path.exists(os.path.join(self.repo_dir, '.git')):
@@ -351,7 +357,10 @@ class GoodRepo(object):
             command_output(['git', 'checkout', self._args.ref], self.repo_dir)
         else:
             command_output(['git', 'checkout', self.commit], self.repo_dir)
-        print(command_output(['git', 'status'], self.repo_dir))
+        status = command_output(['git', 'status'], self.repo_dir)
+        with PRINT_LOCK:
+            print('Checked out {n}'.format(n=self.name))
+            print(status)
 
     def CustomPreProcess(self, cmd_str, repo_dict):
         return cmd_str.format(repo_dict, self._args, CONFIG_MAP[self._args.config])
@@ -380,9 +389,8 @@ class GoodRepo(object):
         if self._args.do_clean_install:
             shutil.rmtree(self.install_dir)
 
-        # Create and change to build directory
+        # Create build directory
         distutils.dir_util.mkpath(self.build_dir)
-        os.chdir(self.build_dir)
 
         cmake_cmd = [
             'cmake', self.repo_dir,
@@ -418,11 +426,11 @@ class GoodRepo(object):
         if VERBOSE:
             print("CMake command: " + " ".join(cmake_cmd))
 
-        ret_code = subprocess.call(cmake_cmd)
+        ret_code = subprocess.call(cmake_cmd, cwd=self.build_dir)
         if ret_code != 0:
             sys.exit(ret_code)
 
-    def CMakeBuild(self):
+    def CMakeBuild(self, ncpu):
         """Build CMake command for the build phase and execute it"""
         cmake_cmd = ['cmake', '--build', self.build_dir, '--target', 'install']
         if self._args.do_clean:
@@ -435,11 +443,10 @@ class GoodRepo(object):
         # Speed up the build.
         if platform.system() == 'Linux' or platform.system() == 'Darwin':
             cmake_cmd.append('--')
-            cmake_cmd.append('-j{ncpu}'
-                             .format(ncpu=multiprocessing.cpu_count()))
+            cmake_cmd.append('-j{ncpu}'.format(ncpu=ncpu))
         if platform.system() == 'Windows':
             cmake_cmd.append('--')
-            cmake_cmd.append('/maxcpucount')
+            cmake_cmd.append('/maxcpucount:{ncpu}'.format(ncpu=ncpu))
 
         if VERBOSE:
             print("CMake command: " + " ".join(cmake_cmd))
@@ -448,11 +455,12 @@ class GoodRepo(object):
         if ret_code != 0:
             sys.exit(ret_code)
 
-    def Build(self, repos, repo_dict):
-        """Build the dependent repo"""
-        print('Building {n} in {d}'.format(n=self.name, d=self.repo_dir))
-        print('Build dir = {b}'.format(b=self.build_dir))
-        print('Install dir = {i}\n'.format(i=self.install_dir))
+    def Build(self, repos, repo_dict, ncpu):
+        """Build the dependent repo, using up to 'ncpu' parallel jobs"""
+        with PRINT_LOCK:
+            print('Building {n} in {d}'.format(n=self.name, d=self.repo_dir))
+            print('Build dir = {b}'.format(b=self.build_dir))
+            print('Install dir = {i}\n'.format(i=self.install_dir))
 
         # Run any prebuild commands
         self.PreBuild()
@@ -465,7 +473,7 @@ class GoodRepo(object):
         self.CMakeConfig(repos)
 
         # Build and execute CMake command for the build
-        self.CMakeBuild()
+        self.CMakeBuild(ncpu)
 
 
 def GetGoodRepos(args):
@@ -530,6 +538,87 @@ def CreateHelper(args, repos, filename):
                                       dir=repo.install_dir))
 
 
+def CheckoutRepos(repos, jobs):
+    """Clone/update the repos concurrently.
+
+    Git operations are dominated by waiting on the network and disk, so
+    a thread pool is used with one thread per repo unless 'jobs' limits it.
+    Any failure is raised once all of the checkouts have finished.
+    """
+    if len(repos) == 0:
+        return
+    pool = multiprocessing.pool.ThreadPool(min(jobs or len(repos), len(repos)))
+    try:
+        pool.map(GoodRepo.Checkout, repos)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def BuildRepos(repos, build_repos, repo_dict, jobs):
+    """Build the repos, each as soon as the repos it depends on are installed.
+
+    Repos whose deps are all installed are built concurrently, and the
+    'jobs' CPU budget is split between the builds started together.  A
+    dep that is not being built in this run is assumed to be installed
+    already.  Custom build commands can refer to any repo, so a custom
+    build waits for all of the repos listed before it.  If a build fails,
+    no more builds are started and the failure is raised once the running
+    builds have finished.
+    """
+    names = [repo.name for repo in build_repos]
+    waiting_on = {}
+    for index, repo in enumerate(build_repos):
+        if repo.build_step == 'custom':
+            waiting_on[repo.name] = set(names[:index])
+        else:
+            waiting_on[repo.name] = set(d['repo_name'] for d in repo.deps
+                                        if d['repo_name'] in names)
+
+    condition = threading.Condition()
+    pending = list(build_repos)
+    installed = set()
+    errors = []
+    running = [0]
+
+    def RunBuild(repo, ncpu):
+        try:
+            repo.Build(repos, repo_dict, ncpu)
+        except BaseException as e:
+            with condition:
+                errors.append(e)
+        else:
+            with condition:
+                installed.add(repo.name)
+        finally:
+            with condition:
+                running[0] -= 1
+                condition.notify()
+
+    with condition:
+        while len(pending) or running[0]:
+            ready = []
+            if len(errors) == 0:
+                ready = [repo for repo in pending if waiting_on[repo.name] <= installed]
+            if len(ready):
+                ncpu = max(1, jobs // (running[0] + len(ready)))
+                for repo in ready:
+                    pending.remove(repo)
+                    running[0] += 1
+                    thread = threading.Thread(target=RunBuild, args=(repo, ncpu))
+                    thread.daemon = True
+                    thread.start()
+            elif running[0]:
+                condition.wait()
+            elif len(errors) == 0:
+                raise RuntimeError('Circular deps between {}'.format(
+                    ', '.join(repo.name for repo in pending)))
+            else:
+                break
+    if len(errors):
+        raise errors[0]
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Get and build dependent repos at known-good commits')
@@ -592,9 +681,21 @@ def main():
         type=str.lower,
         help="Set build files configuration",
         default='debug')
+    parser.add_argument(
+        '--checkout-jobs',
+        dest='checkout_jobs',
+        type=int,
+        help="Number of repositories to clone/update at once. Default is all of them.",
+        default=0)
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        dest='jobs',
+        type=int,
+        help="Number of parallel jobs to split between concurrent builds. Default is the CPU count.",
+        default=multiprocessing.cpu_count())
 
     args = parser.parse_args()
-    save_cwd = os.getcwd()
 
     # Create working "top" directory if needed
     distutils.dir_util.mkpath(args.dir)
@@ -603,7 +704,7 @@ def main():
     repos = GetGoodRepos(args)
     repo_dict = {}
 
-    print('Starting builds in {d}'.format(d=abs_top_dir))
+    selected_repos = []
     for repo in repos:
         # If the repo has a platform whitelist, skip the repo
         # unless we are building on a whitelisted platform.
@@ -641,15 +742,17 @@ def main():
             if not do_build:
                 continue
 
-        # Clone/update the repository
-        repo.Checkout()
+        selected_repos.append(repo)
+
+    # Clone/update the repositories
+    CheckoutRepos(selected_repos, args.checkout_jobs)
 
-        # Build the repository
-        if args.do_build and repo.build_step != 'skip':
-            repo.Build(repos, repo_dict)
+    # Build the repositories, each after its deps are installed
+    print('Starting builds in {d}'.format(d=abs_top_dir))
+    if args.do_build:
+        BuildRepos(repos, [repo for repo in selected_repos if repo.build_step != 'skip'],
+                   repo_dict, args.jobs)
 
-    # Need to restore original cwd in order for CreateHelper to find json file
-    os.chdir(save_cwd)
     CreateHelper(args, repos, os.path.join(abs_top_dir, 'helper.cmake'))
 
     sys.exit(0)
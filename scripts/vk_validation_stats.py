@@ -20,15 +20,25 @@
 # Author: Dave Houlton <daveh@lunarg.com>
 
 import argparse
+import bisect
 import os
 import sys
 import operator
 import platform
+import posixpath
+import subprocess
 import json
 import re
 import csv
+import hashlib
 import html
+import io
+import mmap
+import socketserver
+import sqlite3
+import tempfile
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 verbose_mode = False
 txt_db = False
@@ -37,6 +47,15 @@ html_db = False
 txt_filename = "validation_error_database.txt"
 csv_filename = "validation_error_database.csv"
 html_filename = "validation_error_database.html"
+json_db_filename = "validation_error_database.json"
+sqlite_filename = "validation_error_database.sqlite"
+# The scan cache defaults to the temp directory, rather than the source tree, with a name unique to the working directory
+cache_filename = os.path.join(tempfile.gettempdir(), "vk_validation_stats_cache_%s.json" %
+                              hashlib.sha1(os.getcwd().encode('utf-8')).hexdigest()[:12])
+snapshot_filename = "vk_validation_stats_snapshot.json"
+test_index_filename = "validation_test_index.json"
+use_cache = True
+query_port = 8123
 header_filename = "../layers/vk_validation_error_messages.h"
 test_file = '../tests/layer_validation_tests.cpp'
 vuid_prefixes = ['VUID-', 'UNASSIGNED-']
@@ -45,6 +64,7 @@ vuid_prefixes = ['VUID-', 'UNASSIGNED-']
 # replace KHR vuids with non-KHR during consistency checking
 dealias_khr = True
 ignore_unassigned = True # These are not found in layer code unless they appear explicitly (most don't), so produce false positives
+impact_context = 10 # a changed line impacts VUIDs checked within this many lines of it
 
 generated_layer_source_directories = [
 'build',
@@ -143,7 +163,18 @@ def printHelp():
     print ("                                [ -text [ <text_out_filename>] ]")
     print ("                                [ -csv  [ <csv_out_filename>]  ]")
     print ("                                [ -html [ <html_out_filename>] ]")
+    print ("                                [ -json [ <json_out_filename>] ]")
+    print ("                                [ -sqlite [ <sqlite_out_filename>] ]")
     print ("                                [ -export_header ]")
+    print ("                                [ -cache <cache_filename> ]")
+    print ("                                [ -no_cache ]")
+    print ("                                [ -snapshot [ <snapshot_out_filename>] ]")
+    print ("                                [ -diff <old> [ <new>] ]")
+    print ("                                [ -test_index [ <test_index_out_filename>] ]")
+    print ("                                [ -mincover <vuid_list_filename> ]")
+    print ("                                [ -impact [ <git_revision>] ]")
+    print ("                                [ -query ]")
+    print ("                                [ -server [ <port>] ]")
     print ("                                [ -verbose ]")
     print ("                                [ -help ]")
     print ("\n  The vk_validation_stats script parses validation layer source files to") 
@@ -161,47 +192,202 @@ def printHelp():
     print ("                   defaults to 'validation_error_database.csv'")
     print (" -html [filename]  output the error database in html to <html_database_filename>,")
     print ("                   defaults to 'validation_error_database.html'")
+    print (" -json [filename]  output the error database in json to <json_database_filename>,")
+    print ("                   defaults to 'validation_error_database.json'")
+    print (" -sqlite [filename] output the error database as an indexed sqlite database to <sqlite_database_filename>,")
+    print ("                   defaults to 'validation_error_database.sqlite'")
     print (" -export_header    export a new VUID error text header file to <%s>" % header_filename)
+    print (" -cache <filename> keep the scan cache in <filename>, defaults to")
+    print ("                   '%s'" % cache_filename)
+    print (" -no_cache         rescan every file, ignoring and not updating the scan cache")
+    print (" -snapshot [filename] save the coverage state (defined, checked and tested VUIDs) to <snapshot_filename>,")
+    print ("                   defaults to '%s'" % snapshot_filename)
+    print (" -diff <old> [new] report only the coverage changes from <old> to <new>, each being a snapshot file or")
+    print ("                   'git:<revision>' to scan the layer source and tests as of that git revision. <new>")
+    print ("                   defaults to the current source. Git revisions are compared against <json-file>")
+    print (" -test_index [filename] output the VUIDs exercised by each test in json to <test_index_filename>,")
+    print ("                   defaults to '%s'" % test_index_filename)
+    print (" -mincover <filename> report a minimal set of tests exercising the VUIDs listed in <filename>")
+    print ("                   (whitespace separated), as a --gtest_filter")
+    print (" -impact [revision] report the tests impacted by source changes since a git revision, as a --gtest_filter")
+    print ("                   for vk_layer_validation_tests. <revision> defaults to HEAD, selecting tests for")
+    print ("                   uncommitted changes")
+    print (" -query            after loading, answer queries read from stdin (type 'help' for commands)")
+    print (" -server [port]    after loading, answer queries from a socket on localhost, port defaults to %d" % query_port)
     print (" -verbose          show your work (to stdout)")
 
-class ValidationJSON:
+# Persistent cache of per-file scan results, keyed by file content hash. File modification time and size are
+# remembered so unchanged files are not even re-hashed; only new or modified files need to be scanned.
+class ScanCache:
+    version = 3
+
     def __init__(self, filename):
         self.filename = filename
+        self.files = {}     # Maps file path to [mtime_ns, size, digest]
+        self.results = {}   # Maps '<kind>:<digest>' to the scan result for that file content
+        self.used = set()   # Result keys looked up or stored during this run
+        self.dirty = False
+        if os.path.isfile(self.filename):
+            try:
+                with open(self.filename, 'r', encoding='utf-8') as cache_file:
+                    cache = json.load(cache_file)
+                if cache.get('version') == self.version:
+                    self.files = cache['files']
+                    self.results = cache['results']
+            except (ValueError, KeyError):
+                print("Warning: Ignoring unreadable scan cache <%s>" % self.filename)
+
+    # Return the content digest of a file, re-hashing it only if its mtime or size changed
+    def digest(self, path):
+        st = os.stat(path)
+        entry = self.files.get(path)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        with open(path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        self.files[path] = [st.st_mtime_ns, st.st_size, digest]
+        self.dirty = True
+        return digest
+
+    def lookup(self, kind, digest):
+        key = '%s:%s' % (kind, digest)
+        self.used.add(key)
+        return self.results.get(key)
+
+    def store(self, kind, digest, result):
+        key = '%s:%s' % (kind, digest)
+        self.used.add(key)
+        self.results[key] = result
+        self.dirty = True
+
+    # Write the cache back out, dropping results for file contents that were not seen during this run
+    def save(self):
+        stale = set(self.results) - self.used
+        if not self.dirty and not stale:
+            return
+        for key in stale:
+            del self.results[key]
+        temp_filename = self.filename + '.tmp'
+        with open(temp_filename, 'w', encoding='utf-8') as cache_file:
+            json.dump({'version': self.version, 'files': self.files, 'results': self.results}, cache_file)
+        os.replace(temp_filename, self.filename)
+        self.dirty = False
+
+# One validusage.json entry for a VUID. The api, ext and type strings are shared with every other entry
+# through the ValidationJSON intern tables, so an entry costs little more than its text.
+class VuidEntry:
+    __slots__ = ('api', 'ext', 'type', 'text')
+
+    def __init__(self, api, ext, vtype, text):
+        self.api = api
+        self.ext = ext
+        self.type = vtype
+        self.text = text
+
+class ValidationJSON:
+    def __init__(self, filename, cache=None):
+        self.filename = filename
+        self.cache = cache
         self.explicit_vuids = set()
         self.implicit_vuids = set()
         self.all_vuids = set()
-        self.vuid_db = defaultdict(list) # Maps VUID string to list of json-data dicts
+        self.vuid_db = {}       # Maps VUID string to tuple of VuidEntry records
+        self.vuid_names = []    # Sorted VUID strings, indexed by VUID id
+        self.vuid_ids = {}      # Maps VUID string to integer VUID id
+        self.api_names = []     # Intern table of API/struct names, indexed by api id
+        self.api_ids = {}       # Maps API/struct name to api id
+        self.ext_names = []     # Intern table of extension names, indexed by ext id
+        self.ext_ids = {}       # Maps extension name to ext id
         self.apiversion = ""
         self.duplicate_vuids = set()
         
         # A set of specific regular expression substitutions needed to clean up VUID text
         self.regex_dict = {}
-        self.regex_dict[re.compile('<.*?>|&(amp;)+lt;|&(amp;)+gt;')] = ""
-        self.regex_dict[re.compile(r'\\\(codeSize \\over 4\\\)')] = "(codeSize/4)"
-        self.regex_dict[re.compile(r'\\\(\\lceil\{\\mathit\{rasterizationSamples} \\over 32}\\rceil\\\)')] = "(rasterizationSamples/32)"
+        self.regex_dict['<.*?>|&(?:amp;)+lt;|&(?:amp;)+gt;'] = ""
+        self.regex_dict[r'\\\(codeSize \\over 4\\\)'] = "(codeSize/4)"
+        self.regex_dict[r'\\\(\\lceil\{\\mathit\{rasterizationSamples} \\over 32}\\rceil\\\)'] = "(rasterizationSamples/32)"
         # Some fancy punctuation chars that break the Android build...
-        self.regex_dict[re.compile('&#8594;')] = "->"       # Arrow char
-        self.regex_dict[re.compile('&#8217;')] = "'"        # Left-slanting apostrophe to apostrophe
-        self.regex_dict[re.compile('&#822(0|1);')] = "'"    # L/R-slanting quotes to apostrophe
+        self.regex_dict['&#8594;'] = "->"       # Arrow char
+        self.regex_dict['&#8217;'] = "'"        # Left-slanting apostrophe to apostrophe
+        self.regex_dict['&#822(?:0|1);'] = "'"  # L/R-slanting quotes to apostrophe
+
+        # Combine the substitutions into one regex, so each text is cleaned up in a single pass. Each
+        # alternative is a named group whose name selects the replacement.
+        self.replacements = {}
+        alternatives = []
+        for index, (regex, replacement) in enumerate(self.regex_dict.items()):
+            group_name = 'r%d' % index
+            self.replacements[group_name] = replacement
+            alternatives.append('(?P<%s>%s)' % (group_name, regex))
+        self.cleanup_regex = re.compile('|'.join(alternatives))
+        self.cleaned_text = {}  # Memoized cleanup results, as the same text often appears under several extensions
 
     def read(self):
+        if not os.path.isfile(self.filename):
+            print("Error: Error loading validusage.json file <%s>" % self.filename)
+            sys.exit(-1)
+        parsed = None
+        if self.cache is not None:
+            digest = self.cache.digest(self.filename)
+            parsed = self.cache.lookup('json', digest)
+        if parsed is None:
+            parsed = self.parse_json()
+            if self.cache is not None:
+                self.cache.store('json', digest, parsed)
+        self.apiversion = parsed['apiversion']
+
+        # Load parsed vuid entries into local databases, interning the repeated strings
+        vuid_types = {'explicit' : 'explicit', 'implicit' : 'implicit'}
+        vuid_db = defaultdict(list)
+        for vuid_string, apiname, ext, vtype, vuid_text in parsed['entries']:
+            if vtype == 'explicit':
+                self.explicit_vuids.add(vuid_string)
+            else:
+                self.implicit_vuids.add(vuid_string)
+            entry = VuidEntry(self.intern(apiname, self.api_names, self.api_ids),
+                              self.intern(ext, self.ext_names, self.ext_ids), vuid_types[vtype], vuid_text)
+            vuid_db[vuid_string].append(entry)
+        self.vuid_names = sorted(vuid_db)
+        self.vuid_ids = {vuid : index for index, vuid in enumerate(self.vuid_names)}
+        self.vuid_db = {vuid : tuple(vuid_db[vuid]) for vuid in self.vuid_names}
+        self.all_vuids = self.vuid_db.keys()    # Set-like view, rather than a third copy of the VUID set
+        self.duplicate_vuids = set({v for v in self.vuid_db if len(self.vuid_db[v]) > 1})
+        if len(self.duplicate_vuids) > 0:
+            print("Warning: duplicate VUIDs found in validusage.json")
+
+    # Return the VUID text with markup and problem characters replaced
+    def clean_text(self, text):
+        if text not in self.cleaned_text:
+            cleaned = self.cleanup_regex.sub(lambda match: self.replacements[match.lastgroup], text)
+            self.cleaned_text[text] = html.unescape(cleaned)    # anything missed by the regex
+        return self.cleaned_text[text]
+
+    # Return the shared copy of name from an intern table, adding it if not yet present
+    def intern(self, name, names, ids):
+        if name not in ids:
+            ids[name] = len(names)
+            names.append(name)
+        return names[ids[name]]
+
+    # Parse the json file into a list of [vuid, api, ext, type, text] entries with cleaned-up text
+    def parse_json(self):
         self.json_dict = {}
-        if os.path.isfile(self.filename):
-            json_file = open(self.filename, 'r', encoding='utf-8')
-            self.json_dict = json.load(json_file)
-            json_file.close()
+        json_file = open(self.filename, 'r', encoding='utf-8')
+        self.json_dict = json.load(json_file)
+        json_file.close()
         if len(self.json_dict) == 0:
             print("Error: Error loading validusage.json file <%s>" % self.filename)
             sys.exit(-1)
         try:
             version = self.json_dict['version info']
             validation = self.json_dict['validation']
-            self.apiversion = version['api version']
+            apiversion = version['api version']
         except:
             print("Error: Failure parsing validusage.json object")
             sys.exit(-1)
 
-        # Parse vuid from json into local databases
+        # Parse vuid from json into a list of entries
+        entries = []
         for apiname in validation.keys():
             # print("entrypoint:%s"%apiname)
             apidict = validation[apiname]
@@ -209,26 +395,186 @@ class ValidationJSON:
                 vlist = apidict[ext]
                 for ventry in vlist:
                     vuid_string = ventry['vuid']
-                    if (vuid_string[-5:-1].isdecimal()):    
-                        self.explicit_vuids.add(vuid_string)    # explicit end in 5 numeric chars
-                        vtype = 'explicit'
+                    if (vuid_string[-5:-1].isdecimal()):
+                        vtype = 'explicit'    # explicit end in 5 numeric chars
                     else:
-                        self.implicit_vuids.add(vuid_string)    # otherwise, implicit
-                        vtype = 'implicit'
-                    vuid_text = ventry['text']
-                    for regex, replacement in self.regex_dict.items():
-                        vuid_text = re.sub(regex, replacement, vuid_text)   # do regex substitution
-                    vuid_text = html.unescape(vuid_text)                    # anything missed by the regex
-                    self.vuid_db[vuid_string].append({'api':apiname, 'ext':ext, 'type':vtype, 'text':vuid_text})
-        self.all_vuids = self.explicit_vuids | self.implicit_vuids
-        self.duplicate_vuids = set({v for v in self.vuid_db if len(self.vuid_db[v]) > 1})
-        if len(self.duplicate_vuids) > 0:
-            print("Warning: duplicate VUIDs found in validusage.json")
+                        vtype = 'implicit'    # otherwise, implicit
+                    vuid_text = self.clean_text(ventry['text'])
+                    entries.append([vuid_string, apiname, ext, vtype, vuid_text])
+        return {'apiversion': apiversion, 'entries': entries}
+
+
+# Matches one C++ token of interest: a comment, a string or character literal, or a TEST_F(fixture, name) header.
+# Everything between tokens is code that the scanners do not need to look at.
+cpp_token_regex = re.compile(br'//[^\n]*|/\*.*?\*/|"[^"\\\n]*(?:\\.[^"\\\n]*)*"|\'(?:[^\'\\\n]|\\.)*\'|TEST_F\s*\(\s*(\w+)\s*,\s*(\w+)\s*\)', re.DOTALL)
+whitespace_regex = re.compile(br'\s*')
+identifier_regex = re.compile(br'\w')
+vuid_regex = re.compile(br'(?:%s)[\w-]*' % b'|'.join(re.escape(prefix.encode('utf-8')) for prefix in vuid_prefixes))
+
+# Tokenize C++ source in a single pass. Yields ('string', pieces) for each string literal, with adjacent literals
+# concatenated as the compiler would and pieces being the (line_number, text) of each part, and
+# ('test', fixture, name, line_number) for each TEST_F. Comments and character literals are consumed, so quotes
+# and test macros inside them are ignored.
+def tokenize_cpp(contents):
+    line_num = 1
+    last_pos = 0
+    pieces = []         # Parts of the string literal being concatenated
+    pieces_end = 0      # Offset just past the last part, or past a comment following it
+    for match in cpp_token_regex.finditer(contents):
+        start = match.start()
+        line_num += contents[last_pos:start].count(b'\n')
+        last_pos = start
+        if pieces and whitespace_regex.fullmatch(contents, pieces_end, start) is None:
+            yield ('string', pieces)
+            pieces = []
+        first = match.group()[:1]
+        if first == b'"':
+            pieces.append((line_num, match.group()[1:-1]))
+            pieces_end = match.end()
+        elif first == b'/':
+            pieces_end = match.end()
+        else:
+            if pieces:
+                yield ('string', pieces)
+                pieces = []
+            if first == b'T' and not identifier_regex.match(contents, start - 1, start):
+                yield ('test', match.group(1).decode('utf-8'), match.group(2).decode('utf-8'), line_num)
+    if pieces:
+        yield ('string', pieces)
+
+# Return the (vuid, line_number) of each VUID in a string literal, rejoining VUIDs split across concatenated parts
+def literal_vuids(pieces):
+    if len(pieces) == 1:
+        line_num, text = pieces[0]
+        return [(match.group().decode('utf-8'), line_num) for match in vuid_regex.finditer(text)]
+    text = b''.join(piece for line_num, piece in pieces)
+    starts = []
+    offset = 0
+    for line_num, piece in pieces:
+        starts.append(offset)
+        offset += len(piece)
+    vuids = []
+    for match in vuid_regex.finditer(text):
+        line_num = pieces[bisect.bisect_right(starts, match.start()) - 1][0]
+        vuids.append((match.group().decode('utf-8'), line_num))
+    return vuids
+
+# Call function with the contents of a file, memory-mapping the file unless the contents are given
+def with_file_contents(filename, contents, function):
+    if contents is not None:
+        return function(contents)
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return function(b'')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return function(mapped)
+
+# Scan a single layer source file, returning a list of (vuid, line_number) tuples in file order. If contents
+# are given, they are scanned in place of the file.
+def scan_source_file(filename, contents=None):
+    return with_file_contents(filename, contents, scan_source_contents)
+
+def scan_source_contents(contents):
+    occurrences = []
+    for token in tokenize_cpp(contents):
+        if token[0] == 'string':
+            occurrences.extend(literal_vuids(token[1]))
+    return occurrences
+
+# Read files as of a git revision, returning a list holding the contents of each file, or None for files
+# not tracked at that revision. File names are relative to the current directory, as elsewhere in this script.
+def read_git_files(revision, filenames):
+    prefix = git_prefix(revision)
+    request = ''
+    for filename in filenames:
+        request += '%s:%s\n' % (revision, git_path(prefix, filename))
+    output = subprocess.run(['git', 'cat-file', '--batch'], input=request.encode('utf-8'),
+                            stdout=subprocess.PIPE, check=True).stdout
+    # Each object is returned as '<sha> <type> <size>' followed by the contents, or as '<name> missing'
+    contents = []
+    pos = 0
+    for filename in filenames:
+        end = output.index(b'\n', pos)
+        header = output[pos:end].split()
+        pos = end + 1
+        if len(header) != 3:
+            contents.append(None)
+            continue
+        size = int(header[2])
+        contents.append(output[pos:pos + size] if header[1] == b'blob' else None)
+        pos += size + 1
+    return contents
+
+# Check that revision names a git commit, and return the path of the current directory within the git work tree
+def git_prefix(revision):
+    try:
+        subprocess.check_output(['git', 'rev-parse', '--verify', '--quiet', revision + '^{commit}'])
+        return subprocess.check_output(['git', 'rev-parse', '--show-prefix'], universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        print("Error: Unable to find git revision <%s>" % revision)
+        sys.exit(-1)
 
+# Return the path of a file within the git work tree, given its path relative to the current directory
+def git_path(prefix, filename):
+    return posixpath.normpath(posixpath.join(prefix, filename.replace(os.sep, '/')))
+
+hunk_header_regex = re.compile(r'@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+# Return the lines changed in the work tree since a git revision, as a dict mapping each changed file's path within
+# the work tree to a list of (first_line, last_line) ranges. Deleted lines are represented by the lines around them.
+def git_changed_lines(revision):
+    git_prefix(revision)
+    output = subprocess.check_output(['git', 'diff', '-U0', '--no-color', '--no-ext-diff', revision, '--'],
+                                     universal_newlines=True, errors='replace')
+    changes = defaultdict(list)
+    path = None
+    prev_line = ''
+    for line in output.splitlines():
+        if line.startswith('+++ ') and prev_line.startswith('--- '):
+            path = line[len('+++ b/'):] if line.startswith('+++ b/') else None    # None for deleted files
+        elif line.startswith('@@ ') and path is not None:
+            match = hunk_header_regex.match(line)
+            first = int(match.group(1))
+            count = 1 if match.group(2) is None else int(match.group(2))
+            if count == 0:
+                changes[path].append((first, first + 1))
+            else:
+                changes[path].append((first, first + count - 1))
+        prev_line = line
+    return changes
+
+# Scan each file with scan_function, using a process pool for files that have no cached result. If a git revision
+# is given, files are read as of that revision, except those it does not track (the generated source files).
+def scan_files(scan_function, kind, filenames, cache, revision=None):
+    contents = [None] * len(filenames)
+    if revision is not None:
+        contents = read_git_files(revision, filenames)
+    results = [None] * len(filenames)
+    digests = [None] * len(filenames)
+    if cache is not None:
+        for index, filename in enumerate(filenames):
+            if contents[index] is not None:
+                digests[index] = hashlib.sha1(contents[index]).hexdigest()
+            else:
+                digests[index] = cache.digest(filename)
+            results[index] = cache.lookup(kind, digests[index])
+    pending = [index for index, result in enumerate(results) if result is None]
+    if len(pending) > 1:
+        with ProcessPoolExecutor() as pool:
+            scanned = list(pool.map(scan_function, [filenames[index] for index in pending], [contents[index] for index in pending]))
+    else:
+        scanned = [scan_function(filenames[index], contents[index]) for index in pending]
+    for index, result in zip(pending, scanned):
+        results[index] = result
+        if cache is not None:
+            cache.store(kind, digests[index], result)
+    return results
 
 class ValidationSource:
-    def __init__(self, source_file_list, generated_source_file_list, generated_source_directories):
-        self.source_files = source_file_list
+    def __init__(self, source_file_list, generated_source_file_list, generated_source_directories, cache=None, revision=None):
+        self.source_files = list(source_file_list)
+        self.cache = cache
+        self.revision = revision
         self.generated_source_files = generated_source_file_list
         self.generated_source_dirs = generated_source_directories
         self.vuid_count_dict = {} # dict of vuid values to the count of how much they're used, and location of where they're used
@@ -255,41 +601,19 @@ class ValidationSource:
                 self.source_files.extend(qualified_paths)
 
     def parse(self):
-        prepend = None
-        for sf in self.source_files:
-            line_num = 0
-            with open(sf) as f:
-                for line in f:
-                    line_num = line_num + 1
-                    if True in [line.strip().startswith(comment) for comment in ['//', '/*']]:
-                        continue
-                    # Find vuid strings
-                    if prepend != None:
-                        line = prepend[:-2] + line.lstrip().lstrip('"') # join lines skipping CR, whitespace and trailing/leading quote char
-                        prepend = None
-                    if any(prefix in line for prefix in vuid_prefixes):
-                        line_list = line.split()
-
-                        # A VUID string that has been broken by clang will start with a vuid prefix and end with -, and will be last in the list
-                        broken_vuid = line_list[-1].strip('"')
-                        if any(broken_vuid.startswith(prefix) for prefix in vuid_prefixes) and broken_vuid.endswith('-'):
-                            prepend = line
-                            continue
-                     
-                        vuid_list = []
-                        for str in line_list:
-                            if any(prefix in str for prefix in vuid_prefixes):
-                                vuid_list.append(str.strip(',);{}"'))
-                        for vuid in vuid_list:
-                            if vuid not in self.vuid_count_dict:
-                                self.vuid_count_dict[vuid] = {}
-                                self.vuid_count_dict[vuid]['count'] = 1
-                                self.vuid_count_dict[vuid]['file_line'] = []
-                            else:
-                                if self.vuid_count_dict[vuid]['count'] == 1:    # only count first time duplicated
-                                    self.duplicated_checks = self.duplicated_checks + 1
-                                self.vuid_count_dict[vuid]['count'] = self.vuid_count_dict[vuid]['count'] + 1
-                            self.vuid_count_dict[vuid]['file_line'].append('%s,%d' % (sf, line_num))
+        # Scan new or changed files in parallel, then merge all results in file order so counts and locations are deterministic
+        file_results = scan_files(scan_source_file, 'source', self.source_files, self.cache, self.revision)
+        for sf, occurrences in zip(self.source_files, file_results):
+            for vuid, line_num in occurrences:
+                if vuid not in self.vuid_count_dict:
+                    self.vuid_count_dict[vuid] = {}
+                    self.vuid_count_dict[vuid]['count'] = 1
+                    self.vuid_count_dict[vuid]['file_line'] = []
+                else:
+                    if self.vuid_count_dict[vuid]['count'] == 1:    # only count first time duplicated
+                        self.duplicated_checks = self.duplicated_checks + 1
+                    self.vuid_count_dict[vuid]['count'] = self.vuid_count_dict[vuid]['count'] + 1
+                self.vuid_count_dict[vuid]['file_line'].append('%s,%d' % (sf, line_num))
         # Sort vuids by type
         for vuid in self.vuid_count_dict.keys():
             if (vuid.startswith('VUID-')):
@@ -307,74 +631,92 @@ class ValidationSource:
 
 # Class to parse the validation layer test source and store testnames
 class ValidationTests:
-    def __init__(self, test_file_list, test_group_name=['VkLayerTest', 'VkPositiveLayerTest', 'VkWsiEnabledLayerTest']):
+    def __init__(self, test_file_list, cache=None, revision=None):
         self.test_files = test_file_list
-        self.test_trigger_txt_list = []
-        for tg in test_group_name:
-            self.test_trigger_txt_list.append('TEST_F(%s' % tg)
+        self.cache = cache
+        self.revision = revision
         self.explicit_vuids = set()
         self.implicit_vuids = set()
         self.unassigned_vuids = set()
         self.all_vuids = set()
-        #self.test_to_vuids = {} # Map test name to VUIDs tested
+        self.test_to_vuids = defaultdict(set) # Map test name to set of VUIDs tested
+        self.test_fixtures = {}     # Map test name to its gtest fixture name
+        self.test_locations = {}    # Map test name to (test file, first line, last line or None)
         self.vuid_to_tests = defaultdict(set) # Map VUIDs to set of test names where implemented
 
     # Parse test files into internal data struct
     def parse(self):
-        # For each test file, parse test names into set
-        grab_next_line = False # handle testname on separate line than wildcard
-        testname = ''
-        prepend = None
-        for test_file in self.test_files:
-            with open(test_file) as tf:
-                for line in tf:
-                    if True in [line.strip().startswith(comment) for comment in ['//', '/*']]:
-                        continue
-
-                    # if line ends in a broken VUID string, fix that before proceeding
-                    if prepend != None:
-                        line = prepend[:-2] + line.lstrip().lstrip('"') # join lines skipping CR, whitespace and trailing/leading quote char
-                        prepend = None
-                    if any(prefix in line for prefix in vuid_prefixes):
-                        line_list = line.split()
-
-                        # A VUID string that has been broken by clang will start with a vuid prefix and end with -, and will be last in the list
-                        broken_vuid = line_list[-1].strip('"')
-                        if any(broken_vuid.startswith(prefix) for prefix in vuid_prefixes) and broken_vuid.endswith('-'):
-                            prepend = line
-                            continue
-                     
-                    if any(ttt in line for ttt in self.test_trigger_txt_list):
-                        testname = line.split(',')[-1]
-                        testname = testname.strip().strip(' {)')
-                        if ('' == testname):
-                            grab_next_line = True
-                            continue
-                        #self.test_to_vuids[testname] = []
-                    if grab_next_line: # test name on its own line
-                        grab_next_line = False
-                        testname = testname.strip().strip(' {)')
-                        #self.test_to_vuids[testname] = []
-                    if any(prefix in line for prefix in vuid_prefixes):
-                        line_list = re.split('[\s{}[\]()"]+',line)
-                        for sub_str in line_list:
-                            if any(prefix in sub_str for prefix in vuid_prefixes):
-                                vuid_str = sub_str.strip(',);:"')
-                                self.vuid_to_tests[vuid_str].add(testname)
-                                #self.test_to_vuids[testname].append(vuid_str)
-                                if (vuid_str.startswith('VUID-')):
-                                    if (vuid_str[-5:-1].isdecimal()):    
-                                        self.explicit_vuids.add(vuid_str)    # explicit end in 5 numeric chars
-                                    else:
-                                        self.implicit_vuids.add(vuid_str)
-                                elif (vuid_str.startswith('UNASSIGNED-')):
-                                    self.unassigned_vuids.add(vuid_str)
-                                else:
-                                    print("Unable to categorize VUID: %s" % vuid_str)
-                                    print("Confused while parsing VUIDs in test code - cannot proceed. (FIXME)")
-                                    exit(-1)
+        # For each test file, parse test names and the vuids they reference
+        file_results = scan_files(scan_test_file, 'test', self.test_files, self.cache, self.revision)
+        for tf, scanned in zip(self.test_files, file_results):
+            for fixture, testname, first_line, last_line in scanned['tests']:
+                self.test_fixtures[testname] = fixture
+                self.test_locations[testname] = (tf, first_line, last_line)
+            for vuid_str, testname in scanned['vuids']:
+                self.vuid_to_tests[vuid_str].add(testname)
+                self.test_to_vuids[testname].add(vuid_str)
+                if (vuid_str.startswith('VUID-')):
+                    if (vuid_str[-5:-1].isdecimal()):
+                        self.explicit_vuids.add(vuid_str)    # explicit end in 5 numeric chars
+                    else:
+                        self.implicit_vuids.add(vuid_str)
+                elif (vuid_str.startswith('UNASSIGNED-')):
+                    self.unassigned_vuids.add(vuid_str)
+                else:
+                    print("Unable to categorize VUID: %s" % vuid_str)
+                    print("Confused while parsing VUIDs in test code - cannot proceed. (FIXME)")
+                    exit(-1)
         self.all_vuids = self.explicit_vuids | self.implicit_vuids | self.unassigned_vuids
 
+    # Return a small set of tests which together exercise every tested VUID in vuids, chosen greedily by how many
+    # still-uncovered VUIDs each test exercises, along with the set of VUIDs that no test exercises
+    def minimal_test_set(self, vuids):
+        uncovered = set({vuid for vuid in vuids if vuid in self.vuid_to_tests})
+        untested = set(vuids) - uncovered
+        candidates = set()
+        for vuid in uncovered:
+            candidates |= self.vuid_to_tests[vuid]
+        candidates = sorted(candidates)  # Break ties by name, so the result is deterministic
+        chosen = []
+        while len(uncovered) > 0:
+            best = max(candidates, key=lambda test: len(self.test_to_vuids[test] & uncovered))
+            chosen.append(best)
+            candidates.remove(best)
+            uncovered -= self.test_to_vuids[best]
+        return chosen, untested
+
+    # Return a --gtest_filter argument selecting the given tests
+    def gtest_filter(self, tests):
+        return '--gtest_filter=%s' % ':'.join('%s.%s' % (self.test_fixtures[test], test) for test in tests)
+
+    # Write the VUIDs exercised by each test
+    def export_test_index(self, filename):
+        print("\n Dumping test index to json file: %s" % filename)
+        with open(filename, 'w', encoding='utf-8') as index_file:
+            json.dump({test : sorted(self.test_to_vuids[test]) for test in sorted(self.test_to_vuids)}, index_file, indent=1)
+
+# Scan a single test file, returning a dict holding a list of (fixture, testname, first_line, last_line) for each
+# test, and a list of (vuid, testname) tuples in file order. The last line of the final test is None. If contents
+# are given, they are scanned in place of the file. Tests of other fixtures than test_group_name are ignored.
+def scan_test_file(test_file, contents=None, test_group_name=['VkLayerTest', 'VkPositiveLayerTest', 'VkWsiEnabledLayerTest']):
+    return with_file_contents(test_file, contents, lambda contents: scan_test_contents(contents, test_group_name))
+
+def scan_test_contents(contents, test_group_name):
+    tests = []
+    occurrences = []
+    testname = None
+    for token in tokenize_cpp(contents):
+        if token[0] == 'test':
+            if testname is not None:
+                tests[-1][3] = token[3] - 1
+            testname = token[2] if token[1] in test_group_name else None
+            if testname is not None:
+                tests.append([token[1], testname, token[3], None])
+        elif testname is not None:
+            for vuid, line_num in literal_vuids(token[1]):
+                occurrences.append((vuid, testname))
+    return {'tests': tests, 'vuids': occurrences}
+
 # Class to do consistency checking
 #
 class Consistency:
@@ -457,6 +799,262 @@ class Consistency:
     # def explicit_vuids_checked_not_tested(self):
 
 
+# Class to hold the coverage state at one point in time: the VUIDs defined by validusage.json, and those checked
+# in layer code and tested in layer tests. Snapshots are saved to and loaded from json files, so coverage can be
+# compared between releases.
+class CoverageSnapshot:
+    version = 1
+
+    def __init__(self, name, apiversion, spec, checked, tested):
+        self.name = name
+        self.apiversion = apiversion
+        self.spec = set(spec)
+        self.checked = set(checked)
+        self.tested = set(tested)
+
+    @classmethod
+    def from_databases(cls, name, val_json, val_source, val_tests):
+        return cls(name, val_json.apiversion, val_json.all_vuids, val_source.all_vuids, val_tests.all_vuids)
+
+    @classmethod
+    def load(cls, filename):
+        try:
+            with open(filename, 'r', encoding='utf-8') as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            if snapshot.get('version') != cls.version:
+                raise ValueError
+            return cls(filename, snapshot['api version'], snapshot['spec'], snapshot['checked'], snapshot['tested'])
+        except (OSError, ValueError, KeyError):
+            print("Error: Unable to load coverage snapshot <%s>" % filename)
+            sys.exit(-1)
+
+    def save(self, filename):
+        print("\n Saving coverage snapshot to %s" % filename)
+        with open(filename, 'w', encoding='utf-8') as snapshot_file:
+            json.dump({'version': self.version, 'api version': self.apiversion, 'spec': sorted(self.spec),
+                       'checked': sorted(self.checked), 'tested': sorted(self.tested)}, snapshot_file, indent=0)
+
+    # VUIDs checked or tested but not defined in validusage.json, filtered as for the consistency report
+    def undefined_vuids(self):
+        used = self.checked | self.tested
+        if dealias_khr:
+            used = set({khr_aliases.get(vuid, vuid) for vuid in used})
+        undef_set = used - self.spec
+        undef_set.discard('VUID-Undefined')
+        if ignore_unassigned:
+            undef_set = set({uv for uv in undef_set if not uv.startswith('UNASSIGNED-')})
+        return undef_set
+
+# Report only the coverage changes between two snapshots
+def report_coverage_diff(old, new):
+    print("\nCoverage changes from %s (validusage.json version %s) to %s (validusage.json version %s)" %
+          (old.name, old.apiversion, new.name, new.apiversion))
+    print("  VUIDs defined: %d -> %d" % (len(old.spec), len(new.spec)))
+    print("  VUIDs checked: %d -> %d" % (len(old.checked), len(new.checked)))
+    print("  VUIDs tested:  %d -> %d" % (len(old.tested), len(new.tested)))
+    old_undef = old.undefined_vuids()
+    new_undef = new.undefined_vuids()
+    sections = [
+        ("VUIDs added to validusage.json", new.spec - old.spec),
+        ("VUIDs removed from validusage.json", old.spec - new.spec),
+        ("VUIDs newly checked in layer code", new.checked - old.checked),
+        ("VUIDs no longer checked in layer code", old.checked - new.checked),
+        ("VUIDs newly tested in layer tests", new.tested - old.tested),
+        ("VUIDs no longer tested in layer tests", old.tested - new.tested),
+        ("VUIDs newly undefined in validusage.json", new_undef - old_undef),
+        ("VUIDs no longer undefined in validusage.json", old_undef - new_undef),
+    ]
+    changed = False
+    for title, vuids in sections:
+        if len(vuids) > 0:
+            changed = True
+            print("\n%s (%d):" % (title, len(vuids)))
+            for vuid in sorted(vuids):
+                print("    %s" % vuid)
+    if not changed:
+        print("\n  No coverage changes.")
+
+# Report the tests impacted by changes since a git revision: tests exercising VUIDs checked near changed lines of
+# layer source, and tests whose own source changed
+def report_change_impact(revision, val_source, val_tests):
+    prefix = git_prefix(revision)
+    changes = git_changed_lines(revision)
+    checks = defaultdict(list)      # Map source path within the work tree to (line, vuid) of each check
+    for vuid, count_dict in val_source.vuid_count_dict.items():
+        for file_line in count_dict['file_line']:
+            filename, line_num = file_line.rsplit(',', 1)
+            checks[git_path(prefix, filename)].append((int(line_num), vuid))
+    test_ranges = defaultdict(list) # Map test path within the work tree to (first, last, testname) of each test
+    for testname, (filename, first_line, last_line) in val_tests.test_locations.items():
+        test_ranges[git_path(prefix, filename)].append((first_line, last_line, testname))
+    scanned = set(git_path(prefix, filename) for filename in val_source.source_files + val_tests.test_files)
+    # The scan cache is written by this script, so changes to it (if it is kept in the work tree) affect no tests
+    for filename in [cache_filename, cache_filename + '.tmp']:
+        changes.pop(git_path(prefix, filename), None)
+
+    impacted_vuids = set()
+    impacted_tests = set()
+    unmapped = []   # Changes which cannot be attributed to particular tests
+    for path, ranges in sorted(changes.items()):
+        if path not in scanned:
+            unmapped.append(path)
+            continue
+        for first, last in ranges:
+            for line_num, vuid in checks[path]:
+                if first - impact_context <= line_num <= last + impact_context:
+                    impacted_vuids.add(vuid)
+            if path in test_ranges:
+                in_test = False
+                for first_line, last_line, testname in test_ranges[path]:
+                    if last >= first_line and (last_line is None or first <= last_line):
+                        impacted_tests.add(testname)
+                        in_test = True
+                if not in_test:
+                    unmapped.append('%s,%d-%d' % (path, first, last))
+    for vuid in impacted_vuids:
+        if vuid in val_tests.vuid_to_tests:
+            impacted_tests |= val_tests.vuid_to_tests[vuid]
+
+    print("\nChange impact since %s: %d files changed, %d VUID checks and %d tests affected" %
+          (revision, len(changes), len(impacted_vuids), len(impacted_tests)))
+    if len(unmapped) > 0:
+        print("\nChanges not attributable to particular tests, consider running all tests (%d):" % len(unmapped))
+        for change in unmapped:
+            print("    %s" % change)
+    if verbose_mode and len(impacted_vuids) > 0:
+        print("\nVUID checks affected (%d):" % len(impacted_vuids))
+        for vuid in sorted(impacted_vuids):
+            print("    %s" % vuid)
+    if len(impacted_tests) > 0:
+        print("\n%s" % val_tests.gtest_filter(sorted(impacted_tests)))
+
+# Class to answer queries against the loaded databases, for the -vuid/-todo reports and the -query/-server modes
+#
+class QueryEngine:
+    def __init__(self, val_json, val_source, val_tests):
+        self.vj = val_json
+        self.vs = val_source
+        self.vt = val_tests
+        self.commands = {
+            'status' : (self.vuid_status, '<vuid>', 'implementation and test status of a VUID'),
+            'where'  : (self.vuid_locations, '<vuid>', 'file,line locations where a VUID is checked'),
+            'tests'  : (self.vuid_tests, '<vuid>', 'tests which exercise a VUID'),
+            'covers' : (self.test_vuids, '<test>', 'VUIDs exercised by a test'),
+            'mincover' : (self.minimal_tests, '<vuid>...', 'a minimal set of tests exercising all of the given VUIDs'),
+            'todo'   : (self.unimplemented, '[<api|ext>]', 'unimplemented explicit VUIDs, optionally for one API/struct or extension'),
+            'help'   : (self.help, '', 'list commands'),
+        }
+
+    # Answer a single query line, returning a list of output lines
+    def answer(self, query):
+        words = query.split()
+        if len(words) == 0:
+            return []
+        if words[0] not in self.commands:
+            return ["Unrecognized query: %s (try 'help')" % words[0]]
+        function, args, description = self.commands[words[0]]
+        required_args = len([arg for arg in args.split() if not arg.startswith('[')])
+        max_args = len(words) if args.endswith('...') else len(args.split())
+        if not required_args <= len(words) - 1 <= max_args:
+            return ["Usage: %s %s" % (words[0], args)]
+        return function(*words[1:])
+
+    def help(self):
+        lines = ['Queries:']
+        for name, (function, args, description) in sorted(self.commands.items()):
+            lines.append('  %-8s %-13s %s' % (name, args, description))
+        lines.append('  quit')
+        return lines
+
+    def vuid_status(self, vuid):
+        lines = ["Checking status of <%s>" % vuid]
+        if vuid not in self.vj.all_vuids:
+            lines.append('  Not a valid VUID string.')
+            return lines
+        if vuid in self.vs.explicit_vuids:
+            lines.append('  Implemented!')
+            lines.extend(['    => %s' % line for line in self.vs.vuid_count_dict[vuid]['file_line']])
+        elif vuid in self.vs.implicit_vuids:
+            lines.append('  Implemented! (Implicit)')
+            lines.extend(['    => %s' % line for line in self.vs.vuid_count_dict[vuid]['file_line']])
+        else:
+            lines.append('  Not implemented.')
+        if vuid in self.vt.all_vuids:
+            lines.append('  Has a test!')
+            lines.extend(['    => %s' % test for test in self.vt.vuid_to_tests[vuid]])
+        else:
+            lines.append('  Not tested.')
+        return lines
+
+    def vuid_locations(self, vuid):
+        if vuid not in self.vs.vuid_count_dict:
+            return ['  Not checked in layer code.']
+        return ['  %s' % line for line in self.vs.vuid_count_dict[vuid]['file_line']]
+
+    def vuid_tests(self, vuid):
+        if vuid not in self.vt.vuid_to_tests:
+            return ['  Not tested.']
+        return ['  %s' % test for test in sorted(self.vt.vuid_to_tests[vuid])]
+
+    def test_vuids(self, test):
+        if test not in self.vt.test_to_vuids:
+            return ['  No VUIDs exercised.']
+        return ['  %s' % vuid for vuid in sorted(self.vt.test_to_vuids[test])]
+
+    def minimal_tests(self, *vuids):
+        vuids = set(vuids)
+        tests, untested = self.vt.minimal_test_set(vuids)
+        lines = ["%d tests exercise %d of %d VUIDs:" % (len(tests), len(vuids) - len(untested), len(vuids))]
+        lines.extend(["  %s" % test for test in tests])
+        if len(untested) > 0:
+            lines.append("%d VUIDs are not tested:" % len(untested))
+            lines.extend(["  %s" % vuid for vuid in sorted(untested)])
+        if len(tests) > 0:
+            lines.append(self.vt.gtest_filter(tests))
+        return lines
+
+    def unimplemented(self, api_or_ext=None):
+        unim_explicit = self.vj.explicit_vuids - self.vs.explicit_vuids
+        if api_or_ext is not None:
+            unim_explicit = set({v for v in unim_explicit
+                                 if any(api_or_ext in (entry.api, entry.ext) for entry in self.vj.vuid_db[v])})
+        lines = ["%d explicit VUID checks remain unimplemented:" % len(unim_explicit)]
+        lines.extend(["  => %s" % vuid for vuid in sorted(unim_explicit)])
+        return lines
+
+    # Answer queries line by line from a text stream until it ends or a 'quit' query is read. Each answer
+    # is followed by an empty line so that clients can tell where it ends.
+    def serve_stream(self, query_stream, answer_stream, prompt=''):
+        while True:
+            answer_stream.write(prompt)
+            answer_stream.flush()
+            query = query_stream.readline()
+            if query == '' or query.strip() in ['quit', 'exit']:
+                break
+            for line in self.answer(query):
+                answer_stream.write(line + '\n')
+            answer_stream.write('\n')
+            answer_stream.flush()
+
+    # Answer queries from clients connecting to a socket on localhost, until interrupted
+    def serve_socket(self, port):
+        engine = self
+        class QueryHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                queries = (line.decode('utf-8', 'replace') for line in self.rfile)
+                for query in queries:
+                    if query.strip() in ['quit', 'exit']:
+                        break
+                    answer = ''.join(line + '\n' for line in engine.answer(query)) + '\n'
+                    self.wfile.write(answer.encode('utf-8'))
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        with socketserver.ThreadingTCPServer(('127.0.0.1', port), QueryHandler) as server:
+            print("\nAnswering queries on 127.0.0.1:%d (interrupt to stop)" % port)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+
 # Class to output database in various flavors
 #
 class OutputDatabase:
@@ -506,101 +1104,208 @@ extern std::unordered_map<std::string, std::string> vuid_to_error_text_map;
 #endif"""
         self.spec_url = "https://www.khronos.org/registry/vulkan/specs/1.1-extensions/html/vkspec.html"
     
-    def dump_txt(self):
-        print("\n Dumping database to text file: %s" % txt_filename)
-        with open (txt_filename, 'w') as txt:
-            txt.write("## VUID Database\n")
-            txt.write("## Format: VUID_NAME | CHECKED | TEST | TYPE | API/STRUCT | EXTENSION | VUID_TEXT\n##\n") 
-            vuid_list = list(self.vj.all_vuids)
-            vuid_list.sort()
-            for vuid in vuid_list:
-                db_list = self.vj.vuid_db[vuid]
-                db_list.sort(key=operator.itemgetter('ext')) # sort list to ease diffs of output file
-                for db_entry in db_list:
-                    checked = 'N'
-                    if vuid in self.vs.all_vuids:
-                        checked = 'Y'
-                    test = 'None'
-                    if vuid in self.vt.vuid_to_tests:
-                        test_list = list(self.vt.vuid_to_tests[vuid])
-                        test_list.sort()   # sort tests, for diff-ability
-                        sep = ', '
-                        test = sep.join(test_list)
-
-                    txt.write("%s | %s | %s | %s | %s | %s | %s\n" % (vuid, checked, test, db_entry['type'], db_entry['api'], db_entry['ext'], db_entry['text']))
-
-    def dump_csv(self):
-        print("\n Dumping database to csv file: %s" % csv_filename)
-        with open (csv_filename, 'w', newline='') as csvfile:
-            cw = csv.writer(csvfile)
-            cw.writerow(['VUID_NAME','CHECKED','TEST','TYPE','API/STRUCT','EXTENSION','VUID_TEXT']) 
-            vuid_list = list(self.vj.all_vuids)
-            vuid_list.sort()
-            for vuid in vuid_list:
-                for db_entry in self.vj.vuid_db[vuid]:
-                    row = [vuid]
-                    if vuid in self.vs.all_vuids:
-                        row.append('Y')
-                    else:
-                        row.append('N')
-                    test = 'None'
-                    if vuid in self.vt.vuid_to_tests:
-                        sep = ', '
-                        test = sep.join(self.vt.vuid_to_tests[vuid])
-                    row.append(test)
-                    row.append(db_entry['type'])
-                    row.append(db_entry['api'])
-                    row.append(db_entry['ext'])
-                    row.append(db_entry['text'])
-                    cw.writerow(row)
-
-    def dump_html(self):
-        print("\n Dumping database to html file: %s" % html_filename)
+    # Produce the database rows once: one VuidRow per VUID, in sorted VUID order, with its entries sorted by
+    # extension and its tests sorted by name (to ease diffs of output files)
+    def rows(self):
+        for vuid in self.vj.vuid_names:
+            checked = vuid in self.vs.all_vuids
+            file_line = []
+            if vuid in self.vs.vuid_count_dict:
+                file_line = self.vs.vuid_count_dict[vuid]['file_line']
+            tests = []
+            test = 'None'
+            if vuid in self.vt.vuid_to_tests:
+                tests = sorted(self.vt.vuid_to_tests[vuid])
+                test = ', '.join(tests)
+            entries = sorted(self.vj.vuid_db[vuid], key=operator.attrgetter('ext'))
+            yield VuidRow(vuid, checked, file_line, tests, test, entries)
+
+    # Write the database to each of the given writers with a single traversal of the rows
+    def dump(self, writers):
+        for writer in writers:
+            writer.begin()
+        for row in self.rows():
+            for writer in writers:
+                writer.write_row(row)
+        for writer in writers:
+            writer.end()
+
+# One VUID of the output database, with everything the writers need
+class VuidRow:
+    __slots__ = ('vuid', 'checked', 'file_line', 'tests', 'test', 'entries')
+
+    def __init__(self, vuid, checked, file_line, tests, test, entries):
+        self.vuid = vuid
+        self.checked = checked
+        self.file_line = file_line  # List of 'file,line' locations where the VUID is checked
+        self.tests = tests          # Sorted list of test names
+        self.test = test            # Test names joined for display, or 'None'
+        self.entries = entries
+
+# Base class for streaming database writers. Output is buffered, and written one row at a time.
+class DatabaseWriter:
+    buffer_size = 1 << 16
+
+    def __init__(self, description, filename, newline=None):
+        self.description = description
+        self.filename = filename
+        self.newline = newline
+        self.out = None
+
+    def begin(self):
+        print("\n Dumping database to %s: %s" % (self.description, self.filename))
+        self.out = open(self.filename, 'w', buffering=self.buffer_size, newline=self.newline)
+
+    def write_row(self, row):
+        pass
+
+    def end(self):
+        self.out.close()
+
+class TextDatabaseWriter(DatabaseWriter):
+    def __init__(self, filename):
+        DatabaseWriter.__init__(self, 'text file', filename)
+
+    def begin(self):
+        DatabaseWriter.begin(self)
+        self.out.write("## VUID Database\n")
+        self.out.write("## Format: VUID_NAME | CHECKED | TEST | TYPE | API/STRUCT | EXTENSION | VUID_TEXT\n##\n")
+
+    def write_row(self, row):
+        checked = 'Y' if row.checked else 'N'
+        for db_entry in row.entries:
+            self.out.write("%s | %s | %s | %s | %s | %s | %s\n" % (row.vuid, checked, row.test, db_entry.type, db_entry.api, db_entry.ext, db_entry.text))
+
+class CsvDatabaseWriter(DatabaseWriter):
+    def __init__(self, filename):
+        DatabaseWriter.__init__(self, 'csv file', filename, newline='')
+
+    def begin(self):
+        DatabaseWriter.begin(self)
+        self.cw = csv.writer(self.out)
+        self.cw.writerow(['VUID_NAME','CHECKED','TEST','TYPE','API/STRUCT','EXTENSION','VUID_TEXT'])
+
+    def write_row(self, row):
+        checked = 'Y' if row.checked else 'N'
+        for db_entry in row.entries:
+            self.cw.writerow([row.vuid, checked, row.test, db_entry.type, db_entry.api, db_entry.ext, db_entry.text])
+
+class HtmlDatabaseWriter(DatabaseWriter):
+    def __init__(self, filename):
+        DatabaseWriter.__init__(self, 'html file', filename)
+
+    def begin(self):
+        DatabaseWriter.begin(self)
         preamble = '<!DOCTYPE html>\n<html>\n<head>\n<style>\ntable, th, td {\n border: 1px solid black;\n border-collapse: collapse; \n}\n</style>\n<body>\n<h2>Valid Usage Database</h2>\n<font size="2" face="Arial">\n<table style="width:100%">\n'
-        headers = '<tr><th>VUID NAME</th><th>CHECKED</th><th>TEST</th><th>TYPE</th><th>API/STRUCT</th><th>EXTENSION</th><th>VUID TEXT</th></tr>\n' 
-        with open (html_filename, 'w') as hfile:
-            hfile.write(preamble)
-            hfile.write(headers)
-            vuid_list = list(self.vj.all_vuids)
-            vuid_list.sort()
-            for vuid in vuid_list:
-                for db_entry in self.vj.vuid_db[vuid]:
-                    hfile.write('<tr><th>%s</th>' % vuid)
-                    checked = '<span style="color:red;">N</span>'
-                    if vuid in self.vs.all_vuids:
-                        checked = '<span style="color:limegreen;">Y</span>'
-                    hfile.write('<th>%s</th>' % checked)
-                    test = 'None'
-                    if vuid in self.vt.vuid_to_tests:
-                        sep = ', '
-                        test = sep.join(self.vt.vuid_to_tests[vuid])
-                    hfile.write('<th>%s</th>' % test)
-                    hfile.write('<th>%s</th>' % db_entry['type'])
-                    hfile.write('<th>%s</th>' % db_entry['api'])
-                    hfile.write('<th>%s</th>' % db_entry['ext'])
-                    hfile.write('<th>%s</th></tr>\n' % db_entry['text'])
-            hfile.write('</table>\n</body>\n</html>\n')
-
-    def export_header(self):
-        print("\n Exporting header file to: %s" % header_filename)
-        with open (header_filename, 'w') as hfile:
-            hfile.write(self.header_preamble)
-            vuid_list = list(self.vj.all_vuids)
-            vuid_list.sort()
-            for vuid in vuid_list:
-                db_entry = self.vj.vuid_db[vuid][0]
-                hfile.write('    {"%s", "%s (%s#%s)"},\n' % (vuid, db_entry['text'].strip(' '), self.spec_url, vuid))
-                # For multiply-defined VUIDs, include versions with extension appended
-                if len(self.vj.vuid_db[vuid]) > 1:
-                    for db_entry in self.vj.vuid_db[vuid]:
-                        hfile.write('    {"%s[%s]", "%s (%s#%s)"},\n' % (vuid, db_entry['ext'].strip(' '), db_entry['text'].strip(' '), self.spec_url, vuid))
-            hfile.write(self.header_postamble)
+        headers = '<tr><th>VUID NAME</th><th>CHECKED</th><th>TEST</th><th>TYPE</th><th>API/STRUCT</th><th>EXTENSION</th><th>VUID TEXT</th></tr>\n'
+        self.out.write(preamble)
+        self.out.write(headers)
+
+    def write_row(self, row):
+        checked = '<span style="color:red;">N</span>'
+        if row.checked:
+            checked = '<span style="color:limegreen;">Y</span>'
+        for db_entry in row.entries:
+            self.out.write('<tr><th>%s</th><th>%s</th><th>%s</th><th>%s</th><th>%s</th><th>%s</th><th>%s</th></tr>\n' %
+                           (row.vuid, checked, row.test, db_entry.type, db_entry.api, db_entry.ext, db_entry.text))
+
+    def end(self):
+        self.out.write('</table>\n</body>\n</html>\n')
+        DatabaseWriter.end(self)
+
+# Writes one json object per entry, streamed as the elements of a single array
+class JsonDatabaseWriter(DatabaseWriter):
+    def __init__(self, filename, apiversion):
+        DatabaseWriter.__init__(self, 'json file', filename)
+        self.apiversion = apiversion
+
+    def begin(self):
+        DatabaseWriter.begin(self)
+        self.out.write('{"api version": %s,\n "vuids": [' % json.dumps(self.apiversion))
+        self.separator = '\n'
+
+    def write_row(self, row):
+        for db_entry in row.entries:
+            self.out.write(self.separator)
+            json.dump({'vuid': row.vuid, 'checked': row.checked, 'file_line': row.file_line, 'tests': row.tests,
+                       'type': db_entry.type, 'api': db_entry.api, 'ext': db_entry.ext, 'text': db_entry.text}, self.out)
+            self.separator = ',\n'
+
+    def end(self):
+        self.out.write('\n]}\n')
+        DatabaseWriter.end(self)
+
+# Writes an sqlite database with one row per entry, indexed by VUID, API/struct and extension. The file_line
+# and tests columns hold json arrays.
+class SqliteDatabaseWriter(DatabaseWriter):
+    def __init__(self, filename, apiversion):
+        DatabaseWriter.__init__(self, 'sqlite database', filename)
+        self.apiversion = apiversion
+
+    def begin(self):
+        print("\n Dumping database to %s: %s" % (self.description, self.filename))
+        # Build into a temporary file, so readers never see a partially written database
+        self.temp_filename = self.filename + '.tmp'
+        if os.path.exists(self.temp_filename):
+            os.remove(self.temp_filename)
+        self.db = sqlite3.connect(self.temp_filename)
+        self.db.execute('CREATE TABLE info (key TEXT PRIMARY KEY, value TEXT)')
+        self.db.execute('INSERT INTO info VALUES (?, ?)', ('api version', self.apiversion))
+        self.db.execute('CREATE TABLE vuids (vuid TEXT NOT NULL, checked INTEGER NOT NULL, file_line TEXT, tests TEXT,'
+                        ' type TEXT, api TEXT, ext TEXT, text TEXT)')
+
+    def write_row(self, row):
+        file_line = json.dumps(row.file_line)
+        tests = json.dumps(row.tests)
+        self.db.executemany('INSERT INTO vuids VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                            [(row.vuid, int(row.checked), file_line, tests, db_entry.type, db_entry.api, db_entry.ext, db_entry.text)
+                             for db_entry in row.entries])
+
+    def end(self):
+        # Indexes are created after the bulk insert, which is much faster than maintaining them row by row
+        self.db.execute('CREATE INDEX vuids_vuid ON vuids (vuid)')
+        self.db.execute('CREATE INDEX vuids_api ON vuids (api)')
+        self.db.execute('CREATE INDEX vuids_ext ON vuids (ext)')
+        self.db.commit()
+        self.db.close()
+        os.replace(self.temp_filename, self.filename)
+
+# Writes the VUID error text header
+class HeaderDatabaseWriter(DatabaseWriter):
+    def __init__(self, filename, preamble, postamble, spec_url):
+        DatabaseWriter.__init__(self, 'header file', filename)
+        self.preamble = preamble
+        self.postamble = postamble
+        self.spec_url = spec_url
+
+    def begin(self):
+        print("\n Exporting header file to: %s" % self.filename)
+        self.out = open(self.filename, 'w', buffering=self.buffer_size)
+        self.out.write(self.preamble)
+
+    def write_row(self, row):
+        self.out.write('    {"%s", "%s (%s#%s)"},\n' % (row.vuid, row.entries[0].text.strip(' '), self.spec_url, row.vuid))
+        # For multiply-defined VUIDs, include versions with extension appended
+        if len(row.entries) > 1:
+            for db_entry in row.entries:
+                self.out.write('    {"%s[%s]", "%s (%s#%s)"},\n' % (row.vuid, db_entry.ext.strip(' '), db_entry.text.strip(' '), self.spec_url, row.vuid))
+
+    def end(self):
+        self.out.write(self.postamble)
+        DatabaseWriter.end(self)
 
 def main(argv):
     global verbose_mode
     global txt_filename
     global csv_filename
     global html_filename
+    global json_db_filename
+    global sqlite_filename
+    global use_cache
+    global cache_filename
+    global snapshot_filename
+    global test_index_filename
+    global query_port
 
     run_consistency = False
     report_unimplemented = False
@@ -608,7 +1313,16 @@ def main(argv):
     txt_out = False
     csv_out = False
     html_out = False
+    json_out = False
+    sqlite_out = False
     header_out = False
+    snapshot_out = False
+    diff_sides = []
+    test_index_out = False
+    mincover_filename = ''
+    impact_revision = ''
+    query_mode = False
+    server_mode = False
     
     if (1 > len(argv)):
         printHelp()
@@ -645,8 +1359,61 @@ def main(argv):
             if i < len(argv) and not argv[i].startswith('-'):
                 html_filename = argv[i]
                 i = i + 1
+        elif (arg == '-json'):
+            json_out = True
+            # Set filename if supplied, else use default
+            if i < len(argv) and not argv[i].startswith('-'):
+                json_db_filename = argv[i]
+                i = i + 1
+        elif (arg == '-sqlite'):
+            sqlite_out = True
+            # Set filename if supplied, else use default
+            if i < len(argv) and not argv[i].startswith('-'):
+                sqlite_filename = argv[i]
+                i = i + 1
         elif (arg == '-export_header'):
             header_out = True
+        elif (arg == '-cache'):
+            cache_filename = argv[i]
+            i = i + 1
+        elif (arg == '-no_cache'):
+            use_cache = False
+        elif (arg == '-snapshot'):
+            snapshot_out = True
+            # Set filename if supplied, else use default
+            if i < len(argv) and not argv[i].startswith('-'):
+                snapshot_filename = argv[i]
+                i = i + 1
+        elif (arg == '-diff'):
+            diff_sides = [argv[i]]
+            i = i + 1
+            # Set new side if supplied, else compare against the current source
+            if i < len(argv) and not argv[i].startswith('-'):
+                diff_sides.append(argv[i])
+                i = i + 1
+        elif (arg == '-test_index'):
+            test_index_out = True
+            # Set filename if supplied, else use default
+            if i < len(argv) and not argv[i].startswith('-'):
+                test_index_filename = argv[i]
+                i = i + 1
+        elif (arg == '-mincover'):
+            mincover_filename = argv[i]
+            i = i + 1
+        elif (arg == '-impact'):
+            impact_revision = 'HEAD'
+            # Set revision if supplied, else use HEAD
+            if i < len(argv) and not argv[i].startswith('-'):
+                impact_revision = argv[i]
+                i = i + 1
+        elif (arg == '-query'):
+            query_mode = True
+        elif (arg == '-server'):
+            server_mode = True
+            # Set port if supplied, else use default
+            if i < len(argv) and argv[i].isdecimal():
+                query_port = int(argv[i])
+                i = i + 1
         elif (arg in ['-verbose']):
             verbose_mode = True
         elif (arg in ['-help', '-h']):
@@ -659,8 +1426,12 @@ def main(argv):
 
     result = 0 # Non-zero result indicates an error case
 
+    scan_cache = None
+    if use_cache:
+        scan_cache = ScanCache(cache_filename)
+
     # Parse validusage json
-    val_json = ValidationJSON(json_filename)
+    val_json = ValidationJSON(json_filename, scan_cache)
     val_json.read()
     exp_json = len(val_json.explicit_vuids)
     imp_json = len(val_json.implicit_vuids)
@@ -674,10 +1445,10 @@ def main(argv):
             for vuid in val_json.duplicate_vuids:
                 print("  %s" % vuid)
                 for ext in val_json.vuid_db[vuid]:
-                    print("    with extension: %s" % ext['ext'])
+                    print("    with extension: %s" % ext.ext)
 
     # Parse layer source files
-    val_source = ValidationSource(layer_source_files, generated_layer_source_files, generated_layer_source_directories)
+    val_source = ValidationSource(layer_source_files, generated_layer_source_files, generated_layer_source_directories, scan_cache)
     val_source.parse()
     exp_checks = len(val_source.explicit_vuids)
     imp_checks = len(val_source.implicit_vuids)
@@ -690,7 +1461,7 @@ def main(argv):
         print("  %d checks are implemented more that once" % val_source.duplicated_checks)
 
     # Parse test files
-    val_tests = ValidationTests([test_file, ])
+    val_tests = ValidationTests([test_file, ], scan_cache)
     val_tests.parse()
     exp_tests = len(val_tests.explicit_vuids)
     imp_tests = len(val_tests.implicit_vuids)
@@ -717,40 +1488,51 @@ def main(argv):
     print("  Implicit VUIDs tested: %.1f%% (%d tested vs %d checks)" % ((100.0 * imp_tests / imp_checks), imp_tests, imp_checks))
     print("  Overall VUIDs tested:  %.1f%% (%d tested vs %d checks)" % ((100.0 * all_tests / all_checks), all_tests, all_checks))
 
+    # Save and compare coverage snapshots. Git revisions are scanned through the scan cache, so only files that
+    # differ from those already cached are actually scanned.
+    current_snapshot = CoverageSnapshot.from_databases('current source', val_json, val_source, val_tests)
+    if snapshot_out:
+        current_snapshot.save(snapshot_filename)
+    if len(diff_sides) > 0:
+        snapshots = []
+        for side in diff_sides:
+            if side.startswith('git:'):
+                revision = side[len('git:'):]
+                rev_source = ValidationSource(layer_source_files, generated_layer_source_files, generated_layer_source_directories, scan_cache, revision)
+                rev_source.parse()
+                rev_tests = ValidationTests([test_file, ], scan_cache, revision)
+                rev_tests.parse()
+                snapshots.append(CoverageSnapshot.from_databases(side, val_json, rev_source, rev_tests))
+            else:
+                snapshots.append(CoverageSnapshot.load(side))
+        if len(snapshots) == 1:
+            snapshots.append(current_snapshot)
+        report_coverage_diff(snapshots[0], snapshots[1])
+    if scan_cache is not None:
+        scan_cache.save()
+
+    query_engine = QueryEngine(val_json, val_source, val_tests)
+
     # Report status of a single VUID
     if len(get_vuid_status) > 1:
-        print("\n\nChecking status of <%s>" % get_vuid_status);
-        if get_vuid_status not in val_json.all_vuids:
-            print('  Not a valid VUID string.')
-        else:
-            if get_vuid_status in val_source.explicit_vuids:
-                print('  Implemented!')
-                line_list = val_source.vuid_count_dict[get_vuid_status]['file_line']
-                for line in line_list:
-                    print('    => %s' % line)
-            elif get_vuid_status in val_source.implicit_vuids:
-                print('  Implemented! (Implicit)')
-                line_list = val_source.vuid_count_dict[get_vuid_status]['file_line']
-                for line in line_list:
-                    print('    => %s' % line)
-            else:
-                print('  Not implemented.')
-            if get_vuid_status in val_tests.all_vuids:
-                print('  Has a test!')
-                test_list = val_tests.vuid_to_tests[get_vuid_status]
-                for test in test_list:
-                    print('    => %s' % test)
-            else:
-                print('  Not tested.')
+        print("\n")
+        print("\n".join(query_engine.vuid_status(get_vuid_status)))
 
     # Report unimplemented explicit VUIDs
     if report_unimplemented:
-        unim_explicit = val_json.explicit_vuids - val_source.explicit_vuids
-        print("\n\n%d explicit VUID checks remain unimplemented:" % len(unim_explicit))
-        ulist = list(unim_explicit)
-        ulist.sort()
-        for vuid in ulist:
-            print("  => %s" % vuid) 
+        print("\n")
+        print("\n".join(query_engine.unimplemented()))
+
+    # Report a minimal set of tests exercising a list of VUIDs
+    if len(mincover_filename) > 0:
+        with open(mincover_filename, 'r') as vuid_file:
+            mincover_vuids = vuid_file.read().split()
+        print("\n")
+        print("\n".join(query_engine.minimal_tests(*mincover_vuids)))
+
+    # Report tests impacted by source changes
+    if len(impact_revision) > 0:
+        report_change_impact(impact_revision, val_source, val_tests)
 
     # Consistency tests
     if run_consistency:
@@ -765,14 +1547,30 @@ def main(argv):
 
     # Output database in requested format(s)
     db_out = OutputDatabase(val_json, val_source, val_tests)
+    db_writers = []
     if txt_out:
-        db_out.dump_txt()
+        db_writers.append(TextDatabaseWriter(txt_filename))
     if csv_out:
-        db_out.dump_csv()
+        db_writers.append(CsvDatabaseWriter(csv_filename))
     if html_out:
-        db_out.dump_html()
+        db_writers.append(HtmlDatabaseWriter(html_filename))
+    if json_out:
+        db_writers.append(JsonDatabaseWriter(json_db_filename, val_json.apiversion))
+    if sqlite_out:
+        db_writers.append(SqliteDatabaseWriter(sqlite_filename, val_json.apiversion))
     if header_out:
-        db_out.export_header()
+        db_writers.append(HeaderDatabaseWriter(header_filename, db_out.header_preamble, db_out.header_postamble, db_out.spec_url))
+    if len(db_writers) > 0:
+        db_out.dump(db_writers)
+    if test_index_out:
+        val_tests.export_test_index(test_index_filename)
+
+    # Answer queries against the loaded databases
+    if query_mode:
+        prompt = '> ' if sys.stdin.isatty() else ''
+        query_engine.serve_stream(sys.stdin, sys.stdout, prompt)
+    if server_mode:
+        query_engine.serve_socket(query_port)
     return result
 
 if __name__ == "__main__":